@@ -1,22 +1,48 @@
 """
 API RESTful para gerenciamento de FAQs usando Flask.
 Esta API permite integração com o front-end do Luma (repositório externo).
-Mudanças feitas no CRUD refletem automaticamente no front-end via esta API.
+Mudanças feitas no CRUD chegam ao front-end pelo feed GET /faqs/mudancas
+(Server-Sent Events ou long-poll), sem reler as listagens.
 """
 
+import base64
+import binascii
+import functools
+import hashlib
 import logging
 import os
 import sys
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
-from flask import Flask, abort, jsonify, request
+from flask import Flask, abort, g, jsonify, make_response, request
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 
 # Adiciona o diretório pai ao caminho de importação
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from banco import FaqDB
+from autenticacao import EmissorTokens, TokenInvalidoError
+from banco import FaqDB, custos_da_thread, idas_ao_banco
+from busca import IndiceBusca
+from compressao import CompressorRespostas
+from mudancas import RegistroMudancas
+from respostas import CacheRespostas, RespostaGuardada, chave_resposta
+from sugestoes import IndiceSugestoes
+from config.settings import (
+    get_auth_config,
+    get_cache_config,
+    get_cache_respostas_config,
+    get_compressao_config,
+    get_metricas_publicas,
+    get_mudancas_config,
+    get_perfil_config,
+    get_pool_config,
+)
+from metricas import CONTENT_TYPE as CONTENT_TYPE_METRICAS
+from metricas import Metricas, formatar_metrica
 
 # Configurar logging
 # Nível INFO para produção, DEBUG apenas em desenvolvimento
@@ -38,6 +64,9 @@ MAX_PERGUNTA_LEN = 500
 MAX_RESPOSTA_LEN = 2000
 MAX_CATEGORIA_LEN = 100
 ITEMS_PER_PAGE = 10
+MAX_ITEMS_PER_PAGE = 100
+MAX_LOTE = 5000  # Máximo de FAQs por requisição em POST /faqs/lote
+TAMANHO_LOTE = int(os.environ.get('API_TAMANHO_LOTE', 500))  # Linhas por commit
 
 load_dotenv()
 oracle_config = {
@@ -46,9 +75,14 @@ oracle_config = {
     'dsn': os.environ.get('DB_URL'),
 }
 
-# Inicialização do banco de dados
+# Inicialização do banco de dados (pool de sessões, uma por requisição)
 try:
-    db = FaqDB(oracle_config, silent=True)
+    db = FaqDB(
+        oracle_config,
+        silent=True,
+        pool_config=get_pool_config(),
+        cache_config=get_cache_config(),
+    )
 except Exception as e:
     logger.critical(f'Falha na conexão com o banco Oracle. Detalhes: {e}')
     print(
@@ -57,6 +91,193 @@ except Exception as e:
     print(f'Detalhes: {e}')
     sys.exit(1)
 
+# Índice da busca textual: carregado do banco e atualizado pelas escritas do
+# FaqDB. Escritas de outros processos não são vistas até o próximo início.
+indice_busca = IndiceBusca()
+db.espelhar(indice_busca)
+
+# Autocompletar por prefixo de pergunta e categoria, mantido da mesma forma
+indice_sugestoes = IndiceSugestoes()
+db.espelhar(indice_sugestoes)
+
+# Detecção de perguntas parecidas em POST /faqs (requer NumPy; None sem ele)
+detector_duplicatas = db.detector_duplicatas()
+
+# Respostas já serializadas dos GETs (ver em_cache), esvaziado a cada escrita
+RESPOSTAS = get_cache_respostas_config()
+cache_respostas = None
+if RESPOSTAS['max_entradas']:
+    cache_respostas = CacheRespostas(RESPOSTAS['max_entradas'], RESPOSTAS['ttl'])
+    db.ao_alterar(lambda tipo, ids: cache_respostas.limpar())
+
+# Feed de mudanças (GET /faqs/mudancas), alimentado pelas escritas deste
+# processo. Escritas de outros processos não aparecem no feed.
+MUDANCAS = get_mudancas_config()
+registro_mudancas = RegistroMudancas(MUDANCAS['max_entradas'], MUDANCAS['max_clientes'])
+registro_mudancas.acompanhar(db)
+
+# Sessões de admin: o login vai ao banco uma vez; as escritas conferem só o
+# token (ver exige_admin)
+AUTH = get_auth_config()
+if AUTH['segredo'] is None:
+    logger.warning('AUTH_SEGREDO não definido: tokens valem só para este processo')
+emissor_tokens = EmissorTokens(AUTH['segredo'], AUTH['ttl'])
+
+# Métricas por rota expostas em GET /metrics (com token de admin, salvo com
+# METRICAS_PUBLICAS=1)
+metricas = Metricas()
+METRICAS_PUBLICAS = get_metricas_publicas()
+
+
+@app.before_request
+def iniciar_metricas():
+    """Marca o início da requisição para as métricas."""
+    g.inicio_requisicao = time.perf_counter()
+    g.idas_iniciais = idas_ao_banco()
+    metricas.iniciar()
+
+
+@app.after_request
+def registrar_metricas(resposta):
+    """Registra status, duração e idas ao banco da requisição, pela rota."""
+    if 'inicio_requisicao' in g:
+        rota = request.url_rule.rule if request.url_rule else '<sem rota>'
+        metricas.registrar(
+            request.method,
+            rota,
+            resposta.status_code,
+            time.perf_counter() - g.inicio_requisicao,
+            idas_ao_banco() - g.idas_iniciais,
+        )
+    return resposta
+
+
+@app.teardown_request
+def concluir_metricas(exc):
+    """Encerra a requisição nas métricas (também quando há exceção)."""
+    if 'inicio_requisicao' in g:
+        metricas.concluir()
+
+
+# Perfil opcional das requisições (PERFIL_ATIVO=1): cProfile e Server-Timing.
+# Desligado, nenhum gancho é registrado.
+PERFIL = get_perfil_config()
+perfil_requisicoes = None
+if PERFIL['ativo']:
+    from perfil import (
+        PerfilRequisicoes,
+        ProvedorJSONMedido,
+        server_timing,
+        somar_serializacao,
+        tempo_serializacao,
+    )
+
+    perfil_requisicoes = PerfilRequisicoes(
+        PERFIL['diretorio'],
+        PERFIL['amostragem'],
+        max_arquivos=PERFIL['max_arquivos'],
+        max_bytes=PERFIL['max_bytes'],
+    )
+    app.json = ProvedorJSONMedido(app)
+
+    @app.before_request
+    def iniciar_perfil():
+        """
+        Começa a medir a requisição, se escolhida: cabeçalho X-Perfil de um
+        admin (token conferido como em exige_admin) ou amostragem.
+        """
+        pedido = request.headers.get(perfil_requisicoes.cabecalho) == '1'
+        if perfil_requisicoes.selecionar(
+            request.headers, pedido and admin_autorizado()
+        ):
+            g.perfil = {
+                'inicio': time.perf_counter(),
+                'custos': custos_da_thread(),
+                'serializacao': tempo_serializacao(),
+                'cprofile': perfil_requisicoes.iniciar(),
+            }
+
+    @app.after_request
+    def finalizar_perfil(resposta):
+        """Salva o cProfile e informa o tempo por etapa em Server-Timing."""
+        medicao = g.pop('perfil', None)
+        if medicao is None:
+            return resposta
+        duracao = time.perf_counter() - medicao['inicio']
+        if medicao['cprofile'] is not None:
+            perfil_requisicoes.parar(medicao['cprofile'])
+            rota = request.url_rule.rule if request.url_rule else 'sem_rota'
+            # O nome do arquivo fica no log do servidor, não na resposta
+            nome = perfil_requisicoes.salvar(
+                medicao['cprofile'], request.method, rota, duracao
+            )
+            logger.info(f'Perfil salvo em {nome}')
+        custos = custos_da_thread()
+        resposta.headers['Server-Timing'] = server_timing(
+            {
+                'db': custos['banco'] - medicao['custos']['banco'],
+                'modelos': custos['modelos'] - medicao['custos']['modelos'],
+                'serializacao': tempo_serializacao() - medicao['serializacao'],
+                'total': duracao,
+            }
+        )
+        return resposta
+
+    @app.teardown_request
+    def descartar_perfil(exc):
+        """Desliga o cProfile se a requisição terminou sem passar por after_request."""
+        medicao = g.pop('perfil', None)
+        if medicao is not None and medicao['cprofile'] is not None:
+            perfil_requisicoes.parar(medicao['cprofile'])
+
+
+@app.before_request
+def abrir_sessao_banco():
+    """Abre a sessão de banco da requisição (checkout sob demanda no pool)."""
+    db.abrir_sessao()
+
+
+@app.teardown_appcontext
+def encerrar_sessao_banco(exc):
+    """Devolve ao pool a conexão usada pela requisição, se houver."""
+    db.encerrar_sessao()
+
+
+# Compressão das respostas (gzip; br com o pacote brotli) conforme o
+# Accept-Encoding. Corpos com ETag são comprimidos uma vez por codificação.
+COMPRESSAO = get_compressao_config()
+compressor = None
+if COMPRESSAO['ativa']:
+    compressor = CompressorRespostas(
+        COMPRESSAO['min_bytes'],
+        COMPRESSAO['nivel_gzip'],
+        COMPRESSAO['nivel_brotli'],
+        COMPRESSAO['max_entradas'],
+    )
+
+    @app.after_request
+    def comprimir_resposta(resposta):
+        """Comprime respostas 200 de texto a partir de min_bytes, se aceito."""
+        if (
+            resposta.status_code != 200
+            or resposta.is_streamed
+            or 'Content-Encoding' in resposta.headers
+        ):
+            return resposta
+        corpo = resposta.get_data()
+        if not compressor.comprimivel(resposta.mimetype, len(corpo)):
+            return resposta
+        # O corpo enviado depende do Accept-Encoding (caches intermediários)
+        resposta.vary.add('Accept-Encoding')
+        codificacao = compressor.escolher(request.accept_encodings)
+        if codificacao is None:
+            return resposta
+        resposta.set_data(
+            compressor.comprimir(corpo, codificacao, resposta.get_etag()[0])
+        )
+        resposta.headers['Content-Encoding'] = codificacao
+        return resposta
+
 
 @app.errorhandler(400)
 def bad_request(error):
@@ -74,6 +295,70 @@ def server_error(error):
     return jsonify({'erro': 'Erro interno do servidor'}), 500
 
 
+def nao_autorizado(mensagem):
+    resposta = jsonify({'erro': mensagem})
+    resposta.headers['WWW-Authenticate'] = 'Bearer'
+    return resposta, 401
+
+
+def token_da_requisicao():
+    """Token do cabeçalho Authorization: Bearer <token>, ou None."""
+    tipo, _, token = request.headers.get('Authorization', '').partition(' ')
+    token = token.strip()
+    return token if tipo.lower() == 'bearer' and token else None
+
+
+def admin_autorizado():
+    """Se a requisição passaria por exige_admin (sem guardar as claims)."""
+    token = token_da_requisicao()
+    if token is None:
+        return not AUTH['obrigatoria']
+    try:
+        emissor_tokens.verificar(token)
+    except TokenInvalidoError:
+        return False
+    return True
+
+
+def exige_admin(view):
+    """
+    Exige um token de admin válido e guarda suas claims em g.admin. Confere
+    só a assinatura, a validade e os revogados, sem consultar o banco. Com
+    AUTH_OBRIGATORIA=0, requisições sem token passam com g.admin = None.
+    """
+
+    @functools.wraps(view)
+    def conferir(**parametros):
+        g.admin = None
+        token = token_da_requisicao()
+        if token is None:
+            if AUTH['obrigatoria']:
+                return nao_autorizado('Token de admin não informado')
+        else:
+            try:
+                g.admin = emissor_tokens.verificar(token)
+            except TokenInvalidoError as erro:
+                return nao_autorizado(str(erro))
+        return view(**parametros)
+
+    return conferir
+
+
+def exige_admin_exceto(publica):
+    """exige_admin, a menos que a configuração (`publica`) libere a rota."""
+    return (lambda view: view) if publica else exige_admin
+
+
+def usuario_da_requisicao(data):
+    """
+    Usuário gravado nas escritas: o do token. Sem token (AUTH_OBRIGATORIA=0),
+    o 'user_account_id_user' do corpo ou o admin padrão.
+    """
+    if g.admin is not None:
+        return g.admin['sub']
+    return data.get('user_account_id_user', 1)  # Admin padrão
+
+
 def validate_faq_data(data):
     """Valida os dados de entrada para FAQs."""
     errors = []
@@ -114,67 +399,360 @@ def validate_faq_data(data):
     return errors
 
 
+def responder_com_etag(versao, gerar):
+    """
+    Resposta condicional com ETag/Last-Modified.
+    `versao` é o marcador barato do recurso, vindo só do banco (ver
+    FaqDB.versao): o mesmo ETag em todos os processos e após reinícios. Se o
+    cliente já tem essa versão (If-None-Match), devolve 304 sem buscar nem
+    serializar as linhas. Caso contrário chama `gerar()` para montar a resposta.
+    """
+    if versao is None:
+        return gerar()
+    chave = repr((versao, request.full_path))
+    etag = hashlib.blake2b(chave.encode(), digest_size=16).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        resposta = app.response_class(status=304)
+    else:
+        resposta = make_response(gerar())
+    resposta.set_etag(etag, weak=True)
+    resposta.headers['Cache-Control'] = 'no-cache'
+    if isinstance(versao[0], datetime):
+        resposta.last_modified = versao[0]
+    return resposta
+
+
+def em_cache(view):
+    """
+    Guarda as respostas 200 da rota em cache_respostas (corpo codificado,
+    cabeçalhos e ETag), por rota e parâmetros. Num acerto a view não é
+    chamada: sem banco, objetos FAQ ou encoder JSON. If-None-Match com o ETag
+    guardado recebe 304, como em responder_com_etag.
+    """
+
+    @functools.wraps(view)
+    def servir(**parametros):
+        if cache_respostas is None:
+            return view(**parametros)
+        chave = chave_resposta(
+            request.endpoint, parametros, request.args.items(multi=True)
+        )
+        guardada = cache_respostas.obter(chave)
+        if guardada is not None:
+            return responder_guardada(guardada)
+        # Escrita durante a geração: a resposta (talvez obsoleta) não é guardada
+        geracao = cache_respostas.geracao
+        resposta = make_response(view(**parametros))
+        if resposta.status_code == 200 and not resposta.is_streamed:
+            cache_respostas.guardar(
+                chave,
+                RespostaGuardada(
+                    resposta.get_data(),
+                    [c for c in resposta.headers if c[0] != 'Content-Length'],
+                    resposta.get_etag()[0],
+                ),
+                geracao,
+            )
+        return resposta
+
+    return servir
+
+
+def responder_guardada(guardada):
+    """Resposta a partir de uma RespostaGuardada (304 se o cliente já a tem)."""
+    if guardada.etag and request.if_none_match.contains_weak(guardada.etag):
+        resposta = app.response_class(status=304)
+        resposta.headers.extend(
+            c for c in guardada.cabecalhos if c[0] != 'Content-Type'
+        )
+        return resposta
+    return app.response_class(guardada.corpo, headers=guardada.cabecalhos)
+
+
+# Marcador trocado pela lista já serializada em resposta_com_faqs
+_MARCADOR_FAQS = f'faqs-{uuid.uuid4().hex}'
+
+
+def _json_indentado():
+    """Se o jsonify está indentando a saída (modo debug), como no Flask."""
+    compacto = app.json.compact
+    return compacto is False or (compacto is None and app.debug)
+
+
+def _resposta_json(texto, inicio):
+    """Resposta com JSON já montado; `inicio` conta no Server-Timing do perfil."""
+    if perfil_requisicoes is not None:
+        somar_serializacao(time.perf_counter() - inicio)
+    return app.response_class(texto + '\n', mimetype=app.json.mimetype)
+
+
+def resposta_com_faqs(dados, faqs, chave='items'):
+    """
+    Equivalente a jsonify({**dados, chave: [faq.to_dict() ...]}), mas monta a
+    lista com FAQ.to_json(): o JSON de cada FAQ é gerado uma vez e reaproveitado
+    enquanto o objeto estiver no cache, e só o envelope passa pelo encoder.
+    """
+    if _json_indentado():
+        return jsonify({**dados, chave: [faq.to_dict() for faq in faqs]})
+    envelope = app.json.dumps({**dados, chave: _MARCADOR_FAQS}, separators=(',', ':'))
+    inicio = time.perf_counter()
+    lista = '[' + ','.join(faq.to_json() for faq in faqs) + ']'
+    return _resposta_json(envelope.replace(f'"{_MARCADOR_FAQS}"', lista, 1), inicio)
+
+
+def codificar_cursor(faq_id):
+    """Gera o cursor opaco de paginação a partir do último id_faq da página."""
+    return base64.urlsafe_b64encode(str(faq_id).encode()).decode().rstrip('=')
+
+
+def decodificar_cursor(valor):
+    """Lê um cursor opaco (ou um id_faq numérico). Retorna None se inválido."""
+    if valor.isdigit():
+        return int(valor)
+    try:
+        texto = base64.urlsafe_b64decode(valor + '=' * (-len(valor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    return int(texto) if texto.isdigit() else None
+
+
+def listar_faqs_por_cursor(categoria, ativo):
+    """Modo keyset de GET /faqs: ?after=<cursor>&limit=N."""
+    limit = request.args.get('limit', ITEMS_PER_PAGE, type=int)
+    limit = min(max(limit, 1), MAX_ITEMS_PER_PAGE)
+    cursor_id = None
+    after = request.args.get('after')
+    if after:
+        cursor_id = decodificar_cursor(after)
+        if cursor_id is None:
+            abort(400, description="Parâmetro 'after' inválido")
+
+    # Busca uma linha a mais para saber se existe próxima página
+    faqs = db.listar_apos(cursor_id, limit + 1, categoria, ativo)
+    next_cursor = codificar_cursor(faqs[limit - 1].id) if len(faqs) > limit else None
+    return resposta_com_faqs({'limit': limit, 'next_cursor': next_cursor}, faqs[:limit])
+
+
 @app.route('/faqs', methods=['GET'])
+@em_cache
 def listar_faqs():
-    """Retorna todos os FAQs com suporte à paginação."""
+    """
+    Retorna os FAQs com suporte à paginação (filtros e página aplicados no banco).
+    Aceita ?page=&per_page= ou, por cursor, ?after=<next_cursor>&limit=N.
+    """
     try:
         # Parâmetros de paginação
-        page = request.args.get('page', 1, type=int)
+        page = max(request.args.get('page', 1, type=int), 1)
         per_page = request.args.get('per_page', ITEMS_PER_PAGE, type=int)
+        per_page = min(max(per_page, 1), MAX_ITEMS_PER_PAGE)
 
         # Parâmetros de filtro
         categoria = request.args.get('categoria')
         ativo = request.args.get('ativo', type=int)
 
-        # Obter todos os FAQs
-        faqs = db.listar()
+        # Paginação por cursor (opt-in)
+        if 'after' in request.args or 'limit' in request.args:
+            return responder_com_etag(
+                db.versao(), lambda: listar_faqs_por_cursor(categoria, ativo)
+            )
 
-        # Aplicar filtros, se houver
-        if categoria:
-            faqs = [faq for faq in faqs if faq.categoria.lower() == categoria.lower()]
-        if ativo is not None:
-            faqs = [faq for faq in faqs if faq.ativo == ativo]
+        def gerar():
+            # Buscar apenas a página solicitada e o total do filtro
+            paginated_faqs, total = db.listar_pagina(
+                categoria, ativo, offset=(page - 1) * per_page, limit=per_page
+            )
 
-        # Calcular paginação
-        total = len(faqs)
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
+            # Construir resposta
+            response = {
+                'total': total,
+                'page': page,
+                'per_page': per_page,
+                'total_pages': (total + per_page - 1) // per_page,
+            }
 
-        # Fatiar lista de acordo com a paginação
-        paginated_faqs = faqs[start_idx:end_idx]
+            return resposta_com_faqs(response, paginated_faqs)
 
-        # Construir resposta
-        response = {
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page,
-            'items': [faq.__dict__ for faq in paginated_faqs],
-        }
-
-        return jsonify(response)
+        return responder_com_etag(db.versao(), gerar)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f'Erro ao listar FAQs: {e}')
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
+@app.route('/faqs/busca', methods=['GET'])
+@em_cache
+def buscar_faqs():
+    """
+    Busca textual em pergunta e resposta, ordenada por relevância (BM25).
+    Respondida pelo índice em memória, sem ida ao banco.
+    Aceita ?q=<texto>&categoria=&ativo=&limit=N.
+    """
+    consulta = request.args.get('q', '').strip()
+    if not consulta:
+        abort(400, description="Parâmetro 'q' é obrigatório")
+    categoria = request.args.get('categoria')
+    ativo = request.args.get('ativo', type=int)
+    limit = request.args.get('limit', ITEMS_PER_PAGE, type=int)
+    limit = min(max(limit, 1), MAX_ITEMS_PER_PAGE)
+
+    resultados, total = indice_busca.buscar(consulta, categoria, ativo, limit)
+    return jsonify(
+        {
+            'q': consulta,
+            'total': total,
+            'items': [
+                {**faq.to_dict(), 'score': round(pontuacao, 4)}
+                for faq, pontuacao in resultados
+            ],
+        }
+    )
+
+
+@app.route('/faqs/sugestoes', methods=['GET'])
+@em_cache
+def sugerir_faqs():
+    """
+    Autocompletar: FAQs ativos cuja pergunta (ou uma palavra dela) começa com
+    o prefixo, e categorias com esse prefixo. Respondida pelo índice em memória.
+    Aceita ?prefix=<texto>&limit=N.
+    """
+    prefixo = request.args.get('prefix', '').strip()
+    if not prefixo:
+        abort(400, description="Parâmetro 'prefix' é obrigatório")
+    limit = request.args.get('limit', ITEMS_PER_PAGE, type=int)
+    limit = min(max(limit, 1), MAX_ITEMS_PER_PAGE)
+
+    sugestoes = indice_sugestoes.sugerir(prefixo, limit)
+    return jsonify(
+        {
+            'prefix': prefixo,
+            'categorias': sugestoes['categorias'],
+            'items': [
+                {'id': faq.id, 'pergunta': faq.pergunta, 'categoria': faq.categoria}
+                for faq in sugestoes['faqs']
+            ],
+        }
+    )
+
+
+def evento_mudancas(texto, cursor):
+    """Evento SSE de um lote; o id permite retomar pelo Last-Event-ID."""
+    return f'id: {cursor}\nevent: mudancas\ndata: {texto}\n\n'
+
+
+def fluxo_mudancas(cursor):
+    """
+    Corpo do SSE: um evento por lote de mudanças e um comentário de
+    keepalive a cada MUDANCAS_HEARTBEAT segundos sem mudanças (que também
+    revela clientes desconectados). Entre um e outro, a thread só espera.
+    """
+    texto, cursor = registro_mudancas.ler(cursor)
+    if texto is None:
+        # Sem evento, só fixa o cursor de retomada do EventSource
+        yield f'retry: 3000\nid: {cursor}\n\n'
+    else:
+        yield 'retry: 3000\n' + evento_mudancas(texto, cursor)
+    while True:
+        texto, cursor = registro_mudancas.ler(cursor, MUDANCAS['heartbeat'])
+        if texto is None:
+            yield ': keepalive\n\n'
+        else:
+            yield evento_mudancas(texto, cursor)
+
+
+@app.route('/faqs/mudancas', methods=['GET'])
+def acompanhar_mudancas():
+    """
+    Feed das escritas nos FAQs a partir de um cursor: as linhas gravadas
+    (como em GET /faqs/<id>) e os ids removidos, com o cursor seguinte.
+    'recarregar': true pede que o cliente releia a listagem (cursor de outro
+    processo ou antigo demais).
+
+    Com Accept: text/event-stream, responde em Server-Sent Events, retomando
+    pelo Last-Event-ID. Senão, long-poll: com ?cursor=, espera até ?espera=
+    segundos (no máximo MUDANCAS_ESPERA) e responde o lote ou 204 se nada
+    mudou; sem cursor, responde na hora com o cursor atual. A espera não
+    segura conexão de banco (as linhas são lidas uma vez, na escrita).
+    """
+    cursor = request.headers.get('Last-Event-ID') or request.args.get('cursor')
+    sse = request.accept_mimetypes.best == 'text/event-stream'
+    if not sse and cursor is None:
+        _, atual = registro_mudancas.ler()
+        return jsonify(
+            {'cursor': atual, 'gravados': [], 'recarregar': False, 'removidos': []}
+        )
+
+    if not registro_mudancas.entrar():
+        resposta = jsonify({'erro': 'Limite de clientes do feed atingido'})
+        resposta.headers['Retry-After'] = str(int(MUDANCAS['espera']))
+        return resposta, 503
+
+    if sse:
+        resposta = app.response_class(
+            fluxo_mudancas(cursor), mimetype='text/event-stream'
+        )
+        resposta.call_on_close(registro_mudancas.sair)
+        resposta.headers['Cache-Control'] = 'no-cache'
+        # Proxies como o nginx não devem acumular os eventos
+        resposta.headers['X-Accel-Buffering'] = 'no'
+        return resposta
+
+    espera = request.args.get('espera', MUDANCAS['espera'], type=float)
+    try:
+        texto, _ = registro_mudancas.ler(
+            cursor, min(max(espera, 0), MUDANCAS['espera'])
+        )
+    finally:
+        registro_mudancas.sair()
+    if texto is None:
+        return app.response_class(status=204)
+    return app.response_class(texto + '\n', mimetype=app.json.mimetype)
+
+
 @app.route('/faqs/<int:faq_id>', methods=['GET'])
+@em_cache
 def obter_faq(faq_id):
-    """Retorna um FAQ pelo ID."""
+    """
+    Retorna um FAQ pelo ID (consulta pela chave primária). O ETag vem da
+    versão dos FAQs e do caminho, conferidos antes de ler a linha: o 304 não
+    busca nem serializa o FAQ. Qualquer escrita muda o ETag de todos.
+    """
     try:
-        faqs = db.listar()
-        for faq in faqs:
-            if faq.id == faq_id:
-                return jsonify(faq.__dict__)
-        abort(404, description='FAQ não encontrado')
+
+        def gerar():
+            faq = db.buscar_por_id(faq_id)
+            if faq is None:
+                abort(404, description='FAQ não encontrado')
+            if _json_indentado():
+                return jsonify(faq.to_dict())
+            inicio = time.perf_counter()
+            return _resposta_json(faq.to_json(), inicio)
+
+        return responder_com_etag(db.versao(), gerar)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f'Erro ao obter FAQ {faq_id}: {e}')
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
+def formatar_similares(similares):
+    """Pares (FAQ, similaridade) no formato da resposta da API."""
+    return [
+        {'id': faq.id, 'pergunta': faq.pergunta, 'similaridade': round(valor, 4)}
+        for faq, valor in similares
+    ]
+
+
 @app.route('/faqs', methods=['POST'])
+@exige_admin
 def adicionar_faq():
-    """Adiciona um novo FAQ."""
+    """
+    Adiciona um novo FAQ e retorna os FAQs existentes com pergunta parecida.
+    Com ?rejeitar_acima=<0..1> (padrão: SIMILARIDADE_REJEITAR_ACIMA), recusa
+    (409) a pergunta se algum FAQ existente tiver similaridade igual ou maior.
+    """
     try:
         data = request.get_json()
 
@@ -183,9 +761,20 @@ def adicionar_faq():
         if errors:
             return jsonify({'erros': errors}), 400
 
+        encontrados, recusar = db.verificar_duplicata(
+            data['pergunta'], request.args.get('rejeitar_acima', type=float)
+        )
+        similares = formatar_similares(encontrados)
+        if recusar:
+            return jsonify(
+                {
+                    'erro': 'Já existe um FAQ com pergunta muito parecida',
+                    'similares': similares,
+                }
+            ), 409
+
         try:
-            # Usar ID de admin padrão se não fornecido
-            user_adm_id = data.get('user_account_id_user', 1)  # Admin padrão
+            user_adm_id = usuario_da_requisicao(data)
 
             success = db.adicionar(
                 data['pergunta'],
@@ -196,7 +785,13 @@ def adicionar_faq():
             )
 
             if success:
-                return jsonify({'mensagem': 'FAQ adicionado com sucesso!'}), 201
+                return jsonify(
+                    {
+                        'mensagem': 'FAQ adicionado com sucesso!',
+                        'id': success,
+                        'similares': similares,
+                    }
+                ), 201
             else:
                 return jsonify({'erro': 'Falha ao adicionar FAQ'}), 500
 
@@ -209,16 +804,128 @@ def adicionar_faq():
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
+@app.route('/faqs/lote', methods=['POST'])
+@exige_admin
+def adicionar_faqs_lote():
+    """
+    Adiciona vários FAQs de uma vez (lista JSON de objetos como em POST /faqs).
+    Retorna o resultado de cada linha pelo índice; linhas inválidas não
+    impedem a inserção das demais.
+    """
+    try:
+        data = request.get_json()
+        if not isinstance(data, list) or not data:
+            abort(400, description='Envie uma lista JSON não vazia de FAQs')
+        if len(data) > MAX_LOTE:
+            abort(400, description=f'O lote excede o máximo de {MAX_LOTE} FAQs')
+
+        resultados = [None] * len(data)
+        validos = []
+        for indice, item in enumerate(data):
+            errors = validate_faq_data(item) if isinstance(item, dict) else None
+            if errors is None:
+                errors = ['Cada item do lote deve ser um objeto JSON']
+            if errors:
+                resultados[indice] = {'indice': indice, 'ok': False, 'erros': errors}
+            else:
+                validos.append(indice)
+
+        try:
+            resultados_db = db.adicionar_lote(
+                [
+                    (
+                        data[i]['pergunta'],
+                        data[i]['resposta'],
+                        data[i]['ativo'],
+                        data[i]['categoria'],
+                        usuario_da_requisicao(data[i]),
+                    )
+                    for i in validos
+                ],
+                TAMANHO_LOTE,
+            )
+        except Exception as db_error:
+            logger.error(f'Erro de banco ao adicionar lote de FAQs: {db_error}')
+            abort(500, description='Erro ao salvar o lote no banco de dados')
+
+        for indice, resultado in zip(validos, resultados_db):
+            resultados[indice] = {'indice': indice, 'ok': resultado['ok']}
+            if not resultado['ok']:
+                resultados[indice]['erros'] = [resultado['erro']]
+
+        inseridos = sum(1 for r in resultados if r['ok'])
+        return jsonify(
+            {
+                'total': len(data),
+                'inseridos': inseridos,
+                'falhas': len(data) - inseridos,
+                'resultados': resultados,
+            }
+        ), (201 if inseridos else 400)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f'Erro ao adicionar lote de FAQs: {e}')
+        abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
+
+
+def validar_ids_lote(data):
+    """Extrai e valida a lista 'ids' de uma operação em lote (sem repetições)."""
+    ids = data.get('ids') if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not ids:
+        abort(400, description="Campo 'ids' deve ser uma lista não vazia de IDs")
+    if not all(isinstance(id, int) and not isinstance(id, bool) for id in ids):
+        abort(400, description="Campo 'ids' deve conter apenas números inteiros")
+    if len(ids) > MAX_LOTE:
+        abort(400, description=f'O lote excede o máximo de {MAX_LOTE} IDs')
+    return list(dict.fromkeys(ids))
+
+
+@app.route('/faqs/lote/status', methods=['PATCH'])
+@exige_admin
+def atualizar_status_lote():
+    """Ativa ou desativa vários FAQs em uma única transação."""
+    try:
+        data = request.get_json(silent=True)
+        ids = validar_ids_lote(data)
+        ativo = data.get('ativo')
+        if not isinstance(ativo, int) or ativo not in [0, 1]:
+            abort(400, description="Campo 'ativo' deve ser 0 (inativo) ou 1 (ativo)")
+
+        resultado = db.atualizar_status_lote(ids, ativo, usuario_da_requisicao(data))
+        if resultado is None:
+            abort(500, description='Erro ao atualizar os FAQs no banco de dados')
+        return jsonify(resultado)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f'Erro ao atualizar status em lote: {e}')
+        abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
+
+
+@app.route('/faqs/lote', methods=['DELETE'])
+@exige_admin
+def deletar_faqs_lote():
+    """Remove vários FAQs (corpo JSON com 'ids') em uma única transação."""
+    try:
+        ids = validar_ids_lote(request.get_json(silent=True))
+        resultado = db.deletar_lote(ids)
+        if resultado is None:
+            abort(500, description='Erro ao remover os FAQs do banco de dados')
+        return jsonify(resultado)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f'Erro ao remover FAQs em lote: {e}')
+        abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
+
+
 @app.route('/faqs/<int:faq_id>', methods=['PUT'])
+@exige_admin
 def atualizar_faq(faq_id):
-    """Atualiza um FAQ existente."""
+    """Atualiza um FAQ existente (404 decidido pelas linhas afetadas no UPDATE)."""
     try:
-        # Verificar se o FAQ existe
-        faqs = db.listar()
-        faq_existe = any(faq.id == faq_id for faq in faqs)
-        if not faq_existe:
-            abort(404, description=f'FAQ com ID {faq_id} não encontrado')
-
         data = request.get_json()
 
         # Validar dados recebidos
@@ -227,10 +934,9 @@ def atualizar_faq(faq_id):
             return jsonify({'erros': errors}), 400
 
         try:
-            # Usa ID de admin padrão se não fornecido
-            user_adm_id = data.get('user_account_id_user', 1)  # Admin padrão
+            user_adm_id = usuario_da_requisicao(data)
 
-            success = db.atualizar(
+            rows_affected = db.atualizar(
                 faq_id,
                 data['pergunta'],
                 data['resposta'],
@@ -238,57 +944,302 @@ def atualizar_faq(faq_id):
                 data['categoria'],
                 user_adm_id,
             )
-
-            if success:
-                return jsonify({'mensagem': 'FAQ atualizado com sucesso!'})
-            else:
-                return jsonify({'erro': 'Falha ao atualizar FAQ'}), 500
-
         except Exception as db_error:
             logger.error(f'Erro de banco ao atualizar FAQ {faq_id}: {db_error}')
             abort(500, description='Erro ao atualizar o FAQ no banco de dados')
 
+        if rows_affected is None:
+            return jsonify({'erro': 'Falha ao atualizar FAQ'}), 500
+        if rows_affected == 0:
+            abort(404, description=f'FAQ com ID {faq_id} não encontrado')
+        return jsonify({'mensagem': 'FAQ atualizado com sucesso!'})
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f'Erro ao atualizar FAQ {faq_id}: {e}')
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
 @app.route('/faqs/<int:faq_id>', methods=['DELETE'])
+@exige_admin
 def deletar_faq(faq_id):
-    """Remove um FAQ pelo ID."""
+    """Remove um FAQ pelo ID (404 decidido pelas linhas afetadas no DELETE)."""
     try:
-        # Verificar se o FAQ existe
-        faqs = db.listar()
-        faq_existe = any(faq.id == faq_id for faq in faqs)
-        if not faq_existe:
-            abort(404, description=f'FAQ com ID {faq_id} não encontrado')
-
         try:
-            db.deletar(faq_id)
-            return jsonify({'mensagem': 'FAQ removido com sucesso!'})
-
+            rows_affected = db.deletar(faq_id)
         except Exception as db_error:
             logger.error(f'Erro de banco ao remover FAQ {faq_id}: {db_error}')
             abort(500, description='Erro ao remover o FAQ do banco de dados')
 
+        if rows_affected is None:
+            abort(500, description='Erro ao remover o FAQ do banco de dados')
+        if rows_affected == 0:
+            abort(404, description=f'FAQ com ID {faq_id} não encontrado')
+        return jsonify({'mensagem': 'FAQ removido com sucesso!'})
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f'Erro ao remover FAQ {faq_id}: {e}')
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
 @app.route('/categorias', methods=['GET'])
+@em_cache
 def listar_categorias():
-    """Retorna todas as categorias disponíveis."""
+    """
+    Retorna os nomes das categorias, em ordem. Com ?detalhes=1, cada item é
+    um objeto com 'categoria', 'total', 'ativos' e 'atualizado_em'. Ambos
+    vêm de um único GROUP BY no banco, guardado no cache de leituras.
+    """
     try:
-        faqs = db.listar()
-        # Extrair categorias únicas
-        categorias = sorted(set(faq.categoria for faq in faqs))
-        return jsonify(categorias)
+        detalhes = request.args.get('detalhes', type=int) == 1
+
+        def gerar():
+            resumo = db.resumo_categorias()
+            if detalhes:
+                return jsonify(resumo)
+            return jsonify([item['categoria'] for item in resumo])
+
+        return responder_com_etag(db.versao(), gerar)
     except Exception as e:
         logger.error(f'Erro ao listar categorias: {e}')
         abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
 
 
+@app.route('/categorias/<path:categoria>', methods=['PUT'])
+@exige_admin
+def renomear_categoria(categoria):
+    """Renomeia uma categoria em todos os FAQs (corpo JSON com 'categoria')."""
+    try:
+        data = request.get_json(silent=True) or {}
+        nova = data.get('categoria')
+        if not isinstance(nova, str) or not nova.strip():
+            abort(400, description="Campo 'categoria' (novo nome) não fornecido")
+        if len(nova) > MAX_CATEGORIA_LEN:
+            abort(
+                400,
+                description='Categoria excede o tamanho máximo de '
+                f'{MAX_CATEGORIA_LEN} caracteres',
+            )
+
+        try:
+            rows_affected = db.renomear_categoria(
+                categoria, nova, usuario_da_requisicao(data)
+            )
+        except ValueError as erro:
+            abort(400, description=str(erro))
+
+        if rows_affected is None:
+            abort(500, description='Erro ao renomear a categoria no banco de dados')
+        if rows_affected == 0:
+            abort(404, description=f'Categoria {categoria} não encontrada')
+        return jsonify({'afetados': rows_affected})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f'Erro ao renomear categoria {categoria}: {e}')
+        abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
+
+
+@app.route('/auth/login', methods=['POST'])
+def login():
+    """
+    Autentica um admin por CPF e data de nascimento (YYYY-MM-DD), com uma
+    consulta ao banco, e devolve o token a enviar nas escritas em
+    Authorization: Bearer <token>.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        cpf = data.get('cpf')
+        nascimento = data.get('nascimento')
+        if not isinstance(cpf, str) or not isinstance(nascimento, str):
+            abort(
+                400,
+                description="Campos 'cpf' e 'nascimento' (YYYY-MM-DD) são obrigatórios",
+            )
+
+        admin = db.autenticar_admin(cpf.strip(), nascimento.strip())
+        if admin is None:
+            return nao_autorizado('CPF ou data de nascimento inválidos')
+        token, claims = emissor_tokens.emitir(
+            {'sub': admin['id_user'], 'adm': admin['id_user_adm']}
+        )
+        return jsonify(
+            {
+                'token': token,
+                'tipo': 'Bearer',
+                'expira_em': datetime.fromtimestamp(claims['exp']).isoformat(),
+                'usuario': {
+                    'id_user': admin['id_user'],
+                    'id_user_adm': admin['id_user_adm'],
+                    'nome': admin['name_user'],
+                },
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f'Erro ao autenticar admin: {e}')
+        abort(500, description=f'Erro ao processar a solicitação: {str(e)}')
+
+
+@app.route('/auth/logout', methods=['POST'])
+@exige_admin
+def logout():
+    """Revoga o token da requisição (vale até ele expirar)."""
+    token = token_da_requisicao()
+    if token is None:
+        abort(400, description='Nenhum token informado')
+    emissor_tokens.revogar(token)
+    return jsonify({'mensagem': 'Sessão encerrada'})
+
+
+@app.route('/metrics', methods=['GET'])
+@exige_admin_exceto(METRICAS_PUBLICAS)
+def exportar_metricas():
+    """
+    Métricas no formato de texto do Prometheus: requisições, erros, duração e
+    idas ao banco por rota, requisições em andamento, espera por sessão do
+    pool, acertos dos caches de leituras e de respostas e compressão. Exige
+    token de admin, salvo com METRICAS_PUBLICAS=1.
+    """
+    linhas = [metricas.exportar().rstrip('\n')]
+    pool = db.estatisticas_pool()
+    if pool:
+        linhas += formatar_metrica(
+            'faq_db_pool_espera_segundos',
+            'summary',
+            'Espera por uma sessão livre no checkout do pool.',
+            [
+                ('_sum', {}, pool['espera_total_ms'] / 1000),
+                ('_count', {}, pool['checkouts']),
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_db_pool_espera_max_segundos',
+            'gauge',
+            'Maior espera por uma sessão do pool desde o início.',
+            [('', {}, pool['espera_max_ms'] / 1000)],
+        )
+        linhas += formatar_metrica(
+            'faq_db_pool_sessoes',
+            'gauge',
+            'Sessões do pool por estado.',
+            [
+                ('', {'estado': 'abertas'}, pool['abertas']),
+                ('', {'estado': 'ocupadas'}, pool['ocupadas']),
+            ],
+        )
+    consultas = db.estatisticas_sql()['consultas']
+    for nome, ajuda, valor in (
+        ('faq_db_sql_execucoes', 'Execuções por constante SQL.', 'execucoes'),
+        (
+            'faq_db_sql_linhas',
+            'Linhas buscadas ou afetadas por constante SQL.',
+            'linhas',
+        ),
+        ('faq_db_sql_bytes', 'Bytes aproximados buscados por constante SQL.', 'bytes'),
+    ):
+        linhas += formatar_metrica(
+            nome,
+            'counter',
+            ajuda,
+            [('_total', {'sql': c['sql']}, c[valor]) for c in consultas],
+        )
+    linhas += formatar_metrica(
+        'faq_db_sql_segundos',
+        'counter',
+        'Tempo de execução (execute + fetch) por constante SQL.',
+        [('_total', {'sql': c['sql']}, c['tempo_total_ms'] / 1000) for c in consultas],
+    )
+    cache = db.estatisticas_cache()
+    if cache:
+        linhas += formatar_metrica(
+            'faq_cache_consultas',
+            'counter',
+            'Consultas ao cache de leituras por resultado.',
+            [
+                ('_total', {'resultado': 'acerto'}, cache['hits']),
+                ('_total', {'resultado': 'falta'}, cache['misses']),
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_cache_taxa_acerto',
+            'gauge',
+            'Fração das consultas ao cache atendidas sem ir ao banco.',
+            [('', {}, cache['hit_ratio'])],
+        )
+        linhas += formatar_metrica(
+            'faq_cache_entradas',
+            'gauge',
+            'Entradas no cache de leituras.',
+            [('', {}, cache['entradas'])],
+        )
+    if cache_respostas:
+        respostas = cache_respostas.estatisticas()
+        linhas += formatar_metrica(
+            'faq_cache_respostas_consultas',
+            'counter',
+            'Consultas ao cache de respostas serializadas por resultado.',
+            [
+                ('_total', {'resultado': 'acerto'}, respostas['hits']),
+                ('_total', {'resultado': 'falta'}, respostas['misses']),
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_cache_respostas_bytes',
+            'gauge',
+            'Bytes dos corpos guardados no cache de respostas.',
+            [('', {}, respostas['bytes'])],
+        )
+    if compressor:
+        compressao = compressor.estatisticas()
+        linhas += formatar_metrica(
+            'faq_api_compressao',
+            'counter',
+            'Respostas comprimidas, por compressão feita ou reaproveitada (ETag).',
+            [
+                ('_total', {'resultado': 'comprimida'}, compressao['comprimidas']),
+                (
+                    '_total',
+                    {'resultado': 'reaproveitada'},
+                    compressao['reaproveitadas'],
+                ),
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_api_compressao_bytes',
+            'counter',
+            'Bytes das respostas comprimidas, antes e depois da compressão.',
+            [
+                ('_total', {'etapa': 'original'}, compressao['bytes_originais']),
+                ('_total', {'etapa': 'enviado'}, compressao['bytes_enviados']),
+            ],
+        )
+    linhas += formatar_metrica(
+        'faq_mudancas_clientes',
+        'gauge',
+        'Clientes conectados ao feed de mudanças (SSE e long-poll).',
+        [('', {}, registro_mudancas.estatisticas()['clientes'])],
+    )
+    return app.response_class(
+        '\n'.join(linhas) + '\n', content_type=CONTENT_TYPE_METRICAS
+    )
+
+
+@app.route('/status/sql', methods=['GET'])
+@exige_admin
+def status_sql():
+    """
+    Estatísticas de SQL por constante (execuções, tempo total/médio/máximo,
+    linhas e bytes) e as execuções lentas mais recentes, sem valores de binds.
+    Exige token de admin.
+    """
+    return jsonify(db.estatisticas_sql())
+
+
 @app.route('/status', methods=['GET'])
 def status():
     """Verifica o status da API e da conexão com o banco."""
@@ -299,6 +1250,22 @@ def status():
             {
                 'status': 'online',
                 'database': 'connected',
+                'pool': db.estatisticas_pool(),
+                'cache': db.estatisticas_cache(),
+                'cache_respostas': cache_respostas.estatisticas()
+                if cache_respostas
+                else None,
+                'compressao': compressor.estatisticas() if compressor else None,
+                'mudancas': registro_mudancas.estatisticas(),
+                'autenticacao': {
+                    'obrigatoria': AUTH['obrigatoria'],
+                    **emissor_tokens.estatisticas(),
+                },
+                'busca': indice_busca.estatisticas(),
+                'sugestoes': indice_sugestoes.estatisticas(),
+                'similaridade': detector_duplicatas.estatisticas()
+                if detector_duplicatas
+                else None,
                 'timestamp': datetime.now().isoformat(),
                 'api_version': '1.0.0',
             }
@@ -318,9 +1285,13 @@ def status():
 if __name__ == '__main__':
     print('   INICIANDO SERVIDOR   \n')
     print('• Servidor: http://localhost:5000')
-    print('• Endpoints: /faqs, /status, /categorias')
+    print(
+        '• Endpoints: /faqs, /faqs/busca, /faqs/sugestoes, /faqs/mudancas, /status, '
+        '/status/sql, /metrics, /categorias, /auth/login'
+    )
     print('• CORS: Habilitado para todos os domínios')
     print('• Banco de dados: Oracle')
+    print('• Servidor de desenvolvimento: em produção, use scripts/servir_api.py')
 
     # Usa threaded=True para melhor desempenho e use_reloader=False para evitar reinicializações duplicadas
     app.run(debug=True, host='0.0.0.0', port=5000, threaded=True, use_reloader=False)
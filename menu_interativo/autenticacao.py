@@ -0,0 +1,145 @@
+"""
+Sessões de admin da API por token assinado. O login autentica uma única vez
+no banco (banco.autenticar_admin) e recebe um token com os dados do admin e a
+validade, assinado com HMAC-SHA256. Cada escrita confere só a assinatura, a
+validade e uma lista de tokens revogados em memória, sem ir ao banco.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+
+
+class TokenInvalidoError(Exception):
+    """Token malformado, com assinatura inválida, expirado ou revogado."""
+
+
+def _codificar(dados):
+    return base64.urlsafe_b64encode(dados).rstrip(b'=')
+
+
+def _decodificar(texto):
+    return base64.urlsafe_b64decode(texto + b'=' * (-len(texto) % 4))
+
+
+class EmissorTokens:
+    """
+    Emite e confere tokens no formato <dados>.<assinatura>, em base64 de URL:
+    os dados são o JSON das claims (com 'exp', validade em segundos desde a
+    época, e 'jti', identificador do token) e a assinatura é o HMAC-SHA256
+    dos dados. A revogação vale para este processo e dura até o token expirar.
+
+    Args:
+        segredo (str | bytes): Chave do HMAC. Processos com o mesmo segredo
+            aceitam os tokens uns dos outros; sem segredo, usa um aleatório.
+        ttl (float): Validade de cada token, em segundos.
+
+    Example:
+        >>> emissor = EmissorTokens('segredo', ttl=60)
+        >>> token, claims = emissor.emitir({'sub': 7})
+        >>> emissor.verificar(token)['sub']
+        7
+        >>> emissor.revogar(token)
+        True
+        >>> try:
+        ...     emissor.verificar(token)
+        ... except TokenInvalidoError as erro:
+        ...     print(erro)
+        Token revogado
+    """
+
+    def __init__(self, segredo=None, ttl=3600.0):
+        if segredo is None:
+            segredo = secrets.token_bytes(32)
+        elif isinstance(segredo, str):
+            segredo = segredo.encode()
+        self._segredo = segredo
+        self.ttl = ttl
+        # jti -> exp dos tokens revogados ainda não expirados
+        self._revogados = {}
+        self._lock = threading.Lock()
+        self.emitidos = 0
+        self.verificados = 0
+        self.recusados = 0
+
+    def _assinar(self, dados):
+        return _codificar(hmac.new(self._segredo, dados, hashlib.sha256).digest())
+
+    def emitir(self, claims):
+        """
+        Retorna (token, claims) para as `claims` informadas (ex.: 'sub',
+        o usuário), acrescidas de 'exp' e 'jti'.
+        """
+        claims = {
+            **claims,
+            'exp': int(time.time() + self.ttl),
+            'jti': secrets.token_urlsafe(12),
+        }
+        dados = _codificar(json.dumps(claims, separators=(',', ':')).encode())
+        with self._lock:
+            self.emitidos += 1
+        return (dados + b'.' + self._assinar(dados)).decode(), claims
+
+    def _conferir(self, token):
+        try:
+            dados, separador, assinatura = token.encode('ascii').partition(b'.')
+        except (AttributeError, UnicodeEncodeError):
+            raise TokenInvalidoError('Token malformado') from None
+        if not separador:
+            raise TokenInvalidoError('Token malformado')
+        if not hmac.compare_digest(assinatura, self._assinar(dados)):
+            raise TokenInvalidoError('Assinatura inválida')
+        try:
+            claims = json.loads(_decodificar(dados))
+        except (binascii.Error, ValueError):
+            raise TokenInvalidoError('Token malformado') from None
+        if claims['exp'] <= time.time():
+            raise TokenInvalidoError('Token expirado')
+        if claims['jti'] in self._revogados:
+            raise TokenInvalidoError('Token revogado')
+        return claims
+
+    def verificar(self, token):
+        """Claims do token, ou TokenInvalidoError. Não consulta o banco."""
+        try:
+            claims = self._conferir(token)
+        except TokenInvalidoError:
+            with self._lock:
+                self.recusados += 1
+            raise
+        with self._lock:
+            self.verificados += 1
+        return claims
+
+    def revogar(self, token):
+        """
+        Revoga o token (ex.: logout). Retorna False se ele já não era válido.
+        Os revogados expirados saem da lista a cada revogação.
+        """
+        try:
+            claims = self._conferir(token)
+        except TokenInvalidoError:
+            return False
+        agora = time.time()
+        with self._lock:
+            self._revogados = {
+                jti: exp for jti, exp in self._revogados.items() if exp > agora
+            }
+            self._revogados[claims['jti']] = claims['exp']
+        return True
+
+    def estatisticas(self):
+        """Tokens emitidos, verificações aceitas/recusadas e revogados ativos."""
+        with self._lock:
+            return {
+                'ttl': self.ttl,
+                'emitidos': self.emitidos,
+                'verificados': self.verificados,
+                'recusados': self.recusados,
+                'revogados': len(self._revogados),
+            }
@@ -1,19 +1,38 @@
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 
-from config.settings import COLOR_ERROR, COLOR_RESET, COLOR_SUCCESS, COLOR_WARNING
+from config.settings import COLOR_ERROR, COLOR_RESET, COLOR_SUCCESS, get_sql_lento_ms
+from estatisticas_sql import EstatisticasSQL, forma_binds, tamanho_linhas
 
 # --- Constantes da tabela FAQ ---
 FAQ_TABLE_NAME = 'faq'
+# Tabela de uma linha com a versão dos FAQs, incrementada a cada escrita
+VERSION_TABLE_NAME = 'faq_versao'
+# Erro do Oracle para tabela inexistente (ex.: faq_versao antes da migração)
+_ERRO_TABELA_INEXISTENTE = 'ORA-00942'
 MAX_PERGUNTA_LEN = 150
 MAX_RESPOSTA_LEN = 600
 MAX_CATEGORIA_LEN = 50
 ATIVO_TYPE = 'NUMBER(1)'
 
+# Tipos de evento passados aos ouvintes de FaqDB.ao_alterar
+EVENTO_GRAVADOS = 'gravados'
+EVENTO_REMOVIDOS = 'removidos'
+
+BATCH_SIZE = 500  # Linhas por executemany/commit nas operações em lote
+EXPORT_ARRAYSIZE = 1000  # Linhas por ida ao banco na leitura em streaming
+
 # --- Consultas SQL ---
-SQL_INSERT = f"""
+SQL_INSERT_RETURNING = f"""
     INSERT INTO {FAQ_TABLE_NAME}
-    (question_faq, answer_faq, active_faq, category_faq, user_account_id_user)
-    VALUES (:1, :2, :3, :4, :5)
+    (question_faq, answer_faq, active_faq, category_faq, user_account_id_user,
+     faq_updated_at)
+    VALUES (:1, :2, :3, :4, :5, SYSDATE)
+    RETURNING id_faq INTO :6
 """
 SQL_UPDATE = f"""
     UPDATE {FAQ_TABLE_NAME}
@@ -23,16 +42,79 @@ SQL_UPDATE = f"""
 SQL_DELETE = f"""
     DELETE FROM {FAQ_TABLE_NAME} WHERE id_faq = :1
 """
+SQL_UPDATE_ACTIVE = f"""
+    UPDATE {FAQ_TABLE_NAME}
+    SET active_faq = :1, faq_updated_at = SYSDATE, user_account_id_user = :2
+    WHERE id_faq = :3
+"""
+SQL_RENAME_CATEGORY = f"""
+    UPDATE {FAQ_TABLE_NAME}
+    SET category_faq = :nova, faq_updated_at = SYSDATE, user_account_id_user = :usuario
+    WHERE UPPER(category_faq) = UPPER(:atual)
+    RETURNING id_faq INTO :ids
+"""
+SQL_MERGE = f"""
+    MERGE INTO {FAQ_TABLE_NAME} f
+    USING (
+        SELECT :pergunta AS question_faq, :resposta AS answer_faq, :ativo AS active_faq,
+               :categoria AS category_faq, :usuario AS user_account_id_user
+        FROM DUAL
+    ) s
+    ON (f.question_faq = s.question_faq)
+    WHEN MATCHED THEN UPDATE SET
+        f.answer_faq = s.answer_faq, f.active_faq = s.active_faq,
+        f.category_faq = s.category_faq,
+        f.user_account_id_user = s.user_account_id_user,
+        f.faq_updated_at = SYSDATE
+        WHERE f.answer_faq <> s.answer_faq OR f.active_faq <> s.active_faq
+           OR f.category_faq <> s.category_faq
+    WHEN NOT MATCHED THEN INSERT
+        (question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+         user_account_id_user)
+        VALUES (s.question_faq, s.answer_faq, s.active_faq, SYSDATE, s.category_faq,
+                s.user_account_id_user)
+"""
+SQL_SELECT_BY_QUESTIONS = f"""
+    SELECT id_faq, question_faq, answer_faq, active_faq, category_faq
+    FROM {FAQ_TABLE_NAME}
+    WHERE question_faq IN ({{perguntas}})
+"""
 SQL_SELECT_ALL = f"""
   SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq, user_account_id_user
   FROM {FAQ_TABLE_NAME}
   ORDER BY id_faq DESC
 """
+SQL_SELECT_CHANGED_SINCE = f"""
+  SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+         user_account_id_user
+  FROM {FAQ_TABLE_NAME}
+  WHERE faq_updated_at >= :desde
+  ORDER BY id_faq DESC
+"""
+SQL_SELECT_ID_RANGE = f"""
+  SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+         user_account_id_user
+  FROM {FAQ_TABLE_NAME}
+  WHERE id_faq BETWEEN :inicio AND :fim
+  ORDER BY id_faq DESC
+"""
+SQL_SELECT_ID_BOUNDS = f"""
+    SELECT MIN(id_faq), MAX(id_faq) FROM {FAQ_TABLE_NAME}
+"""
+SQL_SELECT_IDS = f"""
+    SELECT id_faq FROM {FAQ_TABLE_NAME} ORDER BY id_faq DESC
+"""
 SQL_SELECT_BY_ID = f"""
     SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq, user_account_id_user
     FROM {FAQ_TABLE_NAME}
     WHERE id_faq = :1
 """
+SQL_SELECT_BY_IDS = f"""
+    SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+           user_account_id_user
+    FROM {FAQ_TABLE_NAME}
+    WHERE id_faq IN ({{ids}})
+"""
 SQL_SELECT_BY_CATEGORY = f"""
   SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq, user_account_id_user
   FROM {FAQ_TABLE_NAME}
@@ -57,22 +139,106 @@ SQL_SELECT_BY_CATEGORY_WITH_LIMIT = f"""
 SQL_SELECT_DISTINCT_CATEGORIES = f"""
     SELECT DISTINCT category_faq FROM {FAQ_TABLE_NAME} ORDER BY category_faq
 """
+# Resumo por categoria (total, ativos e última atualização) em uma só consulta
+SQL_SELECT_CATEGORY_SUMMARY = f"""
+    SELECT category_faq, COUNT(*), SUM(CASE WHEN active_faq = 1 THEN 1 ELSE 0 END),
+           MAX(faq_updated_at)
+    FROM {FAQ_TABLE_NAME}
+    GROUP BY category_faq
+    ORDER BY category_faq
+"""
+# Página filtrada; o total vem na mesma ida ao banco via COUNT(*) OVER ()
+SQL_SELECT_PAGE = f"""
+  SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+         user_account_id_user, COUNT(*) OVER () AS total_faq
+  FROM {FAQ_TABLE_NAME}
+  WHERE {{filtros}}
+  ORDER BY id_faq DESC
+  OFFSET :offset ROWS {{fetch}}
+"""
+SQL_COUNT = f"""
+    SELECT COUNT(*) FROM {FAQ_TABLE_NAME} WHERE {{filtros}}
+"""
+# Paginação por chave (keyset): custo constante em qualquer profundidade
+SQL_SELECT_AFTER = f"""
+  SELECT id_faq, question_faq, answer_faq, active_faq, faq_updated_at, category_faq,
+         user_account_id_user
+  FROM {FAQ_TABLE_NAME}
+  WHERE {{filtros}}
+  ORDER BY id_faq DESC
+  FETCH FIRST :n ROWS ONLY
+"""
+SQL_FILTER_CURSOR = 'id_faq < :cursor'
+# Versão dos FAQs (para ETag): lida pela chave, sem percorrer a tabela FAQ,
+# e incrementada na mesma transação de cada escrita. A linha fica bloqueada
+# até o commit, então escritas concorrentes (de todos os processos) esperam
+# umas pelas outras nela; as escritas de banco.py são um comando e o commit,
+# e a espera é da ordem de uma ida ao banco.
+SQL_SELECT_VERSION = f"""
+    SELECT atualizado_em, versao FROM {VERSION_TABLE_NAME} WHERE id_versao = 1
+"""
+# Sem a tabela de versão (migração pendente): versão pela própria tabela FAQ.
+# Percorre o índice, e não nota uma alteração no mesmo segundo da anterior
+# que não mude a contagem
+SQL_SELECT_VERSION_FALLBACK = f"""
+    SELECT MAX(faq_updated_at), COUNT(*) FROM {FAQ_TABLE_NAME}
+"""
+SQL_BUMP_VERSION = f"""
+    UPDATE {VERSION_TABLE_NAME}
+    SET versao = versao + 1, atualizado_em = SYSDATE
+    WHERE id_versao = 1
+    RETURNING versao INTO :versao
+"""
+SQL_FILTER_CATEGORY = 'UPPER(category_faq) = UPPER(:categoria)'
+SQL_FILTER_ACTIVE = 'active_faq = :ativo'
+SQL_FETCH_NEXT = 'FETCH NEXT :limit ROWS ONLY'
+# Data de nascimento pela faixa [dia, dia seguinte): a coluna é comparada sem
+# função (TO_CHAR), então índices em birth_date continuam utilizáveis
+SQL_AUTH_ADMIN = """
+    SELECT ua.id_user, ua.name_user, ua.cpf_user, ua.birth_date, adm.id_user_adm
+    FROM user_account ua
+    JOIN user_adm adm ON adm.user_account_id_user = ua.id_user
+    WHERE ua.cpf_user = :cpf
+      AND ua.birth_date >= :inicio AND ua.birth_date < :fim
+"""
+
+# Nome da constante de cada texto SQL, usado nas estatísticas por consulta.
+# Textos montados com _formatar_sql() herdam o nome do modelo.
+_NOMES_SQL = {
+    valor: nome
+    for nome, valor in list(globals().items())
+    if nome.startswith('SQL_') and isinstance(valor, str)
+}
+
+# Estatísticas de todas as execuções de SQL do processo (ver FaqDB.estatisticas_sql)
+estatisticas_sql = EstatisticasSQL(get_sql_lento_ms())
+
+
+def _formatar_sql(modelo, **partes):
+    """Preenche um modelo SQL_* (filtros, marcadores) mantendo seu nome."""
+    texto = modelo.format(**partes)
+    if texto not in _NOMES_SQL:
+        _NOMES_SQL[texto] = _NOMES_SQL.get(modelo, 'SQL_AVULSO')
+    return texto
 
 
 # --- Autenticação de usuário/admin ---
 def autenticar_admin(conn, cpf, nascimento):
     """
     Autentica um admin pelo CPF e data de nascimento (formato: YYYY-MM-DD).
-    Retorna o id_user_adm e nome do usuário se sucesso, ou None se falhar.
+    Retorna o id_user_adm e nome do usuário se sucesso, ou None se falhar
+    (inclusive com data em outro formato).
     """
-    sql = """
-        SELECT ua.id_user, ua.name_user, ua.cpf_user, ua.birth_date, adm.id_user_adm
-        FROM user_account ua
-        JOIN user_adm adm ON adm.user_account_id_user = ua.id_user
-        WHERE ua.cpf_user = :cpf AND TO_CHAR(ua.birth_date, 'YYYY-MM-DD') = :nasc
-    """
-    conn.cursor.execute(sql, {'cpf': cpf, 'nasc': nascimento})
-    row = conn.cursor.fetchone()
+    try:
+        inicio = datetime.strptime(nascimento, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+    with conn.cursor() as cursor:
+        cursor.execute(
+            SQL_AUTH_ADMIN,
+            {'cpf': cpf, 'inicio': inicio, 'fim': inicio + timedelta(days=1)},
+        )
+        row = cursor.fetchone()
     if row:
         return {
             'id_user': row[0],
@@ -83,18 +249,198 @@ def autenticar_admin(conn, cpf, nascimento):
         }
 
 
+def carregar_driver():
+    """
+    Importa o driver de banco configurado em DB_DRIVER.
+    Usa oracledb por padrão; 'fake' carrega o driver local de oracle_fake.py.
+    """
+    if os.environ.get('DB_DRIVER', '').strip().lower() == 'fake':
+        import oracle_fake
+
+        return oracle_fake
+    import oracledb
+
+    return oracledb
+
+
+# Custos acumulados por thread: idas ao banco, segundos em SQL e segundos
+# criando objetos FAQ (ver idas_ao_banco e custos_da_thread)
+_custos = threading.local()
+
+
+def idas_ao_banco():
+    """
+    Total de idas ao banco feitas pela thread atual: cada execute, executemany,
+    commit e rollback, e cada lote de fetch além do primeiro após um execute.
+    A diferença entre duas leituras dá o custo de uma requisição.
+    """
+    return getattr(_custos, 'idas', 0)
+
+
+def custos_da_thread():
+    """
+    Custos acumulados pela thread atual: idas ao banco, segundos em SQL
+    (execute + fetch) e segundos criando objetos FAQ. Como em idas_ao_banco(),
+    a diferença entre duas leituras dá o custo de um trecho.
+    """
+    return {
+        'idas': getattr(_custos, 'idas', 0),
+        'banco': getattr(_custos, 'banco', 0.0),
+        'modelos': getattr(_custos, 'modelos', 0.0),
+    }
+
+
+def _somar_custo(nome, valor):
+    setattr(_custos, nome, getattr(_custos, nome, 0) + valor)
+
+
+def _montar_faqs(linhas):
+    """Cria os objetos FAQ das linhas, somando o tempo gasto aos custos da thread."""
+    from models import FAQ
+
+    inicio = time.perf_counter()
+    faqs = [FAQ(*linha) for linha in linhas]
+    _somar_custo('modelos', time.perf_counter() - inicio)
+    return faqs
+
+
+class _CursorInstrumentado:
+    """
+    Cursor do driver por onde passa todo SQL deste módulo. Conta as idas ao
+    banco da thread (idas_ao_banco) e registra em estatisticas_sql, pelo nome
+    da constante SQL_*, tempo (execute + fetches), linhas e bytes de cada
+    execução.
+    """
+
+    def __init__(self, cursor):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_lotes', 0)
+        # [nome, forma dos binds, segundos, linhas buscadas, bytes, é DML]
+        object.__setattr__(self, '_atual', None)
+
+    def __getattr__(self, nome):
+        return getattr(self._cursor, nome)
+
+    def __setattr__(self, nome, valor):
+        setattr(self._cursor, nome, valor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._concluir()
+        self._cursor.close()
+        return False
+
+    def __iter__(self):
+        while True:
+            linhas = self.fetchmany()
+            if not linhas:
+                return
+            yield from linhas
+
+    def _concluir(self):
+        """Registra a execução em andamento (chamado no próximo execute ou no close)."""
+        atual = self._atual
+        if atual is None:
+            return
+        object.__setattr__(self, '_atual', None)
+        nome, forma, duracao, linhas, tamanho, dml = atual
+        if dml:
+            linhas = max(self._cursor.rowcount or 0, 0)
+        estatisticas_sql.registrar(nome, duracao, linhas, tamanho, forma)
+
+    def _executar(self, metodo, sql, parametros, lote, **kwargs):
+        self._concluir()
+        _somar_custo('idas', 1)
+        object.__setattr__(self, '_lotes', 0)
+        nome = _NOMES_SQL.get(sql, 'SQL_AVULSO')
+        forma = forma_binds(parametros, lote)
+        inicio = time.perf_counter()
+        try:
+            if parametros is None:
+                resultado = metodo(sql, **kwargs)
+            else:
+                resultado = metodo(sql, parametros, **kwargs)
+        except Exception:
+            duracao = time.perf_counter() - inicio
+            _somar_custo('banco', duracao)
+            estatisticas_sql.registrar(nome, duracao, 0, 0, forma)
+            raise
+        duracao = time.perf_counter() - inicio
+        _somar_custo('banco', duracao)
+        dml = lote or self._cursor.description is None
+        atual = [nome, forma, duracao, 0, 0, dml]
+        object.__setattr__(self, '_atual', atual)
+        return self if resultado is self._cursor else resultado
+
+    def execute(self, sql, parameters=None, **kwargs):
+        return self._executar(self._cursor.execute, sql, parameters, False, **kwargs)
+
+    def executemany(self, sql, parameters, **kwargs):
+        return self._executar(self._cursor.executemany, sql, parameters, True, **kwargs)
+
+    def _buscou(self, linhas, lotes, inicio):
+        duracao = time.perf_counter() - inicio
+        _somar_custo('banco', duracao)
+        atual = self._atual
+        if atual is not None:
+            atual[2] += duracao
+            atual[3] += len(linhas)
+            atual[4] += tamanho_linhas(linhas)
+        # O primeiro lote chega junto com o execute (prefetch)
+        extras = lotes - 1 if self._lotes == 0 else lotes
+        object.__setattr__(self, '_lotes', self._lotes + lotes)
+        if extras > 0:
+            _somar_custo('idas', extras)
+
+    def fetchone(self):
+        inicio = time.perf_counter()
+        linha = self._cursor.fetchone()
+        self._buscou(
+            [linha] if linha is not None else [], 1 if self._lotes == 0 else 0, inicio
+        )
+        return linha
+
+    def fetchmany(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        linhas = self._cursor.fetchmany(*args, **kwargs)
+        self._buscou(linhas, 1 if linhas else 0, inicio)
+        return linhas
+
+    def fetchall(self):
+        inicio = time.perf_counter()
+        linhas = self._cursor.fetchall()
+        lotes = max(1, -(-len(linhas) // self._cursor.arraysize))
+        self._buscou(linhas, lotes, inicio)
+        return linhas
+
+
 class OracleConnection:
-    def __init__(self, oracle_config, silent=False):
+    """
+    Conexão Oracle usada pelas funções deste módulo.
+    Abre uma conexão avulsa ou, quando `pool` é informado, faz checkout de uma
+    sessão do pool, devolvida em close().
+    """
+
+    def __init__(self, oracle_config=None, silent=False, pool=None):
         self.conn = None
-        self.cursor = None
+        self.pool = pool
         self.silent = silent
+        # Versões gravadas na transação corrente; após o commit vão para
+        # ao_confirmar_versoes (ver FaqDB.versao)
+        self.versoes_pendentes = []
+        self.ao_confirmar_versoes = None
         from config.settings import show_message
 
+        if pool is not None:
+            self.conn = pool.acquire()
+            return
+
         try:
-            import oracledb
+            driver = carregar_driver()
 
-            self.conn = oracledb.connect(**oracle_config)
-            self.cursor = self.conn.cursor()
+            self.conn = driver.connect(**oracle_config)
         except ImportError:
             show_message(
                 'oracledb não instalado. Instale com: pip install oracledb', 'error'
@@ -115,17 +461,35 @@ class OracleConnection:
         self.close(silent=True)
         return False
 
+    def cursor(self):
+        """Abre um cursor instrumentado (idas ao banco e estatisticas_sql)."""
+        return _CursorInstrumentado(self.conn.cursor())
+
+    def commit(self):
+        self._finalizar_transacao(self.conn.commit)
+        versoes, self.versoes_pendentes = self.versoes_pendentes, []
+        if versoes and self.ao_confirmar_versoes is not None:
+            self.ao_confirmar_versoes(versoes)
+
+    def rollback(self):
+        self.versoes_pendentes = []
+        self._finalizar_transacao(self.conn.rollback)
+
+    def _finalizar_transacao(self, metodo):
+        _somar_custo('idas', 1)
+        inicio = time.perf_counter()
+        try:
+            metodo()
+        finally:
+            _somar_custo('banco', time.perf_counter() - inicio)
+
     def close(self, silent=None):
         should_be_silent = self.silent if silent is None else silent
-        try:
-            if self.cursor:
-                self.cursor.close()
-                self.cursor = None
-        except Exception:
-            if not should_be_silent:
-                logging.warning(
-                    f'{COLOR_WARNING}Erro ao fechar o cursor.' + COLOR_RESET
-                )
+        if self.pool is not None:
+            if self.conn:
+                self.pool.release(self.conn)
+                self.conn = None
+            return
         try:
             if self.conn:
                 self.conn.close()
@@ -141,36 +505,148 @@ class OracleConnection:
                 )
 
 
-def adicionar(conn, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
+class OraclePool:
+    """
+    Pool de sessões Oracle (oracledb.create_pool) com tamanho configurável.
+    Registra quantos checkouts foram feitos e quanto tempo se esperou por uma
+    sessão livre, para dimensionar min/max sob carga.
+    """
+
+    def __init__(self, oracle_config, pool_config=None, silent=False):
+        from config.settings import POOL_CONFIG_PADRAO, show_message
+
+        self.config = {**POOL_CONFIG_PADRAO, **(pool_config or {})}
+        self.silent = silent
+        self.checkouts = 0
+        self.tempo_espera_total = 0.0
+        self.tempo_espera_max = 0.0
+        self._lock = threading.Lock()
+        try:
+            driver = carregar_driver()
+
+            self.pool = driver.create_pool(
+                **oracle_config,
+                min=self.config['min'],
+                max=self.config['max'],
+                increment=self.config['increment'],
+                getmode=driver.POOL_GETMODE_TIMEDWAIT,
+                wait_timeout=self.config['wait_timeout'],
+            )
+        except ImportError:
+            show_message(
+                'oracledb não instalado. Instale com: pip install oracledb', 'error'
+            )
+            raise
+        except Exception as e:
+            show_message(
+                '[ERRO] Não foi possível criar o pool de conexões Oracle.', 'error'
+            )
+            show_message(f'Detalhes: {e}', 'error')
+            raise
+
+    def acquire(self):
+        """Faz checkout de uma sessão, aguardando até wait_timeout (ms)."""
+        inicio = time.perf_counter()
+        conn = self.pool.acquire()
+        espera = time.perf_counter() - inicio
+        with self._lock:
+            self.checkouts += 1
+            self.tempo_espera_total += espera
+            if espera > self.tempo_espera_max:
+                self.tempo_espera_max = espera
+        return conn
+
+    def release(self, conn):
+        self.pool.release(conn)
+
+    def estatisticas(self):
+        """Retorna o estado atual do pool e as métricas de checkout."""
+        with self._lock:
+            checkouts = self.checkouts
+            espera_total = self.tempo_espera_total
+            espera_max = self.tempo_espera_max
+        return {
+            'min': self.config['min'],
+            'max': self.config['max'],
+            'increment': self.config['increment'],
+            'abertas': self.pool.opened,
+            'ocupadas': self.pool.busy,
+            'checkouts': checkouts,
+            'espera_total_ms': espera_total * 1000,
+            'espera_media_ms': (espera_total / checkouts * 1000) if checkouts else 0.0,
+            'espera_max_ms': espera_max * 1000,
+        }
+
+    def close(self, silent=None):
+        should_be_silent = self.silent if silent is None else silent
+        try:
+            self.pool.close(force=True)
+            if not should_be_silent:
+                logging.info(
+                    f'{COLOR_SUCCESS}Pool de conexões Oracle fechado com sucesso.'
+                    f'{COLOR_RESET}'
+                )
+        except Exception:
+            if not should_be_silent:
+                logging.warning(
+                    f'{COLOR_ERROR}Erro ao fechar o pool de conexões.' + COLOR_RESET
+                )
+
+
+def _validar_faq(pergunta, resposta, ativo, categoria):
+    """
+    Normaliza e valida os campos de um FAQ.
+    Retorna ((pergunta, resposta, ativo, categoria), erro), onde `erro` é a
+    mensagem do primeiro problema encontrado ou None.
+    """
     pergunta = pergunta.strip()
     resposta = resposta.strip()
     categoria = categoria.strip().upper()
+    valores = (pergunta, resposta, ativo, categoria)
     if ativo not in (0, 1):
-        raise ValueError(f'{COLOR_ERROR}ativo deve ser 0 ou 1{COLOR_RESET}')
+        return valores, 'ativo deve ser 0 ou 1'
     if len(pergunta) > MAX_PERGUNTA_LEN:
-        raise ValueError(
-            f'{COLOR_ERROR}pergunta excede {MAX_PERGUNTA_LEN} caracteres{COLOR_RESET}'
-        )
+        return valores, f'pergunta excede {MAX_PERGUNTA_LEN} caracteres'
     if len(resposta) > MAX_RESPOSTA_LEN:
-        raise ValueError(
-            f'{COLOR_ERROR}resposta excede {MAX_RESPOSTA_LEN} caracteres{COLOR_RESET}'
-        )
+        return valores, f'resposta excede {MAX_RESPOSTA_LEN} caracteres'
     if len(categoria) > MAX_CATEGORIA_LEN:
-        raise ValueError(
-            f'{COLOR_ERROR}categoria excede {MAX_CATEGORIA_LEN} caracteres{COLOR_RESET}'
-        )
+        return valores, f'categoria excede {MAX_CATEGORIA_LEN} caracteres'
+    return valores, None
+
+
+def _mensagem_erro_banco(msg):
+    """Traduz os erros Oracle mais comuns de escrita em mensagens amigáveis."""
+    if 'ORA-00001' in msg:
+        return 'Pergunta já cadastrada (violação de UNIQUE).'
+    if 'ORA-12899' in msg:
+        return 'Valor excede o tamanho permitido para a coluna (ORA-12899).'
+    return msg
+
+
+def adicionar(conn, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
+    """Insere um FAQ e retorna o id_faq gerado (ou False em caso de erro)."""
+    (pergunta, resposta, ativo, categoria), erro = _validar_faq(
+        pergunta, resposta, ativo, categoria
+    )
+    if erro:
+        raise ValueError(f'{COLOR_ERROR}{erro}{COLOR_RESET}')
     try:
-        conn.cursor.execute(
-            SQL_INSERT, (pergunta, resposta, ativo, categoria, user_adm_id_user_adm)
-        )
-        conn.conn.commit()
+        with conn.cursor() as cursor:
+            id_var = cursor.var(int)
+            cursor.execute(
+                SQL_INSERT_RETURNING,
+                (pergunta, resposta, ativo, categoria, user_adm_id_user_adm, id_var),
+            )
+            id_faq = id_var.getvalue()[0]
+            _incrementar_versao(conn, cursor)
+        conn.commit()
         from config.settings import show_message
 
         show_message('FAQ adicionada com sucesso!', 'success')
-        return True
+        return id_faq
     except Exception as e:
         if conn.conn:
-            conn.conn.rollback()
+            conn.rollback()
         msg = str(e)
         from config.settings import show_message
 
@@ -185,25 +661,330 @@ def adicionar(conn, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
         return False
 
 
-def listar(conn, categoria=None, limit=None):
-    from models import FAQ
+def adicionar_lote(conn, faqs, tamanho_lote=BATCH_SIZE):
+    """
+    Insere vários FAQs com array DML (executemany + batcherrors).
+
+    A validação de campos roda uma vez, antes de qualquer ida ao banco; as
+    linhas válidas são enviadas em lotes de `tamanho_lote`, com um commit por
+    lote. Uma linha com erro não interrompe as demais. Os id_faq gerados
+    voltam do próprio INSERT (RETURNING com array binding).
+
+    Args:
+        conn: OracleConnection.
+        faqs: Sequência de tuplas (pergunta, resposta, ativo, categoria,
+            user_adm_id_user_adm).
+        tamanho_lote (int): Linhas por executemany/commit.
+
+    Returns:
+        list: Um dicionário por linha, na ordem de entrada, com 'indice' e
+        'ok', mais 'id' (o id_faq gerado) ou 'erro' quando ok é False.
+    """
+    resultados = [{'indice': i, 'ok': True} for i in range(len(faqs))]
+    validas = []
+    for i, (pergunta, resposta, ativo, categoria, user_adm) in enumerate(faqs):
+        valores, erro = _validar_faq(pergunta, resposta, ativo, categoria)
+        if erro:
+            resultados[i] = {'indice': i, 'ok': False, 'erro': erro}
+        else:
+            validas.append((i, valores + (user_adm,)))
+
+    for inicio in range(0, len(validas), tamanho_lote):
+        lote = validas[inicio : inicio + tamanho_lote]
+        try:
+            with conn.cursor() as cursor:
+                ids = cursor.var(int, arraysize=len(lote))
+                cursor.setinputsizes(None, None, None, None, None, ids)
+                cursor.executemany(
+                    SQL_INSERT_RETURNING,
+                    [linha for _, linha in lote],
+                    batcherrors=True,
+                )
+                for erro in cursor.getbatcherrors():
+                    i = lote[erro.offset][0]
+                    resultados[i] = {
+                        'indice': i,
+                        'ok': False,
+                        'erro': _mensagem_erro_banco(erro.message),
+                    }
+                _incrementar_versao(conn, cursor)
+            conn.commit()
+            for offset, (i, _) in enumerate(lote):
+                if resultados[i]['ok']:
+                    resultados[i]['id'] = ids.getvalue(offset)[0]
+        except Exception as e:
+            if conn.conn:
+                conn.rollback()
+            for i, _ in lote:
+                resultados[i] = {
+                    'indice': i,
+                    'ok': False,
+                    'erro': _mensagem_erro_banco(str(e)),
+                }
+
+    from config.settings import show_message
+
+    inseridos = sum(1 for r in resultados if r['ok'])
+    show_message(
+        f'{inseridos} de {len(faqs)} FAQs adicionados em lote.',
+        'success' if inseridos == len(faqs) else 'warning',
+    )
+    return resultados
+
+
+def mesclar_lote(conn, faqs, user_adm_id_user_adm, simular=False):
+    """
+    Insere ou atualiza (MERGE pela pergunta) um lote de FAQs com array DML.
+
+    Uma consulta traz as linhas já existentes com as mesmas perguntas para
+    classificar cada FAQ como inserção, atualização ou ignorado (inválido ou
+    idêntico ao do banco). Só inserções e atualizações vão ao MERGE, em um
+    único executemany seguido de um commit. Com `simular`, apenas classifica.
+
+    Args:
+        conn: OracleConnection.
+        faqs: Sequência de tuplas (pergunta, resposta, ativo, categoria), no
+            máximo BATCH_SIZE, sem perguntas repetidas.
+        user_adm_id_user_adm: Usuário registrado nas linhas gravadas.
+        simular (bool): Não grava nada (dry-run).
+
+    Returns:
+        dict: 'inseridos', 'atualizados' e 'ignorados' (contagens), 'erros',
+        lista de (indice, mensagem) das linhas rejeitadas, e 'ids', os id_faq
+        gravados (os atualizados vêm da consulta inicial; os inseridos, de uma
+        consulta pelas perguntas após o MERGE, que não tem RETURNING).
+    """
+    resultado = {
+        'inseridos': 0,
+        'atualizados': 0,
+        'ignorados': 0,
+        'erros': [],
+        'ids': [],
+    }
+    validas = []
+    for i, (pergunta, resposta, ativo, categoria) in enumerate(faqs):
+        valores, erro = _validar_faq(pergunta, resposta, ativo, categoria)
+        if erro:
+            resultado['erros'].append((i, erro))
+        else:
+            validas.append((i, valores))
+    if not validas:
+        return resultado
 
     try:
-        if categoria:
-            categoria = categoria.strip().upper()
-            if limit:
-                conn.cursor.execute(
-                    SQL_SELECT_BY_CATEGORY_WITH_LIMIT, (categoria, limit)
+        with conn.cursor() as cursor:
+            perguntas = [valores[0] for _, valores in validas]
+            marcadores = ', '.join(f':{n}' for n in range(1, len(perguntas) + 1))
+            cursor.execute(
+                _formatar_sql(SQL_SELECT_BY_QUESTIONS, perguntas=marcadores), perguntas
+            )
+            existentes = {row[1]: (row[0], tuple(row[1:])) for row in cursor.fetchall()}
+
+            lote = []
+            for i, valores in validas:
+                atual = existentes.get(valores[0], (None, None))[1]
+                if atual == valores:
+                    resultado['ignorados'] += 1
+                    continue
+                lote.append((i, valores, 'atualizados' if atual else 'inseridos'))
+            if simular or not lote:
+                for _, _, tipo in lote:
+                    resultado[tipo] += 1
+                return resultado
+
+            cursor.executemany(
+                SQL_MERGE,
+                [
+                    {
+                        'pergunta': pergunta,
+                        'resposta': resposta,
+                        'ativo': ativo,
+                        'categoria': categoria,
+                        'usuario': user_adm_id_user_adm,
+                    }
+                    for _, (pergunta, resposta, ativo, categoria), _ in lote
+                ],
+                batcherrors=True,
+            )
+            falhas = {
+                erro.offset: _mensagem_erro_banco(erro.message)
+                for erro in cursor.getbatcherrors()
+            }
+            inseridas = [
+                valores[0]
+                for offset, (_, valores, tipo) in enumerate(lote)
+                if tipo == 'inseridos' and offset not in falhas
+            ]
+            if inseridas:
+                marcadores = ', '.join(f':{n}' for n in range(1, len(inseridas) + 1))
+                cursor.execute(
+                    _formatar_sql(SQL_SELECT_BY_QUESTIONS, perguntas=marcadores),
+                    inseridas,
                 )
-            else:
-                conn.cursor.execute(SQL_SELECT_BY_CATEGORY, (categoria,))
+                existentes.update(
+                    (row[1], (row[0], tuple(row[1:]))) for row in cursor.fetchall()
+                )
+            _incrementar_versao(conn, cursor)
+        conn.commit()
+    except Exception as e:
+        if conn.conn:
+            conn.rollback()
+        resultado['erros'].extend((i, _mensagem_erro_banco(str(e))) for i, _ in validas)
+        resultado['ignorados'] = 0
+        return resultado
+
+    for offset, (i, valores, tipo) in enumerate(lote):
+        if offset in falhas:
+            resultado['erros'].append((i, falhas[offset]))
         else:
-            if limit:
-                conn.cursor.execute(SQL_SELECT_WITH_LIMIT, (limit,))
+            resultado[tipo] += 1
+            resultado['ids'].append(existentes[valores[0]][0])
+    return resultado
+
+
+def _montar_filtros(categoria=None, ativo=None):
+    """Monta a cláusula WHERE e os binds para os filtros de categoria/ativo."""
+    filtros = []
+    binds = {}
+    if categoria:
+        filtros.append(SQL_FILTER_CATEGORY)
+        binds['categoria'] = categoria.strip().upper()
+    if ativo is not None:
+        filtros.append(SQL_FILTER_ACTIVE)
+        binds['ativo'] = ativo
+    return ' AND '.join(filtros) or '1 = 1', binds
+
+
+def listar_pagina(conn, categoria=None, ativo=None, offset=0, limit=None):
+    """
+    Retorna uma página de FAQs filtrada no banco e o total de linhas do filtro.
+
+    Args:
+        conn: OracleConnection.
+        categoria (str, optional): Filtra por categoria (sem diferenciar caixa).
+        ativo (int, optional): Filtra por status (0 ou 1).
+        offset (int): Quantidade de linhas a pular (ordem id_faq DESC).
+        limit (int, optional): Tamanho da página; None retorna todas.
+
+    Returns:
+        tuple: (lista de FAQ, total de linhas que atendem ao filtro).
+    """
+    filtros, binds = _montar_filtros(categoria, ativo)
+    sql = _formatar_sql(
+        SQL_SELECT_PAGE,
+        filtros=filtros,
+        fetch=SQL_FETCH_NEXT if limit is not None else '',
+    )
+    binds['offset'] = offset
+    if limit is not None:
+        binds['limit'] = limit
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(sql, binds)
+            rows = cursor.fetchall()
+            if rows:
+                total = rows[0][-1]
+            elif offset:
+                # Página além do fim: o total precisa de uma contagem própria
+                binds.pop('offset')
+                binds.pop('limit', None)
+                cursor.execute(_formatar_sql(SQL_COUNT, filtros=filtros), binds)
+                total = cursor.fetchone()[0]
             else:
-                conn.cursor.execute(SQL_SELECT_ALL)
-        rows = conn.cursor.fetchall()
-        perguntas = [FAQ(*row) for row in rows]
+                total = 0
+        return _montar_faqs(row[:-1] for row in rows), total
+    except Exception as e:
+        from config.settings import show_message
+
+        show_message('Erro ao listar FAQ: ' + str(e), 'error')
+        return [], 0
+
+
+def listar_apos(conn, cursor_id=None, limit=10, categoria=None, ativo=None):
+    """
+    Retorna até `limit` FAQs com id_faq menor que `cursor_id` (ordem id_faq DESC).
+    Sem `cursor_id`, retorna a primeira página. Usa o índice da chave primária,
+    então qualquer página custa o mesmo que a primeira.
+    """
+    filtros, binds = _montar_filtros(categoria, ativo)
+    if cursor_id is not None:
+        filtros = f'{SQL_FILTER_CURSOR} AND {filtros}'
+        binds['cursor'] = cursor_id
+    binds['n'] = limit
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(_formatar_sql(SQL_SELECT_AFTER, filtros=filtros), binds)
+            rows = cursor.fetchall()
+        return _montar_faqs(rows)
+    except Exception as e:
+        from config.settings import show_message
+
+        show_message('Erro ao listar FAQ: ' + str(e), 'error')
+        return []
+
+
+def versao(conn):
+    """
+    Retorna a versão dos FAQs, (última escrita, número da versão), lida da
+    tabela de versão (uma linha). Toda escrita de banco.py a incrementa, em
+    qualquer processo. Sem a tabela (migração pendente), (última
+    atualização, total de FAQs) da tabela FAQ; None em erro.
+    """
+    try:
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute(SQL_SELECT_VERSION)
+            except Exception as e:
+                if not str(e).startswith(_ERRO_TABELA_INEXISTENTE):
+                    raise
+                cursor.execute(SQL_SELECT_VERSION_FALLBACK)
+            row = cursor.fetchone()
+        return tuple(row) if row else None
+    except Exception as e:
+        from config.settings import show_message
+
+        show_message('Erro ao consultar versão dos FAQs: ' + str(e), 'error')
+        return None
+
+
+def _incrementar_versao(conn, cursor):
+    """
+    Incrementa a versão dos FAQs na transação corrente (antes do commit) e a
+    anota em conn.versoes_pendentes. Sem a tabela de versão a escrita segue
+    normalmente; a versão passa a vir da tabela FAQ (ver versao).
+    """
+    try:
+        numero = cursor.var(int)
+        cursor.execute(SQL_BUMP_VERSION, versao=numero)
+    except Exception as e:
+        if not str(e).startswith(_ERRO_TABELA_INEXISTENTE):
+            raise
+        return
+    conn.versoes_pendentes += numero.getvalue()
+
+
+def listar(conn, categoria=None, limit=None, ativo=None, offset=None):
+    if ativo is not None or offset is not None:
+        faqs, _ = listar_pagina(conn, categoria, ativo, offset or 0, limit)
+        return faqs
+
+    try:
+        with conn.cursor() as cursor:
+            if categoria:
+                categoria = categoria.strip().upper()
+                if limit:
+                    cursor.execute(
+                        SQL_SELECT_BY_CATEGORY_WITH_LIMIT, (categoria, limit)
+                    )
+                else:
+                    cursor.execute(SQL_SELECT_BY_CATEGORY, (categoria,))
+            else:
+                if limit:
+                    cursor.execute(SQL_SELECT_WITH_LIMIT, (limit,))
+                else:
+                    cursor.execute(SQL_SELECT_ALL)
+            rows = cursor.fetchall()
+        perguntas = _montar_faqs(rows)
         return perguntas
     except Exception as e:
         from config.settings import show_message
@@ -213,55 +994,33 @@ def listar(conn, categoria=None, limit=None):
 
 
 def atualizar(conn, id, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
-    pergunta = pergunta.strip()
-    resposta = resposta.strip()
-    categoria = categoria.strip().upper()
-    if ativo not in (0, 1):
-        raise ValueError((COLOR_ERROR + 'ativo deve ser 0 ou 1' + COLOR_RESET))
-    if len(pergunta) > MAX_PERGUNTA_LEN:
-        raise ValueError(
-            (
-                COLOR_ERROR
-                + 'pergunta excede '
-                + str(MAX_PERGUNTA_LEN)
-                + ' caracteres'
-                + COLOR_RESET
-            )
-        )
-    if len(resposta) > MAX_RESPOSTA_LEN:
-        raise ValueError(
-            (
-                COLOR_ERROR
-                + 'resposta excede '
-                + str(MAX_RESPOSTA_LEN)
-                + ' caracteres'
-                + COLOR_RESET
-            )
-        )
-    if len(categoria) > MAX_CATEGORIA_LEN:
-        raise ValueError(
-            (
-                COLOR_ERROR
-                + 'categoria excede '
-                + str(MAX_CATEGORIA_LEN)
-                + ' caracteres'
-                + COLOR_RESET
-            )
-        )
+    """
+    Atualiza o FAQ `id`. Retorna o número de linhas afetadas (0 se o ID não
+    existe), ou None se o banco recusar a alteração.
+    """
+    (pergunta, resposta, ativo, categoria), erro = _validar_faq(
+        pergunta, resposta, ativo, categoria
+    )
+    if erro:
+        raise ValueError(COLOR_ERROR + erro + COLOR_RESET)
     try:
-        conn.cursor.execute(
-            SQL_UPDATE, (pergunta, resposta, ativo, categoria, user_adm_id_user_adm, id)
-        )
-        rows_affected = conn.cursor.rowcount
-        conn.conn.commit()
+        with conn.cursor() as cursor:
+            cursor.execute(
+                SQL_UPDATE,
+                (pergunta, resposta, ativo, categoria, user_adm_id_user_adm, id),
+            )
+            rows_affected = cursor.rowcount
+            if rows_affected:
+                _incrementar_versao(conn, cursor)
+        conn.commit()
         from config.settings import show_message
 
         if rows_affected > 0:
             show_message(f'FAQ ID {id} atualizada com sucesso.', 'success')
-        return rows_affected > 0
+        return rows_affected
     except Exception as e:
         if conn.conn:
-            conn.conn.rollback()
+            conn.rollback()
         msg = str(e)
         from config.settings import show_message
 
@@ -273,38 +1032,178 @@ def atualizar(conn, id, pergunta, resposta, ativo, categoria, user_adm_id_user_a
             )
         else:
             show_message('Erro ao atualizar FAQ: ' + msg, 'error')
-        return False
+        return None
 
 
 def deletar(conn, id):
+    """
+    Remove o FAQ `id`. Retorna o número de linhas afetadas (0 se o ID não
+    existe), ou None em caso de erro no banco.
+    """
     try:
-        conn.cursor.execute(SQL_DELETE, (id,))
-        rows_affected = conn.cursor.rowcount
-        conn.conn.commit()
+        with conn.cursor() as cursor:
+            cursor.execute(SQL_DELETE, (id,))
+            rows_affected = cursor.rowcount
+            if rows_affected:
+                _incrementar_versao(conn, cursor)
+        conn.commit()
         from config.settings import show_message
 
         if rows_affected > 0:
             show_message(f'FAQ ID {id} deletada com sucesso.', 'success')
         else:
             show_message(f'FAQ ID {id} não encontrada para exclusão.', 'warning')
-        return rows_affected > 0
+        return rows_affected
     except Exception:
         if conn.conn:
-            conn.conn.rollback()
+            conn.rollback()
         from config.settings import show_message
 
         show_message('Erro ao deletar FAQ.', 'error')
-        return False
+        return None
 
 
-def buscar_por_id(conn, id):
-    from models import FAQ
+def _executar_por_ids(conn, sql, linhas, ids):
+    """
+    Executa um DML por id com executemany em uma única transação.
+    Retorna {'afetados': n, 'nao_encontrados': [ids]}, ou None em erro.
+    """
+    try:
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, linhas, arraydmlrowcounts=True)
+            contagens = cursor.getarraydmlrowcounts()
+            if any(contagens):
+                _incrementar_versao(conn, cursor)
+        conn.commit()
+        return {
+            'afetados': sum(contagens),
+            'nao_encontrados': [id for id, n in zip(ids, contagens) if n == 0],
+        }
+    except Exception as e:
+        if conn.conn:
+            conn.rollback()
+        from config.settings import show_message
+
+        show_message('Erro na operação em lote: ' + str(e), 'error')
+        return None
+
+
+def atualizar_status_lote(conn, ids, ativo, user_adm_id_user_adm):
+    """Define active_faq de vários FAQs de uma vez (array DML, um commit)."""
+    if ativo not in (0, 1):
+        raise ValueError(f'{COLOR_ERROR}ativo deve ser 0 ou 1{COLOR_RESET}')
+    linhas = [(ativo, user_adm_id_user_adm, id) for id in ids]
+    return _executar_por_ids(conn, SQL_UPDATE_ACTIVE, linhas, ids)
+
+
+def deletar_lote(conn, ids):
+    """Remove vários FAQs de uma vez (array DML, um commit)."""
+    return _executar_por_ids(conn, SQL_DELETE, [(id,) for id in ids], ids)
+
 
+def renomear_categoria(conn, atual, nova, user_adm_id_user_adm):
+    """
+    Renomeia uma categoria em todos os FAQs com um único UPDATE.
+    Retorna os id_faq alterados (RETURNING), ou None em caso de erro.
+    """
+    nova = nova.strip().upper()
+    if not nova or len(nova) > MAX_CATEGORIA_LEN:
+        raise ValueError(
+            f'{COLOR_ERROR}categoria deve ter de 1 a {MAX_CATEGORIA_LEN} '
+            f'caracteres{COLOR_RESET}'
+        )
     try:
-        conn.cursor.execute(SQL_SELECT_BY_ID, (id,))
-        row = conn.cursor.fetchone()
+        with conn.cursor() as cursor:
+            ids = cursor.var(int)
+            cursor.execute(
+                SQL_RENAME_CATEGORY,
+                {
+                    'nova': nova,
+                    'usuario': user_adm_id_user_adm,
+                    'atual': atual.strip(),
+                    'ids': ids,
+                },
+            )
+            alterados = ids.getvalue()
+            if alterados:
+                _incrementar_versao(conn, cursor)
+        conn.commit()
+        return alterados
+    except Exception as e:
+        if conn.conn:
+            conn.rollback()
+        from config.settings import show_message
+
+        show_message('Erro ao renomear categoria: ' + str(e), 'error')
+        return None
+
+
+def iterar_linhas(conn, arraysize=EXPORT_ARRAYSIZE, desde=None, faixa=None):
+    """
+    Percorre as linhas de SQL_SELECT_ALL em blocos de `arraysize`
+    (fetchmany), sem carregar a tabela inteira na memória.
+    Com `desde`, percorre só as linhas com faq_updated_at >= desde; com
+    `faixa` (inicio, fim), só os id_faq nesse intervalo fechado.
+    Gera tuplas na ordem das colunas de SQL_SELECT_ALL.
+    """
+    with conn.cursor() as cursor:
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = arraysize + 1
+        if faixa is not None:
+            cursor.execute(SQL_SELECT_ID_RANGE, {'inicio': faixa[0], 'fim': faixa[1]})
+        elif desde is None:
+            cursor.execute(SQL_SELECT_ALL)
+        else:
+            cursor.execute(SQL_SELECT_CHANGED_SINCE, {'desde': desde})
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
+
+def contar(conn):
+    """Retorna a quantidade total de FAQs na tabela."""
+    with conn.cursor() as cursor:
+        cursor.execute(_formatar_sql(SQL_COUNT, filtros='1 = 1'))
+        return cursor.fetchone()[0]
+
+
+def limites_ids(conn):
+    """Retorna (menor, maior) id_faq da tabela, ou (None, None) se vazia."""
+    with conn.cursor() as cursor:
+        cursor.execute(SQL_SELECT_ID_BOUNDS)
+        return tuple(cursor.fetchone())
+
+
+def listar_ids(conn, arraysize=EXPORT_ARRAYSIZE):
+    """Retorna o conjunto de todos os id_faq existentes."""
+    with conn.cursor() as cursor:
+        cursor.arraysize = arraysize
+        cursor.execute(SQL_SELECT_IDS)
+        return {row[0] for row in cursor}
+
+
+def listar_por_ids(conn, ids, tamanho_lote=BATCH_SIZE):
+    """Retorna os FAQs existentes entre `ids` (uma consulta IN por lote)."""
+    ids = list(ids)
+    faqs = []
+    with conn.cursor() as cursor:
+        for inicio in range(0, len(ids), tamanho_lote):
+            lote = ids[inicio : inicio + tamanho_lote]
+            marcadores = ', '.join(f':{n}' for n in range(1, len(lote) + 1))
+            cursor.execute(_formatar_sql(SQL_SELECT_BY_IDS, ids=marcadores), lote)
+            faqs.extend(_montar_faqs(cursor.fetchall()))
+    return faqs
+
+
+def buscar_por_id(conn, id):
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(SQL_SELECT_BY_ID, (id,))
+            row = cursor.fetchone()
         if row:
-            return FAQ(*row)
+            return _montar_faqs([row])[0]
         else:
             return None
     except Exception:
@@ -316,8 +1215,9 @@ def buscar_por_id(conn, id):
 
 def listar_categorias(conn):
     try:
-        conn.cursor.execute(SQL_SELECT_DISTINCT_CATEGORIES)
-        rows = conn.cursor.fetchall()
+        with conn.cursor() as cursor:
+            cursor.execute(SQL_SELECT_DISTINCT_CATEGORIES)
+            rows = cursor.fetchall()
         return [row[0] for row in rows]
     except Exception:
         from config.settings import show_message
@@ -326,6 +1226,60 @@ def listar_categorias(conn):
         return []
 
 
+def resumo_categorias(conn):
+    """
+    Retorna, por categoria e em ordem de nome, um dict com 'categoria',
+    'total', 'ativos' e 'atualizado_em' (última atualização), calculados
+    no banco com um único GROUP BY. Lista vazia em caso de erro.
+    """
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(SQL_SELECT_CATEGORY_SUMMARY)
+            rows = cursor.fetchall()
+        return [
+            {
+                'categoria': categoria,
+                'total': total,
+                'ativos': ativos,
+                'atualizado_em': atualizado_em,
+            }
+            for categoria, total, ativos, atualizado_em in rows
+        ]
+    except Exception as e:
+        from config.settings import show_message
+
+        show_message('Erro ao resumir categorias: ' + str(e), 'error')
+        return []
+
+
+# Marca uma linha cujo estado anterior não está em cache
+_LINHA_DESCONHECIDA = object()
+_CHAVES_LISTAGEM = ('listar', 'pagina', 'apos')
+
+
+def _normalizar_categoria(categoria):
+    return categoria.strip().upper() if categoria else None
+
+
+def _faqs_da_entrada(chave, valor):
+    """Retorna os FAQs contidos em uma entrada do cache de leituras."""
+    if chave[0] == 'id':
+        return [valor]
+    if chave[0] == 'pagina':
+        return valor[0]
+    if chave[0] in _CHAVES_LISTAGEM:
+        return valor
+    return []
+
+
+def _filtro_atende(chave, linha):
+    """Indica se uma linha (categoria, ativo) pertence ao filtro da listagem."""
+    categoria, ativo = chave[1], chave[2]
+    return (categoria is None or categoria == linha[0]) and (
+        ativo is None or ativo == linha[1]
+    )
+
+
 class FaqDB:
     def menu_crud(self):
         from config.settings import (
@@ -368,6 +1322,20 @@ class FaqDB:
                         )
                         ativo_str = input(PROMPT_ATIVO).strip()
                     ativo = int(ativo_str)
+                    similares, recusar = self.verificar_duplicata(pergunta)
+                    for faq, valor in similares:
+                        show_message(
+                            f'Pergunta parecida com o FAQ {faq.id} '
+                            f'"{faq.pergunta}" ({valor:.2f})',
+                            'warning',
+                        )
+                    if recusar:
+                        show_message(
+                            'FAQ não adicionado: já existe uma pergunta muito '
+                            'parecida.',
+                            'error',
+                        )
+                        continue
                     self.adicionar(
                         pergunta, resposta, ativo, categoria, user_adm_id_user_adm
                     )
@@ -423,9 +1391,41 @@ class FaqDB:
             else:
                 show_message('Opção inválida.', 'error')
 
-    def __init__(self, oracle_config, silent=False):
-        self.conn = OracleConnection(oracle_config, silent)
+    def __init__(
+        self, oracle_config, silent=False, pool_config=None, cache_config=None
+    ):
+        """
+        Args:
+            oracle_config: Dicionário com 'user', 'password' e 'dsn'.
+            silent: Suprime mensagens de conexão/fechamento.
+            pool_config: Se informado (min/max/increment/wait_timeout), usa um
+                pool de sessões em vez de uma conexão única.
+            cache_config: Se informado (max_entradas/ttl), guarda as leituras
+                em um cache LRU invalidado pelas escritas deste FaqDB. Escritas
+                de outros processos aparecem após o TTL ou na próxima
+                chamada de versao(), a que vier primeiro.
+        """
+        from cache import CacheLRU
+
         self.silent = silent
+        self.cache = None
+        if cache_config and cache_config.get('max_entradas'):
+            self.cache = CacheLRU(cache_config['max_entradas'], cache_config['ttl'])
+        self.pool = None
+        self.conn = None
+        if pool_config is not None:
+            self.pool = OraclePool(oracle_config, pool_config, silent)
+        else:
+            self.conn = OracleConnection(oracle_config, silent)
+            self.conn.ao_confirmar_versoes = self._anotar_versoes
+        self._local = threading.local()
+        self._ouvintes = []
+        # Última versão lida e as versões gravadas por este FaqDB desde então,
+        # para notar escritas de outros processos (ver versao)
+        self._versao_vista = None
+        self._versoes_proprias = set()
+        self._lock_versao = threading.Lock()
+        self._detector = None  # DetectorDuplicatas, criado no primeiro uso
 
     def __enter__(self):
         return self
@@ -434,28 +1434,448 @@ class FaqDB:
         self.close(silent=True)
         return False
 
-    def adicionar(self, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
-        return adicionar(
-            self.conn, pergunta, resposta, ativo, categoria, user_adm_id_user_adm
+    @contextmanager
+    def conexao(self):
+        """
+        Fornece a conexão da operação atual.
+        Sem pool, é sempre a conexão única. Com pool, reutiliza a sessão da
+        requisição aberta por abrir_sessao() (checkout na primeira operação)
+        ou faz checkout e devolução em torno desta operação.
+        """
+        if self.pool is None:
+            yield self.conn
+            return
+        atual = getattr(self._local, 'conn', None)
+        if atual is not None:
+            yield atual
+            return
+        conn = OracleConnection(silent=self.silent, pool=self.pool)
+        conn.ao_confirmar_versoes = self._anotar_versoes
+        if getattr(self._local, 'sessao', False):
+            self._local.conn = conn
+            yield conn
+            return
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def abrir_sessao(self):
+        """Inicia uma sessão (ex.: requisição HTTP) na thread atual."""
+        self._local.sessao = True
+
+    def encerrar_sessao(self):
+        """Encerra a sessão da thread atual, devolvendo a conexão ao pool."""
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        self._local.sessao = False
+        if conn is not None:
+            conn.close()
+
+    def estatisticas_pool(self):
+        """Retorna as métricas do pool, ou None no modo de conexão única."""
+        return self.pool.estatisticas() if self.pool else None
+
+    def estatisticas_cache(self):
+        """Retorna os contadores do cache de leituras, ou None se desativado."""
+        return self.cache.estatisticas() if self.cache else None
+
+    def estatisticas_sql(self):
+        """
+        Retorna as estatísticas por constante SQL_* (execuções, tempo total e
+        máximo, linhas, bytes) e as execuções lentas mais recentes.
+        """
+        return {
+            'limiar_lento_ms': estatisticas_sql.limiar_ms,
+            'consultas': estatisticas_sql.resumo(),
+            'lentas': estatisticas_sql.lentas(),
+        }
+
+    def _ler(self, chave, carregar, guardar_se=bool):
+        """
+        Leitura via cache (read-through). Resultados vazios não são guardados,
+        pois as funções do módulo também os retornam em caso de erro.
+        """
+        if self.cache is None:
+            return carregar()
+        valor = self.cache.obter(chave)
+        if valor is not None:
+            return valor
+        geracao = self.cache.geracao
+        valor = carregar()
+        if guardar_se(valor):
+            self.cache.guardar(chave, valor, geracao)
+        return valor
+
+    def _linha_em_cache(self, id):
+        """Procura (categoria, ativo) atuais do FAQ `id` nos resultados em cache."""
+        for chave, valor in self.cache.valores():
+            for faq in _faqs_da_entrada(chave, valor):
+                if faq.id == id:
+                    return faq.categoria, faq.ativo
+        return _LINHA_DESCONHECIDA
+
+    def _invalidar(self, id, antiga, nova):
+        """
+        Invalida apenas as entradas afetadas por uma escrita no FAQ `id`.
+        `antiga` e `nova` são (categoria, ativo) antes e depois da escrita
+        (None para inserção/remoção); com `antiga` desconhecida, todas as
+        listagens são invalidadas.
+        """
+
+        def afetada(chave, valor):
+            if chave[0] == 'id':
+                return chave[1] == id
+            # Toda escrita muda as contagens ou a última atualização
+            if chave[0] == 'resumo_categorias':
+                return True
+            if chave[0] == 'categorias':
+                if nova is not None and nova[0] not in valor:
+                    return True
+                return antiga is not None and (
+                    antiga is _LINHA_DESCONHECIDA
+                    or nova is None
+                    or antiga[0] != nova[0]
+                )
+            # Um novo id_faq é maior que todos: páginas após um cursor não mudam
+            if chave[0] == 'apos' and id is None and chave[3] is not None:
+                return False
+            if antiga is _LINHA_DESCONHECIDA:
+                return True
+            return any(
+                _filtro_atende(chave, linha)
+                for linha in (antiga, nova)
+                if linha is not None
+            )
+
+        self.cache.invalidar_se(afetada)
+
+    def _invalidar_categoria(self, atual, nova):
+        """Invalida o que uma renomeação de categoria pode ter alterado."""
+
+        def afetada(chave, valor):
+            if chave[0] == 'id':
+                return valor.categoria == atual
+            if chave[0] in ('categorias', 'resumo_categorias'):
+                return True
+            return chave[1] in (None, atual, nova)
+
+        self.cache.invalidar_se(afetada)
+
+    def ao_alterar(self, ouvinte):
+        """
+        Registra `ouvinte(tipo, ids)`, chamado após cada escrita bem-sucedida
+        deste FaqDB. `tipo` é EVENTO_GRAVADOS (linhas inseridas/alteradas) ou
+        EVENTO_REMOVIDOS; `ids` é a lista de id_faq afetados, ou None quando
+        a escrita pode ter tocado linhas não identificadas, e o ouvinte deve
+        reler o que precisar.
+        """
+        self._ouvintes.append(ouvinte)
+
+    def espelhar(self, estrutura):
+        """
+        Carrega em `estrutura` (objeto com carregar(faqs), adicionar(faq) e
+        remover(id), como um índice em memória) todos os FAQs e a mantém em
+        dia com as escritas deste FaqDB.
+        """
+
+        def aplicar(tipo, ids):
+            if ids is None:
+                estrutura.carregar(self.listar())
+            elif tipo == EVENTO_REMOVIDOS:
+                for id in ids:
+                    estrutura.remover(id)
+            else:
+                encontrados = self.listar_por_ids(ids)
+                for faq in encontrados:
+                    estrutura.adicionar(faq)
+                for id in set(ids) - {faq.id for faq in encontrados}:
+                    estrutura.remover(id)
+
+        estrutura.carregar(self.listar())
+        self.ao_alterar(aplicar)
+
+    def detector_duplicatas(self):
+        """
+        DetectorDuplicatas com as perguntas deste FaqDB, mantido em dia pelas
+        escritas (espelhar); criado no primeiro uso. None sem NumPy.
+        """
+        if self._detector is None:
+            try:
+                from similaridade import DetectorDuplicatas
+            except ImportError:
+                logging.warning(
+                    'NumPy não instalado: detecção de perguntas parecidas desativada'
+                )
+                return None
+            detector = DetectorDuplicatas()
+            self.espelhar(detector)
+            self._detector = detector
+        return self._detector
+
+    def verificar_duplicata(self, pergunta, rejeitar_acima=None):
+        """
+        Confere uma pergunta antes de inseri-la (API e menu): as perguntas
+        parecidas (SIMILARIDADE_TOP_K acima de SIMILARIDADE_LIMIAR) e se a
+        inserção deve ser recusada, quando a mais parecida atinge
+        `rejeitar_acima` (padrão: SIMILARIDADE_REJEITAR_ACIMA).
+
+        Returns:
+            tuple: ([(FAQ, similaridade)], recusar); ([], False) sem NumPy.
+        """
+        from config.settings import get_similaridade_config
+
+        detector = self.detector_duplicatas()
+        if detector is None:
+            return [], False
+        from similaridade import verificar_pergunta
+
+        config = get_similaridade_config()
+        if rejeitar_acima is None:
+            rejeitar_acima = config['rejeitar_acima']
+        return verificar_pergunta(
+            detector, pergunta, config['top_k'], config['limiar'], rejeitar_acima
         )
 
-    def listar(self, categoria=None, limit=None):
-        return listar(self.conn, categoria, limit)
+    def _notificar(self, tipo, ids):
+        for ouvinte in self._ouvintes:
+            try:
+                ouvinte(tipo, ids)
+            except Exception as e:
+                # Um ouvinte com falha não pode desfazer a escrita já feita
+                logging.warning(f'Falha ao notificar escrita ({tipo}): {e}')
+
+    def _registrar_escrita(self, id, antiga, nova):
+        """Invalida o que a escrita afeta no cache."""
+        if self.cache:
+            self._invalidar(id, antiga, nova)
+
+    def adicionar(self, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
+        with self.conexao() as conn:
+            sucesso = adicionar(
+                conn, pergunta, resposta, ativo, categoria, user_adm_id_user_adm
+            )
+        if sucesso:
+            self._registrar_escrita(
+                None, None, (_normalizar_categoria(categoria), ativo)
+            )
+            self._notificar(EVENTO_GRAVADOS, [sucesso])
+        return sucesso
+
+    def adicionar_lote(self, faqs, tamanho_lote=BATCH_SIZE):
+        with self.conexao() as conn:
+            resultados = adicionar_lote(conn, faqs, tamanho_lote)
+        novas = {
+            (_normalizar_categoria(faqs[r['indice']][3]), faqs[r['indice']][2])
+            for r in resultados
+            if r['ok']
+        }
+        for nova in novas:
+            self._registrar_escrita(None, None, nova)
+        if novas:
+            self._notificar(EVENTO_GRAVADOS, [r['id'] for r in resultados if r['ok']])
+        return resultados
+
+    def mesclar_lote(self, faqs, user_adm_id_user_adm, simular=False):
+        with self.conexao() as conn:
+            resultado = mesclar_lote(conn, faqs, user_adm_id_user_adm, simular)
+        if not simular and (resultado['inseridos'] or resultado['atualizados']):
+            # Um lote pode tocar qualquer categoria: descarta o cache inteiro
+            if self.cache:
+                self.cache.limpar()
+            self._notificar(EVENTO_GRAVADOS, resultado['ids'])
+        return resultado
+
+    def listar(self, categoria=None, limit=None, ativo=None, offset=None):
+        def carregar():
+            with self.conexao() as conn:
+                return listar(conn, categoria, limit, ativo, offset)
+
+        chave = ('listar', _normalizar_categoria(categoria), ativo, offset, limit)
+        return self._ler(chave, carregar)
+
+    def listar_pagina(self, categoria=None, ativo=None, offset=0, limit=None):
+        def carregar():
+            with self.conexao() as conn:
+                return listar_pagina(conn, categoria, ativo, offset, limit)
+
+        chave = ('pagina', _normalizar_categoria(categoria), ativo, offset, limit)
+        return self._ler(chave, carregar, guardar_se=lambda valor: bool(valor[0]))
+
+    def listar_apos(self, cursor_id=None, limit=10, categoria=None, ativo=None):
+        def carregar():
+            with self.conexao() as conn:
+                return listar_apos(conn, cursor_id, limit, categoria, ativo)
+
+        chave = ('apos', _normalizar_categoria(categoria), ativo, cursor_id, limit)
+        return self._ler(chave, carregar)
 
     def atualizar(self, id, pergunta, resposta, ativo, categoria, user_adm_id_user_adm):
-        return atualizar(
-            self.conn, id, pergunta, resposta, ativo, categoria, user_adm_id_user_adm
-        )
+        antiga = self._linha_em_cache(id) if self.cache else None
+        with self.conexao() as conn:
+            rows_affected = atualizar(
+                conn, id, pergunta, resposta, ativo, categoria, user_adm_id_user_adm
+            )
+        if rows_affected:
+            self._registrar_escrita(
+                id, antiga, (_normalizar_categoria(categoria), ativo)
+            )
+            self._notificar(EVENTO_GRAVADOS, [id])
+        return rows_affected
 
     def deletar(self, id):
-        return deletar(self.conn, id)
+        antiga = self._linha_em_cache(id) if self.cache else None
+        with self.conexao() as conn:
+            rows_affected = deletar(conn, id)
+        if rows_affected:
+            self._registrar_escrita(id, antiga, None)
+            self._notificar(EVENTO_REMOVIDOS, [id])
+        return rows_affected
+
+    def atualizar_status_lote(self, ids, ativo, user_adm_id_user_adm):
+        antigas = {id: self._linha_em_cache(id) for id in ids} if self.cache else {}
+        with self.conexao() as conn:
+            resultado = atualizar_status_lote(conn, ids, ativo, user_adm_id_user_adm)
+        if resultado and resultado['afetados']:
+            nao_encontrados = set(resultado['nao_encontrados'])
+            for id in ids:
+                if id in nao_encontrados:
+                    continue
+                antiga = antigas.get(id)
+                nova = (
+                    (antiga[0], ativo)
+                    if antiga not in (None, _LINHA_DESCONHECIDA)
+                    else None
+                )
+                self._registrar_escrita(id, antiga, nova)
+            self._notificar(
+                EVENTO_GRAVADOS, [id for id in ids if id not in nao_encontrados]
+            )
+        return resultado
+
+    def deletar_lote(self, ids):
+        antigas = {id: self._linha_em_cache(id) for id in ids} if self.cache else {}
+        with self.conexao() as conn:
+            resultado = deletar_lote(conn, ids)
+        if resultado and resultado['afetados']:
+            nao_encontrados = set(resultado['nao_encontrados'])
+            removidos = [id for id in ids if id not in nao_encontrados]
+            for id in removidos:
+                self._registrar_escrita(id, antigas.get(id), None)
+            self._notificar(EVENTO_REMOVIDOS, removidos)
+        return resultado
+
+    def renomear_categoria(self, atual, nova, user_adm_id_user_adm):
+        """Renomeia a categoria; retorna o número de FAQs alterados (ou None)."""
+        with self.conexao() as conn:
+            ids = renomear_categoria(conn, atual, nova, user_adm_id_user_adm)
+        if ids:
+            if self.cache:
+                self._invalidar_categoria(
+                    _normalizar_categoria(atual), _normalizar_categoria(nova)
+                )
+            self._notificar(EVENTO_GRAVADOS, ids)
+        return None if ids is None else len(ids)
+
+    def iterar_linhas(self, arraysize=EXPORT_ARRAYSIZE, desde=None, faixa=None):
+        with self.conexao() as conn:
+            yield from iterar_linhas(conn, arraysize, desde, faixa)
+
+    def limites_ids(self):
+        with self.conexao() as conn:
+            return limites_ids(conn)
+
+    def contar(self):
+        with self.conexao() as conn:
+            return contar(conn)
+
+    def listar_ids(self):
+        with self.conexao() as conn:
+            return listar_ids(conn)
+
+    def listar_por_ids(self, ids):
+        with self.conexao() as conn:
+            return listar_por_ids(conn, ids)
 
     def buscar_por_id(self, id):
-        return buscar_por_id(self.conn, id)
+        def carregar():
+            with self.conexao() as conn:
+                return buscar_por_id(conn, id)
+
+        return self._ler(('id', id), carregar)
+
+    def versao(self):
+        """
+        Versão dos FAQs, lida sempre do banco (uma linha pela chave), para
+        que escritas de outros processos mudem os ETags na hora. Se a versão
+        avançou por uma escrita que não foi deste FaqDB, o cache de leituras
+        é esvaziado: o ETag novo não acompanha um corpo antigo.
+        """
+        with self.conexao() as conn:
+            atual = versao(conn)
+        if atual is not None and self.cache is not None:
+            self._conferir_versao(atual)
+        return atual
+
+    def _anotar_versoes(self, versoes):
+        """Versões gravadas por este FaqDB (após o commit)."""
+        with self._lock_versao:
+            self._versoes_proprias.update(versoes)
+
+    def _conferir_versao(self, atual):
+        """Esvazia o cache se alguma versão desde a última lida veio de fora."""
+        with self._lock_versao:
+            anterior, self._versao_vista = self._versao_vista, atual
+            if anterior == atual:
+                return
+            # Na primeira leitura não se sabe o que o cache já viu: esvazia
+            novas = range(anterior[1] + 1, atual[1] + 1) if anterior else ()
+            proprias = self._versoes_proprias
+            self._versoes_proprias = {n for n in proprias if n > atual[1]}
+            # Sem a tabela de versão, atual[1] é a contagem de FAQs e as
+            # escritas não anotam versões: toda mudança esvazia o cache
+            if not novas or any(n not in proprias for n in novas):
+                self.cache.limpar()
 
     def listar_categorias(self):
-        return listar_categorias(self.conn)
+        def carregar():
+            with self.conexao() as conn:
+                return listar_categorias(conn)
+
+        return self._ler(('categorias',), carregar)
+
+    def resumo_categorias(self):
+        def carregar():
+            with self.conexao() as conn:
+                return resumo_categorias(conn)
+
+        return self._ler(('resumo_categorias',), carregar)
+
+    def autenticar_admin(self, cpf, nascimento):
+        with self.conexao() as conn:
+            return autenticar_admin(conn, cpf, nascimento)
+
+    def aplicar_esquema(self):
+        import esquema
+
+        with self.conexao() as conn:
+            return esquema.aplicar_esquema(conn)
+
+    def aplicar_indices(self):
+        import esquema
+
+        with self.conexao() as conn:
+            return esquema.aplicar_indices(conn)
+
+    def verificar_planos(self, exigir=True):
+        import esquema
+
+        with self.conexao() as conn:
+            return esquema.verificar_planos(conn, exigir)
 
     def close(self, silent=None):
         if self.conn:
             self.conn.close(silent)
+        if self.pool:
+            self.encerrar_sessao()
+            self.pool.close(silent)
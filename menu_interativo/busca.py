@@ -0,0 +1,166 @@
+"""
+Índice invertido em memória para a busca textual de FAQs (ranking BM25).
+Responde às consultas sem ir ao banco e é mantido em dia pelas escritas
+do FaqDB (FaqDB.espelhar).
+"""
+
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Palavras muito comuns em português, que não ajudam a ordenar os resultados
+STOPWORDS = frozenset(
+    'a o as os um uma uns umas de do da dos das em no na nos nas por pelo pela '
+    'pelos pelas para pra com sem e ou que se ao aos como mais mas nao ja sao '
+    'ser ter foi ha isso esse essa este esta eu voce meu minha seu sua'.split()
+)
+PESO_PERGUNTA = 2  # Termos da pergunta contam em dobro em relação à resposta
+
+_RE_TERMO = re.compile(r'\w+')
+
+
+def normalizar(texto):
+    """Remove acentos e converte para minúsculas ('Não É' -> 'nao e')."""
+    decomposto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def tokenizar(texto):
+    """Divide o texto normalizado em termos, sem stopwords."""
+    return [
+        termo
+        for termo in _RE_TERMO.findall(normalizar(texto))
+        if termo not in STOPWORDS
+    ]
+
+
+class IndiceBusca:
+    """
+    Índice invertido sobre pergunta e resposta dos FAQs, com ranking BM25.
+
+    Args:
+        k1 (float): Saturação da frequência do termo no BM25.
+        b (float): Peso da normalização pelo tamanho do documento.
+
+    Example:
+        >>> from models import FAQ
+        >>> indice = IndiceBusca()
+        >>> indice.carregar([FAQ(1, 'Como pago?', 'Com cartão.', 1, None, 'PAGAMENTO')])
+        >>> resultados, total = indice.buscar('cartao')
+        >>> [faq.id for faq, _ in resultados]
+        [1]
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._limpar()
+
+    def _limpar(self):
+        self._postings = {}  # termo -> {id_faq: frequência ponderada}
+        self._docs = {}  # id_faq -> (FAQ, tamanho, termos, categoria)
+        self._por_categoria = {}  # categoria -> ids, para o filtro de categoria
+        self._ativos = set()
+        self._tamanhos = {}  # id_faq -> tamanho, para a normalização BM25
+        self._tamanho_total = 0
+
+    def _indexar(self, faq):
+        frequencias = Counter()
+        for termo in tokenizar(faq.pergunta):
+            frequencias[termo] += PESO_PERGUNTA
+        frequencias.update(tokenizar(faq.resposta))
+        tamanho = sum(frequencias.values())
+        categoria = faq.categoria.strip().upper()
+        self._docs[faq.id] = (faq, tamanho, tuple(frequencias), categoria)
+        self._por_categoria.setdefault(categoria, set()).add(faq.id)
+        if faq.ativo == 1:
+            self._ativos.add(faq.id)
+        self._tamanhos[faq.id] = tamanho
+        self._tamanho_total += tamanho
+        for termo, frequencia in frequencias.items():
+            self._postings.setdefault(termo, {})[faq.id] = frequencia
+
+    def _desindexar(self, id):
+        doc = self._docs.pop(id, None)
+        if doc is None:
+            return
+        _, tamanho, termos, categoria = doc
+        self._por_categoria[categoria].discard(id)
+        self._ativos.discard(id)
+        del self._tamanhos[id]
+        self._tamanho_total -= tamanho
+        for termo in termos:
+            postings = self._postings[termo]
+            del postings[id]
+            if not postings:
+                del self._postings[termo]
+
+    def carregar(self, faqs):
+        """Reconstrói o índice a partir de uma lista completa de FAQs."""
+        with self._lock:
+            self._limpar()
+            for faq in faqs:
+                self._indexar(faq)
+
+    def adicionar(self, faq):
+        """Indexa um FAQ, substituindo a versão anterior do mesmo id."""
+        with self._lock:
+            self._desindexar(faq.id)
+            self._indexar(faq)
+
+    def remover(self, id):
+        """Remove um FAQ do índice, se presente."""
+        with self._lock:
+            self._desindexar(id)
+
+    def buscar(self, consulta, categoria=None, ativo=None, limite=10):
+        """
+        Retorna até `limite` pares (FAQ, pontuação), do mais para o menos
+        relevante, e o total de FAQs que casam com a consulta e os filtros.
+        """
+        termos = set(tokenizar(consulta))
+        categoria = categoria.strip().upper() if categoria else None
+        with self._lock:
+            total_docs = len(self._docs)
+            if not termos or not total_docs:
+                return [], 0
+            # A normalização pelo tamanho depende do tamanho médio, que muda a
+            # cada escrita; é calculada só para os documentos que casam
+            media = self._tamanho_total / total_docs
+            tamanhos = self._tamanhos
+            categoria_ids = self._por_categoria.get(categoria, set())
+            pontuacoes = {}
+            for termo in termos:
+                postings = self._postings.get(termo)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+                peso = idf * (self.k1 + 1)
+                for id, frequencia in postings.items():
+                    if categoria and id not in categoria_ids:
+                        continue
+                    if ativo is not None and (id in self._ativos) != (ativo == 1):
+                        continue
+                    norma = self.k1 * (1 - self.b + self.b * tamanhos[id] / media)
+                    pontuacoes[id] = pontuacoes.get(id, 0.0) + (
+                        peso * frequencia / (frequencia + norma)
+                    )
+            melhores = heapq.nlargest(
+                limite, pontuacoes.items(), key=lambda item: (item[1], item[0])
+            )
+            resultados = [(self._docs[id][0], pontuacao) for id, pontuacao in melhores]
+            return resultados, len(pontuacoes)
+
+    def estatisticas(self):
+        """Retorna o tamanho do índice."""
+        with self._lock:
+            return {
+                'documentos': len(self._docs),
+                'termos': len(self._postings),
+                'postings': sum(len(p) for p in self._postings.values()),
+            }
@@ -0,0 +1,116 @@
+"""
+Cache em memória com expiração (TTL) e descarte LRU para leituras do FaqDB.
+Thread-safe, com contadores de acertos/faltas/descartes para dimensionamento.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Cache LRU limitado por número de entradas, com TTL por entrada.
+
+    Args:
+        max_entradas (int): Quantidade máxima de entradas antes de descartar
+            a menos usada recentemente.
+        ttl (float): Tempo de vida de cada entrada, em segundos.
+
+    Example:
+        >>> cache = CacheLRU(max_entradas=2, ttl=60)
+        >>> cache.guardar('a', 1)
+        >>> cache.obter('a')
+        1
+    """
+
+    def __init__(self, max_entradas=1024, ttl=60.0):
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self.geracao = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expiradas = 0
+        self.invalidacoes = 0
+
+    def obter(self, chave, padrao=None):
+        """Retorna o valor da chave (marcando-a como recente) ou `padrao`."""
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.misses += 1
+                return padrao
+            valor, expira_em = entrada
+            if expira_em <= time.monotonic():
+                del self._entradas[chave]
+                self.expiradas += 1
+                self.misses += 1
+                return padrao
+            self._entradas.move_to_end(chave)
+            self.hits += 1
+            return valor
+
+    def guardar(self, chave, valor, geracao=None):
+        """
+        Armazena um valor. Se `geracao` for informada e alguma invalidação
+        ocorreu desde então, o valor (possivelmente obsoleto) é descartado.
+        """
+        with self._lock:
+            if geracao is not None and geracao != self.geracao:
+                return
+            self._entradas[chave] = (valor, time.monotonic() + self.ttl)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.evictions += 1
+
+    def invalidar(self, chave):
+        """Remove uma chave específica, se existir."""
+        with self._lock:
+            self.geracao += 1
+            if self._entradas.pop(chave, None) is not None:
+                self.invalidacoes += 1
+
+    def invalidar_se(self, predicado):
+        """Remove todas as entradas para as quais predicado(chave, valor) é True."""
+        with self._lock:
+            self.geracao += 1
+            remover = [
+                chave
+                for chave, (valor, _) in self._entradas.items()
+                if predicado(chave, valor)
+            ]
+            for chave in remover:
+                del self._entradas[chave]
+            self.invalidacoes += len(remover)
+
+    def valores(self):
+        """Retorna uma cópia dos pares (chave, valor) atualmente em cache."""
+        with self._lock:
+            return [(chave, valor) for chave, (valor, _) in self._entradas.items()]
+
+    def limpar(self):
+        """Remove todas as entradas."""
+        with self._lock:
+            self.geracao += 1
+            self.invalidacoes += len(self._entradas)
+            self._entradas.clear()
+
+    def estatisticas(self):
+        """Retorna os contadores do cache e a taxa de acerto."""
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                'entradas': len(self._entradas),
+                'max_entradas': self.max_entradas,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expiradas': self.expiradas,
+                'invalidacoes': self.invalidacoes,
+                'hit_ratio': self.hits / consultas if consultas else 0.0,
+            }
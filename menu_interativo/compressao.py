@@ -0,0 +1,129 @@
+"""
+Compressão das respostas da API por negociação de conteúdo (Accept-Encoding):
+gzip e, com o pacote brotli instalado, br. Corpos com ETag são comprimidos uma
+única vez por codificação e reaproveitados enquanto o ETag não mudar.
+"""
+
+import gzip
+import threading
+
+from cache import CacheLRU
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Tipos de conteúdo que valem a pena comprimir (texto)
+TIPOS_COMPRIMIVEIS = ('application/json', 'text/')
+
+
+def codificacoes_disponiveis():
+    """Codificações suportadas, da preferida para a menos preferida."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def comprimir(corpo, codificacao, nivel_gzip=6, nivel_brotli=5):
+    """
+    Comprime `corpo` (bytes) em 'gzip' ou 'br'. O gzip sai sem data no
+    cabeçalho (mtime=0), então o mesmo corpo gera sempre os mesmos bytes.
+
+    Example:
+        >>> import gzip
+        >>> gzip.decompress(comprimir(b'{"a":1}', 'gzip'))
+        b'{"a":1}'
+    """
+    if codificacao == 'br':
+        return brotli.compress(corpo, quality=nivel_brotli)
+    return gzip.compress(corpo, compresslevel=nivel_gzip, mtime=0)
+
+
+class CompressorRespostas:
+    """
+    Escolhe a codificação de cada resposta e guarda os corpos comprimidos
+    por (ETag, codificação) em um CacheLRU. Respostas sem ETag são
+    comprimidas a cada vez. Corpos abaixo de `min_bytes` seguem sem
+    compressão: o ganho não paga o custo.
+
+    Args:
+        min_bytes (int): Tamanho mínimo do corpo para comprimir.
+        nivel_gzip (int): Nível do gzip (1 a 9).
+        nivel_brotli (int): Qualidade do brotli (0 a 11).
+        max_entradas (int): Corpos comprimidos mantidos (0 desativa o cache).
+        ttl (float): Tempo de vida de cada corpo comprimido, em segundos.
+
+    Example:
+        >>> from werkzeug.http import parse_accept_header
+        >>> compressor = CompressorRespostas(min_bytes=10, max_entradas=8)
+        >>> compressor.comprimivel('application/json', 100)
+        True
+        >>> compressor.escolher(parse_accept_header('gzip, deflate'))
+        'gzip'
+        >>> compressor.escolher(parse_accept_header('gzip;q=0')) is None
+        True
+    """
+
+    def __init__(
+        self, min_bytes=1024, nivel_gzip=6, nivel_brotli=5, max_entradas=256, ttl=300.0
+    ):
+        self.min_bytes = min_bytes
+        self.nivel_gzip = nivel_gzip
+        self.nivel_brotli = nivel_brotli
+        self.codificacoes = codificacoes_disponiveis()
+        self.cache = CacheLRU(max_entradas, ttl) if max_entradas else None
+        self._lock = threading.Lock()
+        self.comprimidas = 0
+        self.reaproveitadas = 0
+        self.bytes_originais = 0
+        self.bytes_enviados = 0
+
+    def comprimivel(self, tipo, tamanho):
+        """Se um corpo deste tipo e tamanho seria comprimido para quem aceita."""
+        return (
+            tamanho >= self.min_bytes
+            and bool(tipo)
+            and tipo.startswith(TIPOS_COMPRIMIVEIS)
+        )
+
+    def escolher(self, aceitas):
+        """
+        Codificação a usar, ou None. `aceitas` é o Accept-Encoding lido pelo
+        werkzeug (request.accept_encodings), que respeita q=0 e preferências.
+        """
+        return aceitas.best_match(self.codificacoes)
+
+    def comprimir(self, corpo, codificacao, etag=None):
+        """Corpo comprimido, reaproveitado do cache quando há ETag."""
+        chave = (etag, codificacao)
+        comprimido = None
+        if etag is not None and self.cache is not None:
+            comprimido = self.cache.obter(chave)
+        reaproveitado = comprimido is not None
+        if not reaproveitado:
+            comprimido = comprimir(
+                corpo, codificacao, self.nivel_gzip, self.nivel_brotli
+            )
+            if etag is not None and self.cache is not None:
+                self.cache.guardar(chave, comprimido)
+        with self._lock:
+            if reaproveitado:
+                self.reaproveitadas += 1
+            else:
+                self.comprimidas += 1
+            self.bytes_originais += len(corpo)
+            self.bytes_enviados += len(comprimido)
+        return comprimido
+
+    def estatisticas(self):
+        """Compressões feitas, reaproveitadas e bytes antes/depois."""
+        entradas = self.cache.estatisticas()['entradas'] if self.cache else 0
+        with self._lock:
+            return {
+                'codificacoes': list(self.codificacoes),
+                'min_bytes': self.min_bytes,
+                'comprimidas': self.comprimidas,
+                'reaproveitadas': self.reaproveitadas,
+                'bytes_originais': self.bytes_originais,
+                'bytes_enviados': self.bytes_enviados,
+                'entradas': entradas,
+            }
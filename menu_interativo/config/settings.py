@@ -80,9 +80,187 @@ def get_oracle_config():
     }
 
 
+# Tamanho padrão do pool de sessões (wait_timeout em milissegundos)
+POOL_CONFIG_PADRAO = {'min': 2, 'max': 10, 'increment': 1, 'wait_timeout': 5000}
+
+
+# Função para obter configuração do pool de sessões Oracle
+def get_pool_config():
+    return {
+        chave: int(os.environ.get(f'DB_POOL_{chave.upper()}', padrao))
+        for chave, padrao in POOL_CONFIG_PADRAO.items()
+    }
+
+
+# Cache de leituras da API (ttl em segundos; max_entradas=0 desativa)
+CACHE_CONFIG_PADRAO = {'max_entradas': 1024, 'ttl': 30.0}
+
+
+# Função para obter configuração do cache de leituras
+def get_cache_config():
+    return {
+        'max_entradas': int(
+            os.environ.get('CACHE_MAX_ENTRADAS', CACHE_CONFIG_PADRAO['max_entradas'])
+        ),
+        'ttl': float(os.environ.get('CACHE_TTL', CACHE_CONFIG_PADRAO['ttl'])),
+    }
+
+
+# Cache das respostas já serializadas da API (GET /faqs, /categorias...),
+# descartado a cada escrita; max_entradas=0 desativa
+CACHE_RESPOSTAS_CONFIG_PADRAO = {'max_entradas': 256, 'ttl': 30.0}
+
+
+# Função para obter configuração do cache de respostas
+def get_cache_respostas_config():
+    return {
+        'max_entradas': int(
+            os.environ.get(
+                'RESPOSTAS_MAX_ENTRADAS', CACHE_RESPOSTAS_CONFIG_PADRAO['max_entradas']
+            )
+        ),
+        'ttl': float(
+            os.environ.get('RESPOSTAS_TTL', CACHE_RESPOSTAS_CONFIG_PADRAO['ttl'])
+        ),
+    }
+
+
+# Compressão das respostas da API (gzip; br com o pacote brotli). Corpos
+# menores que min_bytes seguem sem compressão; max_entradas corpos
+# comprimidos ficam guardados por ETag
+COMPRESSAO_CONFIG_PADRAO = {
+    'min_bytes': 1024,
+    'nivel_gzip': 6,
+    'nivel_brotli': 5,
+    'max_entradas': 256,
+}
+
+
+# Função para obter configuração da compressão (COMPRESSAO_ATIVA=0 desativa)
+def get_compressao_config():
+    return {
+        'ativa': os.environ.get('COMPRESSAO_ATIVA', '1') == '1',
+        **{
+            chave: int(os.environ.get(f'COMPRESSAO_{chave.upper()}', padrao))
+            for chave, padrao in COMPRESSAO_CONFIG_PADRAO.items()
+        },
+    }
+
+
+# Sessões de admin da API: tokens assinados com AUTH_SEGREDO e válidos por
+# ttl segundos. Sem AUTH_SEGREDO, cada processo sorteia o seu (os tokens não
+# sobrevivem a um reinício nem valem entre processos)
+AUTH_CONFIG_PADRAO = {'ttl': 3600.0}
+
+
+# Função para obter configuração das sessões de admin (AUTH_OBRIGATORIA=0
+# aceita escritas sem token, gravadas com o usuário do corpo ou o admin 1)
+def get_auth_config():
+    return {
+        'obrigatoria': os.environ.get('AUTH_OBRIGATORIA', '1') == '1',
+        'segredo': os.environ.get('AUTH_SEGREDO') or None,
+        'ttl': float(os.environ.get('AUTH_TTL', AUTH_CONFIG_PADRAO['ttl'])),
+    }
+
+
+# Feed de mudanças da API (GET /faqs/mudancas): escritas guardadas para
+# retomada pelo cursor, clientes esperando ao mesmo tempo, espera máxima do
+# long-poll e intervalo do keepalive do SSE (ambos em segundos). Cada cliente
+# prende uma thread de um servidor WSGI com threads, então o limite fica bem
+# abaixo do número de threads do servidor (scripts/servir_api.py, com gevent,
+# usa um limite maior)
+MUDANCAS_CONFIG_PADRAO = {
+    'max_entradas': 1000,
+    'max_clientes': 8,
+    'espera': 25.0,
+    'heartbeat': 15.0,
+}
+
+
+# Função para obter configuração do feed de mudanças
+def get_mudancas_config():
+    return {
+        chave: type(padrao)(os.environ.get(f'MUDANCAS_{chave.upper()}', padrao))
+        for chave, padrao in MUDANCAS_CONFIG_PADRAO.items()
+    }
+
+
+# Detecção de perguntas parecidas: similaridade mínima para relatar um FAQ
+# existente, quantos relatar (top_k) e a partir de qual similaridade recusar
+# a inserção (rejeitar_acima; None = nunca recusa)
+SIMILARIDADE_CONFIG_PADRAO = {'limiar': 0.5, 'top_k': 3, 'rejeitar_acima': None}
+
+
+# Função para obter configuração da detecção de perguntas parecidas
+def get_similaridade_config():
+    return {
+        'limiar': float(
+            os.environ.get('SIMILARIDADE_LIMIAR', SIMILARIDADE_CONFIG_PADRAO['limiar'])
+        ),
+        'top_k': int(
+            os.environ.get('SIMILARIDADE_TOP_K', SIMILARIDADE_CONFIG_PADRAO['top_k'])
+        ),
+        'rejeitar_acima': float(os.environ['SIMILARIDADE_REJEITAR_ACIMA'])
+        if os.environ.get('SIMILARIDADE_REJEITAR_ACIMA')
+        else SIMILARIDADE_CONFIG_PADRAO['rejeitar_acima'],
+    }
+
+
+# Threads (e sessões do pool) usadas pela exportação paralela; 1 = sequencial,
+# sem pool (a sessão do menu basta)
+EXPORT_WORKERS_PADRAO = 1
+
+
+# Função para obter a quantidade de threads da exportação
+def get_export_workers():
+    return max(1, int(os.environ.get('EXPORT_WORKERS', EXPORT_WORKERS_PADRAO)))
+
+
+# Execuções de SQL a partir deste tempo (ms, incluindo fetch) vão para o log
+# de consultas lentas
+SQL_LENTO_MS_PADRAO = 500
+
+
+# Função para obter o limiar do log de consultas lentas
+def get_sql_lento_ms():
+    return float(os.environ.get('SQL_LENTO_MS', SQL_LENTO_MS_PADRAO))
+
+
+# GET /metrics exige o token de admin das escritas; METRICAS_PUBLICAS=1 a
+# libera, para um coletor sem login em uma rede interna
+def get_metricas_publicas():
+    return os.environ.get('METRICAS_PUBLICAS') == '1'
+
+
 # Caminhos padrão
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 JSON_BANCO_PATH = os.path.join(BASE_DIR, 'json', 'banco', 'faq_export.json')
+NDJSON_BANCO_PATH = os.path.join(BASE_DIR, 'json', 'banco', 'faq_export.ndjson')
+DELTA_BANCO_PATH = os.path.join(BASE_DIR, 'json', 'banco', 'faq_export.delta.json')
+PERFIS_PATH = os.path.join(BASE_DIR, 'perfis')
+
+
+# Perfil das requisições da API (desligado por padrão). Com PERFIL_ATIVO=1,
+# são medidas as requisições de admin com o cabeçalho X-Perfil: 1 e uma fração
+# PERFIL_AMOSTRAGEM (0 a 1) das demais. Em PERFIL_DIR ficam no máximo
+# PERFIL_MAX_ARQUIVOS arquivos, somando até PERFIL_MAX_MB megabytes
+PERFIL_CONFIG_PADRAO = {'max_arquivos': 100, 'max_mb': 50.0}
+
+
+def get_perfil_config():
+    return {
+        'ativo': os.environ.get('PERFIL_ATIVO') == '1',
+        'amostragem': float(os.environ.get('PERFIL_AMOSTRAGEM', 0)),
+        'diretorio': os.environ.get('PERFIL_DIR', PERFIS_PATH),
+        'max_arquivos': int(
+            os.environ.get('PERFIL_MAX_ARQUIVOS', PERFIL_CONFIG_PADRAO['max_arquivos'])
+        ),
+        'max_bytes': int(
+            float(os.environ.get('PERFIL_MAX_MB', PERFIL_CONFIG_PADRAO['max_mb']))
+            * 1024
+            * 1024
+        ),
+    }
 
 
 # Mensagens padrão
@@ -93,6 +271,7 @@ WARNING = f'{Fore.YELLOW}Atenção!{Style.RESET_ALL}'
 # Mensagens de exportação/importação
 MSG_EXPORT_BANCO_OK = 'Exportação realizada com sucesso para {path}!'
 MSG_EXPORT_JSON_ERROR = 'Erro ao exportar para JSON: {erro}'
+MSG_IMPORT_JSON_ERROR = 'Erro ao importar do JSON: {erro}'
 
 # Strings de navegação e atalhos de menus
 MENU_BACK_KEYS_PRINCIPAL = '0/s para encerrar o programa'
@@ -0,0 +1,283 @@
+"""
+Migrações, índices exigidos pelas consultas de banco.py e verificação dos
+planos de execução. aplicar_esquema() aplica as migrações pendentes e cria os
+índices que faltam, e pode rodar a cada deploy; verificar_planos() roda
+EXPLAIN PLAN em cada constante SQL_* de banco.py e falha quando uma consulta
+quente cai em varredura completa (TABLE ACCESS FULL).
+
+Uso: python scripts/verificar_esquema.py [--aplicar]
+"""
+
+import banco
+from banco import FAQ_TABLE_NAME, VERSION_TABLE_NAME
+
+# Migrações, na ordem: (nome, consulta que devolve um número diferente de
+# zero quando a migração já está aplicada, comandos)
+MIGRACOES = (
+    # Versão dos FAQs lida pelos ETags da API (SQL_SELECT_VERSION)
+    (
+        VERSION_TABLE_NAME,
+        'SELECT COUNT(*) FROM user_tables '
+        f"WHERE table_name = '{VERSION_TABLE_NAME.upper()}'",
+        (
+            f'CREATE TABLE {VERSION_TABLE_NAME} ('
+            'id_versao NUMBER(1) PRIMARY KEY CHECK (id_versao = 1), '
+            'versao NUMBER NOT NULL, atualizado_em DATE NOT NULL)',
+            f'INSERT INTO {VERSION_TABLE_NAME} (id_versao, versao, atualizado_em) '
+            'VALUES (1, 0, SYSDATE)',
+        ),
+    ),
+    # faq_updated_at como DATE (era VARCHAR2): a exportação incremental
+    # compara e ordena datas (SQL_SELECT_CHANGED_SINCE). Os textos antigos
+    # são convertidos pelo formato da sessão (o do SYSDATE gravado como
+    # texto) ou ISO; os que não convertem recebem a data da migração.
+    # Requer Oracle 12.2+ (DEFAULT ... ON CONVERSION ERROR).
+    (
+        'faq_updated_at_date',
+        'SELECT COUNT(*) FROM user_tab_columns '
+        f"WHERE table_name = '{FAQ_TABLE_NAME.upper()}' "
+        "AND column_name = 'FAQ_UPDATED_AT' AND data_type = 'DATE'",
+        (
+            f'ALTER TABLE {FAQ_TABLE_NAME} '
+            'ADD faq_updated_at_novo DATE DEFAULT SYSDATE',
+            f'UPDATE {FAQ_TABLE_NAME} SET faq_updated_at_novo = COALESCE('
+            'TO_DATE(faq_updated_at DEFAULT NULL ON CONVERSION ERROR), '
+            'TO_DATE(SUBSTR(faq_updated_at, 1, 19) DEFAULT NULL ON CONVERSION ERROR, '
+            "'YYYY-MM-DD HH24:MI:SS'), SYSDATE)",
+            f'ALTER TABLE {FAQ_TABLE_NAME} DROP COLUMN faq_updated_at',
+            f'ALTER TABLE {FAQ_TABLE_NAME} '
+            'RENAME COLUMN faq_updated_at_novo TO faq_updated_at',
+            f'ALTER TABLE {FAQ_TABLE_NAME} MODIFY faq_updated_at NOT NULL',
+        ),
+    ),
+)
+
+# Índices exigidos: (nome, tabela, colunas)
+INDICES = (
+    # Filtro por categoria sem diferenciar maiúsculas (SQL_SELECT_BY_CATEGORY*,
+    # SQL_RENAME_CATEGORY)
+    ('idx_faq_categ_up', FAQ_TABLE_NAME, 'UPPER(category_faq)'),
+    # Listagens por categoria e status já na ordem de id_faq (SQL_SELECT_PAGE,
+    # SQL_SELECT_AFTER, SQL_COUNT)
+    (
+        'idx_faq_categ_ativo_id',
+        FAQ_TABLE_NAME,
+        'UPPER(category_faq), active_faq, id_faq',
+    ),
+    # Exportação incremental (SQL_SELECT_CHANGED_SINCE)
+    ('idx_faq_atualizado', FAQ_TABLE_NAME, 'faq_updated_at'),
+    # Junção da autenticação de admin (SQL_AUTH_ADMIN)
+    ('idx_user_adm_conta', 'user_adm', 'user_account_id_user'),
+)
+
+# Consultas que leem a tabela inteira (ou quase) por natureza: listagem
+# completa, exportação e resumos. Nelas a varredura completa é um plano
+# aceitável; todas as outras constantes SQL_* são tratadas como quentes.
+CONSULTAS_DE_VARREDURA = frozenset(
+    {
+        'SQL_SELECT_ALL',
+        'SQL_SELECT_WITH_LIMIT',
+        'SQL_SELECT_IDS',
+        'SQL_SELECT_ID_BOUNDS',
+        # Janela do watermark: o otimizador pode preferir a varredura quando
+        # a janela é grande (ou, no driver falso, para evitar a ordenação)
+        'SQL_SELECT_CHANGED_SINCE',
+        'SQL_SELECT_DISTINCT_CATEGORIES',
+        'SQL_SELECT_CATEGORY_SUMMARY',
+        # Só sem a tabela de versão: MAX e COUNT sobre a tabela FAQ
+        'SQL_SELECT_VERSION_FALLBACK',
+    }
+)
+
+# Trechos de SQL (não são consultas) montados dentro dos modelos
+_FRAGMENTOS = ('SQL_FILTER_', 'SQL_FETCH_')
+
+# Os modelos são verificados com os filtros de categoria e status, como nas
+# listagens da API; só com o status a consulta lê a maior parte da tabela
+_FILTROS = f'{banco.SQL_FILTER_CATEGORY} AND {banco.SQL_FILTER_ACTIVE}'
+_PARTES = {
+    'filtros': _FILTROS,
+    'fetch': banco.SQL_FETCH_NEXT,
+    'ids': ':1, :2, :3',
+    'perguntas': ':1, :2, :3',
+}
+_FILTROS_POR_CONSULTA = {
+    'SQL_SELECT_AFTER': f'{_FILTROS} AND {banco.SQL_FILTER_CURSOR}',
+}
+
+SQL_LIST_INDEXES = 'SELECT index_name FROM user_indexes'
+SQL_EXPLAIN_PLAN = "EXPLAIN PLAN SET STATEMENT_ID = '{id}' FOR {sql}"
+SQL_SELECT_PLAN = """
+    SELECT operation, options, object_name FROM plan_table
+    WHERE statement_id = :id
+    ORDER BY id
+"""
+SQL_DELETE_PLAN = 'DELETE FROM plan_table WHERE statement_id = :id'
+
+# Erros de CREATE INDEX que significam que o índice já existe: nome em uso
+# (outro processo criou antes) e mesmas colunas já indexadas com outro nome
+_ERROS_INDICE_EXISTENTE = ('ORA-00955', 'ORA-01408')
+
+
+class VarreduraCompletaError(Exception):
+    """
+    Consultas quentes cujo plano tem varredura completa (ou que não puderam
+    ser explicadas). `resultados` traz a verificação de todas as consultas.
+    """
+
+    def __init__(self, resultados):
+        self.resultados = resultados
+        falhas = [r['consulta'] for r in resultados if not r['ok']]
+        super().__init__(
+            'Consultas quentes sem acesso por índice: ' + ', '.join(falhas)
+        )
+
+
+def consultas():
+    """
+    Gera (nome, texto SQL) de cada constante SQL_* de banco.py, com os
+    modelos ({filtros}, {ids}...) preenchidos. Trechos como SQL_FILTER_* ficam
+    de fora.
+    """
+    for nome, valor in vars(banco).items():
+        if (
+            not nome.startswith('SQL_')
+            or not isinstance(valor, str)
+            or nome.startswith(_FRAGMENTOS)
+        ):
+            continue
+        filtros = _FILTROS_POR_CONSULTA.get(nome, _FILTROS)
+        yield nome, valor.format(**{**_PARTES, 'filtros': filtros})
+
+
+def aplicar_migracoes(conn):
+    """
+    Aplica as migrações de MIGRACOES ainda pendentes, na ordem. Retorna os
+    nomes aplicados (lista vazia se nada mudou), ou None em caso de erro.
+    """
+    try:
+        aplicadas = []
+        with conn.cursor() as cursor:
+            for nome, consulta, comandos in MIGRACOES:
+                cursor.execute(consulta)
+                if cursor.fetchone()[0]:
+                    continue
+                for comando in comandos:
+                    cursor.execute(comando)
+                aplicadas.append(nome)
+        conn.commit()
+        return aplicadas
+    except Exception as e:
+        if conn.conn:
+            conn.rollback()
+        from config.settings import show_message
+
+        show_message('Erro ao aplicar migrações: ' + str(e), 'error')
+        return None
+
+
+def aplicar_esquema(conn):
+    """
+    Aplica as migrações pendentes e cria os índices que faltam. Retorna os
+    nomes das migrações e índices aplicados, ou None em caso de erro.
+    """
+    migracoes = aplicar_migracoes(conn)
+    if migracoes is None:
+        return None
+    indices = aplicar_indices(conn)
+    if indices is None:
+        return None
+    return migracoes + indices
+
+
+def indices_existentes(conn):
+    """Nomes (em maiúsculas) dos índices do usuário conectado."""
+    with conn.cursor() as cursor:
+        cursor.execute(SQL_LIST_INDEXES)
+        return {row[0].upper() for row in cursor.fetchall()}
+
+
+def aplicar_indices(conn):
+    """
+    Cria os índices de INDICES que ainda não existem; pode rodar quantas
+    vezes for preciso. Retorna os nomes criados (lista vazia se nada mudou),
+    ou None em caso de erro.
+    """
+    try:
+        existentes = indices_existentes(conn)
+        criados = []
+        with conn.cursor() as cursor:
+            for nome, tabela, colunas in INDICES:
+                if nome.upper() in existentes:
+                    continue
+                try:
+                    cursor.execute(f'CREATE INDEX {nome} ON {tabela} ({colunas})')
+                except Exception as e:
+                    if str(e).startswith(_ERROS_INDICE_EXISTENTE):
+                        continue
+                    raise
+                criados.append(nome)
+        conn.commit()
+        return criados
+    except Exception as e:
+        from config.settings import show_message
+
+        show_message('Erro ao aplicar índices: ' + str(e), 'error')
+        return None
+
+
+def explicar(conn, sql, statement_id):
+    """
+    Plano de execução de `sql` via EXPLAIN PLAN: lista de tuplas
+    (operação, opções, objeto) na ordem do plan_table.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(SQL_EXPLAIN_PLAN.format(id=statement_id, sql=sql))
+        cursor.execute(SQL_SELECT_PLAN, {'id': statement_id})
+        plano = [tuple(row) for row in cursor.fetchall()]
+        cursor.execute(SQL_DELETE_PLAN, {'id': statement_id})
+    return plano
+
+
+def verificar_planos(conn, exigir=True):
+    """
+    Roda EXPLAIN PLAN em cada consulta de consultas() e retorna, por
+    consulta, um dict com 'consulta', 'quente', 'plano', 'varreduras'
+    (tabelas lidas por inteiro), 'erro' e 'ok'. INSERT ... VALUES não lê
+    tabelas e fica de fora.
+
+    Com `exigir`, lança VarreduraCompletaError se alguma consulta quente
+    (fora de CONSULTAS_DE_VARREDURA) tiver TABLE ACCESS FULL no plano ou não
+    puder ser explicada.
+    """
+    resultados = []
+    for numero, (nome, sql) in enumerate(consultas(), 1):
+        if sql.lstrip().upper().startswith('INSERT'):
+            continue
+        quente = nome not in CONSULTAS_DE_VARREDURA
+        erro = None
+        try:
+            plano = explicar(conn, sql, f'faq_esquema_{numero}')
+        except Exception as e:
+            plano, erro = [], str(e)
+        varreduras = sorted(
+            {
+                objeto
+                for operacao, opcoes, objeto in plano
+                if operacao == 'TABLE ACCESS' and opcoes == 'FULL'
+            }
+        )
+        resultados.append(
+            {
+                'consulta': nome,
+                'quente': quente,
+                'plano': plano,
+                'varreduras': varreduras,
+                'erro': erro,
+                'ok': erro is None and not (quente and varreduras),
+            }
+        )
+    conn.commit()
+    if exigir and not all(r['ok'] for r in resultados):
+        raise VarreduraCompletaError(resultados)
+    return resultados
@@ -0,0 +1,142 @@
+"""
+Estatísticas das execuções de SQL por constante (SQL_SELECT_ALL, SQL_UPDATE...)
+e log de consultas lentas. Alimentado pelo cursor instrumentado de banco.py,
+por onde passa todo SQL do sistema.
+"""
+
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+
+MAX_LENTAS = 50  # Consultas lentas mais recentes mantidas para consulta
+
+logger = logging.getLogger('banco.sql')
+
+
+def forma_binds(parametros, lote=False):
+    """
+    Descreve os binds sem os valores: tipos por posição ou por nome.
+    Listas longas de um só tipo (IN) viram '(n x tipo)'. No executemany
+    (`lote`), inclui a quantidade de linhas.
+
+    Example:
+        >>> forma_binds({'cpf': '123', 'nasc': None})
+        'cpf=str, nasc=None'
+        >>> forma_binds([(1, 'a'), (2, 'b')], lote=True)
+        '2 x (int, str)'
+        >>> forma_binds(list(range(500)))
+        '(500 x int)'
+    """
+    if lote:
+        parametros = list(parametros)
+        primeira = forma_binds(parametros[0]) if parametros else ''
+        return f'{len(parametros)} x {primeira}'
+    if parametros is None:
+        return ''
+    if isinstance(parametros, dict):
+        return ', '.join(f'{nome}={_tipo(valor)}' for nome, valor in parametros.items())
+    tipos = [_tipo(valor) for valor in parametros]
+    if len(tipos) > 3 and len(set(tipos)) == 1:
+        return f'({len(tipos)} x {tipos[0]})'
+    return '(' + ', '.join(tipos) + ')'
+
+
+def _tipo(valor):
+    return 'None' if valor is None else type(valor).__name__
+
+
+def tamanho_linhas(linhas):
+    """Bytes aproximados das linhas buscadas (texto pelo tamanho, demais 8)."""
+    return sum(
+        len(valor) if isinstance(valor, (str, bytes)) else 8
+        for linha in linhas
+        for valor in linha
+        if valor is not None
+    )
+
+
+class EstatisticasSQL:
+    """
+    Acumula, por nome de SQL, execuções, tempo total e máximo, linhas e bytes.
+    Execuções acima de `limiar_ms` vão para o log 'banco.sql' (WARNING) e
+    para a lista de lentas recentes, com a forma dos binds mas sem os valores.
+
+    Args:
+        limiar_ms (float): Tempo a partir do qual a execução é considerada lenta.
+
+    Example:
+        >>> estatisticas = EstatisticasSQL(limiar_ms=100)
+        >>> estatisticas.registrar('SQL_SELECT_BY_ID', 0.002, 1, 120, '(int)')
+        >>> estatisticas.resumo()[0]['execucoes']
+        1
+    """
+
+    def __init__(self, limiar_ms=500.0):
+        self.limiar_ms = limiar_ms
+        self._lock = threading.Lock()
+        self._por_sql = {}  # nome -> [execucoes, segundos, max, linhas, bytes, lentas]
+        self._lentas = deque(maxlen=MAX_LENTAS)
+
+    def registrar(self, nome, duracao, linhas, tamanho, forma):
+        """Registra uma execução (duração em segundos, incluindo os fetches)."""
+        lenta = duracao * 1000 >= self.limiar_ms
+        with self._lock:
+            acumulado = self._por_sql.get(nome)
+            if acumulado is None:
+                acumulado = self._por_sql[nome] = [0, 0.0, 0.0, 0, 0, 0]
+            acumulado[0] += 1
+            acumulado[1] += duracao
+            if duracao > acumulado[2]:
+                acumulado[2] = duracao
+            acumulado[3] += linhas
+            acumulado[4] += tamanho
+            if lenta:
+                acumulado[5] += 1
+                self._lentas.append(
+                    {
+                        'sql': nome,
+                        'ms': round(duracao * 1000, 3),
+                        'linhas': linhas,
+                        'binds': forma,
+                        'em': datetime.now().isoformat(timespec='seconds'),
+                    }
+                )
+        if lenta:
+            logger.warning(
+                'SQL lento: %s em %.1f ms, %d linhas, binds (%s)',
+                nome,
+                duracao * 1000,
+                linhas,
+                forma,
+            )
+
+    def resumo(self):
+        """Estatísticas por SQL, da que consumiu mais tempo para a que menos."""
+        with self._lock:
+            itens = [(nome, list(valores)) for nome, valores in self._por_sql.items()]
+        itens.sort(key=lambda item: item[1][1], reverse=True)
+        return [
+            {
+                'sql': nome,
+                'execucoes': execucoes,
+                'tempo_total_ms': round(segundos * 1000, 3),
+                'tempo_medio_ms': round(segundos * 1000 / execucoes, 3),
+                'tempo_max_ms': round(maximo * 1000, 3),
+                'linhas': linhas,
+                'bytes': tamanho,
+                'lentas': lentas,
+            }
+            for nome, (execucoes, segundos, maximo, linhas, tamanho, lentas) in itens
+        ]
+
+    def lentas(self):
+        """Execuções lentas recentes (até MAX_LENTAS), da mais antiga à mais nova."""
+        with self._lock:
+            return list(self._lentas)
+
+    def limpar(self):
+        """Zera as estatísticas e a lista de lentas."""
+        with self._lock:
+            self._por_sql.clear()
+            self._lentas.clear()
@@ -1,18 +1,230 @@
 """
 Módulo consolidado de exportação/importação de FAQs para o sistema FAQ.
-Inclui funções para exportar FAQs do banco Oracle para arquivos JSON.
+Inclui funções para exportar FAQs do banco Oracle para arquivos JSON e para
+importá-los de volta.
 """
 
+import heapq
+import itertools
 import json
 import os
+import queue
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
+from banco import BATCH_SIZE, EXPORT_ARRAYSIZE
 from config.settings import (
+    DELTA_BANCO_PATH,
     JSON_BANCO_PATH,
     MSG_EXPORT_BANCO_OK,
     MSG_EXPORT_JSON_ERROR,
+    MSG_IMPORT_JSON_ERROR,
+    NDJSON_BANCO_PATH,
+    get_export_workers,
+    get_similaridade_config,
     show_message,
 )
 
+# Formatos de exportação suportados
+FORMATO_JSON = 'json'  # Array JSON indentado (formato histórico)
+FORMATO_NDJSON = 'ndjson'  # Um objeto JSON compacto por linha
+
+# Faixas de id_faq por thread na exportação paralela: faixas menores
+# equilibram a carga quando os ids têm buracos
+FAIXAS_POR_WORKER = 4
+# Blocos de EXPORT_ARRAYSIZE linhas que cada faixa pode ter lidos e ainda não
+# gravados: limita a memória a workers x BLOCOS_POR_FAIXA blocos
+BLOCOS_POR_FAIXA = 2
+# Fim de uma faixa na fila da exportação paralela
+_FIM_FAIXA = object()
+
+# Modos da exportação incremental
+MODO_SNAPSHOT = 'snapshot'  # Mescla as alterações no arquivo completo
+MODO_DELTA = 'delta'  # Grava só as alterações e remoções
+
+# A exportação incremental relê as linhas desde (watermark - SOBREPOSICAO):
+# faq_updated_at é o SYSDATE do comando, então uma transação que só fez
+# commit depois da leitura do watermark pode ter datas anteriores a ele
+SOBREPOSICAO_WATERMARK = timedelta(minutes=5)
+
+
+def linha_para_dict(row):
+    """Converte uma linha de SQL_SELECT_ALL no dicionário exportado."""
+    return {
+        'id': row[0],
+        'pergunta': row[1],
+        'resposta': row[2],
+        'ativo': row[3],
+        'atualizado_em': str(row[4]),
+        'categoria': row[5],
+    }
+
+
+def escrever_atomico(caminho, escrever):
+    """
+    Grava um arquivo de forma atômica: `escrever(arquivo)` escreve em um
+    temporário no mesmo diretório, que só então substitui `caminho`.
+    Leitores nunca veem um arquivo parcial. Retorna o valor de `escrever`.
+    """
+    diretorio = os.path.dirname(caminho)
+    os.makedirs(diretorio, exist_ok=True)
+    fd, temporario = tempfile.mkstemp(
+        dir=diretorio, prefix='.' + os.path.basename(caminho), suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            resultado = escrever(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+        return resultado
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+def escrever_json(f, itens):
+    """
+    Escreve os itens (dicionários) como array JSON, um de cada vez.
+    A saída é idêntica a json.dump(lista, indent=4, ensure_ascii=False).
+    Retorna a quantidade de itens escritos.
+    """
+    total = 0
+    for item in itens:
+        texto = json.dumps(item, ensure_ascii=False, indent=4)
+        f.write(
+            ('[\n    ' if total == 0 else ',\n    ') + texto.replace('\n', '\n    ')
+        )
+        total += 1
+    f.write('\n]' if total else '[]')
+    return total
+
+
+def escrever_ndjson(f, itens):
+    """Escreve os itens em NDJSON. Retorna a quantidade de itens escritos."""
+    total = 0
+    for item in itens:
+        f.write(json.dumps(item, ensure_ascii=False))
+        f.write('\n')
+        total += 1
+    return total
+
+
+def _ler_array_json(f, tamanho_bloco):
+    """Gera os objetos de um array JSON lendo o arquivo em blocos."""
+    decoder = json.JSONDecoder()
+    buffer = f.read(tamanho_bloco).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError('O arquivo não contém um array JSON')
+    pos = 1
+    fim_arquivo = False
+    while True:
+        # Pula separadores, lendo mais do arquivo quando o bloco acaba
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buffer) or fim_arquivo:
+                break
+            buffer, pos = f.read(tamanho_bloco), 0
+            fim_arquivo = not buffer
+        if pos >= len(buffer):
+            raise ValueError('Array JSON incompleto')
+        if buffer[pos] == ']':
+            return
+        try:
+            item, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Objeto cortado no fim do bloco: junta com o próximo bloco
+            bloco = f.read(tamanho_bloco)
+            if not bloco:
+                raise
+            buffer, pos = buffer[pos:] + bloco, 0
+            continue
+        yield item
+
+
+def ler_itens(caminho, tamanho_bloco=1 << 16):
+    """
+    Lê incrementalmente os itens de um arquivo exportado, seja array JSON
+    ou NDJSON, sem carregá-lo inteiro na memória.
+    """
+    with open(caminho, encoding='utf-8') as f:
+        inicio = f.read(1)
+        while inicio.isspace():
+            inicio = f.read(1)
+        f.seek(0)
+        if inicio == '[':
+            yield from _ler_array_json(f, tamanho_bloco)
+        else:
+            for linha in f:
+                if linha.strip():
+                    yield json.loads(linha)
+
+
+def dividir_faixas(menor, maior, partes):
+    """
+    Divide o intervalo [menor, maior] de id_faq em até `partes` faixas
+    fechadas (inicio, fim) de tamanho igual, da maior para a menor.
+    """
+    largura = -(-(maior - menor + 1) // partes)
+    return [
+        (max(menor, fim - largura + 1), fim)
+        for fim in range(maior, menor - 1, -largura)
+    ]
+
+
+def caminho_watermark(caminho):
+    """Arquivo de watermark associado a um arquivo exportado."""
+    return caminho + '.watermark'
+
+
+def ler_watermark(caminho):
+    """Lê o watermark de `caminho`, ou None se ainda não existe."""
+    try:
+        with open(caminho_watermark(caminho), encoding='utf-8') as f:
+            dados = json.load(f)
+    except FileNotFoundError:
+        return None
+    return {
+        'atualizado_em': datetime.fromisoformat(dados['atualizado_em']),
+        'ids': set(dados['ids']),
+    }
+
+
+def _como_data(valor):
+    """faq_updated_at como datetime (a coluna pode ser texto antes da migração)."""
+    if isinstance(valor, datetime):
+        return valor
+    return datetime.fromisoformat(str(valor).strip())
+
+
+def gravar_watermark(caminho, atualizado_em, ids):
+    """Grava (atomicamente) o watermark de `caminho`."""
+    dados = {
+        'atualizado_em': _como_data(atualizado_em).isoformat(sep=' '),
+        'ids': sorted(ids, reverse=True),
+    }
+    escrever_atomico(caminho_watermark(caminho), lambda f: json.dump(dados, f))
+
+
+class _Rastreador:
+    """Acompanha os ids e o maior faq_updated_at das linhas que passam por ele."""
+
+    def __init__(self, atualizado_em=None, ids=None):
+        self.atualizado_em = atualizado_em
+        self.ids = set() if ids is None else ids
+
+    def acompanhar(self, linhas):
+        for row in linhas:
+            self.ids.add(row[0])
+            if self.atualizado_em is None or row[4] > self.atualizado_em:
+                self.atualizado_em = row[4]
+            yield row
+
 
 class MenuExportacao:
     """Classe responsável pela exportação de dados do sistema FAQ."""
@@ -26,42 +238,365 @@ class MenuExportacao:
         """
         self.db = db
 
-    def exportar_json(self):
+    def _gravar_watermark(self, caminho, rastreador):
+        """
+        Grava o watermark de uma exportação já concluída. Uma falha aqui não
+        desfaz a exportação: só avisa, e a próxima exportação relê mais linhas.
+        """
+        try:
+            gravar_watermark(caminho, rastreador.atualizado_em, rastreador.ids)
+        except Exception as e:
+            show_message(
+                f'Watermark não gravado ({e}). Se faq_updated_at ainda não é '
+                'DATE, rode scripts/verificar_esquema.py --aplicar.',
+                'warning',
+            )
+
+    def _ler_faixa(self, faixa, fila, cancelado):
         """
-        Exporta todos os FAQs do banco Oracle para um arquivo JSON.
-        O arquivo é salvo em json/banco/faq_export.json.
+        Lê uma faixa de id_faq (em uma sessão do pool) e a entrega na `fila`
+        em blocos de EXPORT_ARRAYSIZE linhas, seguidos de _FIM_FAIXA (ou da
+        exceção, em caso de erro). Com a fila cheia, espera o consumidor;
+        para quando `cancelado` é sinalizado.
         """
+
+        def entregar(item):
+            while not cancelado.is_set():
+                try:
+                    fila.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
         try:
-            # Buscar todos os FAQs do banco
-            faqs = self.db.listar()
+            linhas = self.db.iterar_linhas(faixa=faixa)
+            try:
+                while True:
+                    bloco = list(itertools.islice(linhas, EXPORT_ARRAYSIZE))
+                    if not bloco:
+                        break
+                    if not entregar(bloco):
+                        return
+            finally:
+                linhas.close()
+        except Exception as e:
+            entregar(e)
+            return
+        entregar(_FIM_FAIXA)
 
-            if not faqs:
+    def _linhas_em_paralelo(self, workers):
+        """
+        Gera as linhas de SQL_SELECT_ALL (id_faq DESC) buscando faixas de
+        id_faq em `workers` threads, cada uma com sua sessão do pool.
+        As faixas são entregues em ordem; cada uma é lida em streaming para
+        uma fila de até BLOCOS_POR_FAIXA blocos, então a memória não depende
+        do tamanho das faixas.
+        """
+        menor, maior = self.db.limites_ids()
+        if menor is None:
+            return
+        faixas = iter(dividir_faixas(menor, maior, workers * FAIXAS_POR_WORKER))
+        cancelado = threading.Event()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def iniciar(faixa):
+                fila = queue.Queue(maxsize=BLOCOS_POR_FAIXA)
+                executor.submit(self._ler_faixa, faixa, fila, cancelado)
+                return fila
+
+            pendentes = deque(
+                iniciar(faixa) for faixa in itertools.islice(faixas, workers)
+            )
+            try:
+                while pendentes:
+                    fila = pendentes.popleft()
+                    # Faixas disjuntas e decrescentes: concatenar mantém a ordem
+                    while True:
+                        bloco = fila.get()
+                        if bloco is _FIM_FAIXA:
+                            break
+                        if isinstance(bloco, Exception):
+                            raise bloco
+                        yield from bloco
+                    faixa = next(faixas, None)
+                    if faixa is not None:
+                        pendentes.append(iniciar(faixa))
+            finally:
+                # Libera as threads que esperam espaço nas filas
+                cancelado.set()
+
+    def exportar_json(self, formato=FORMATO_JSON, caminho=None, workers=None):
+        """
+        Exporta todos os FAQs do banco Oracle para um arquivo JSON ou NDJSON.
+        As linhas são lidas em blocos (fetchmany) e escritas direto no arquivo,
+        então a memória usada não depende do tamanho da tabela. O arquivo é
+        substituído atomicamente ao final.
+
+        Com mais de um worker (e um FaqDB com pool), as faixas de id_faq são
+        lidas em paralelo, cada uma em sua própria sessão. As sessões não
+        compartilham um mesmo instante de leitura: escritas concorrentes
+        podem aparecer em umas faixas e não em outras.
+
+        Args:
+            formato (str): FORMATO_JSON (json/banco/faq_export.json) ou
+                FORMATO_NDJSON (json/banco/faq_export.ndjson).
+            caminho (str, optional): Caminho de saída alternativo.
+            workers (int, optional): Threads de leitura. Padrão: EXPORT_WORKERS.
+        """
+        if caminho is None:
+            caminho = (
+                NDJSON_BANCO_PATH if formato == FORMATO_NDJSON else JSON_BANCO_PATH
+            )
+        escrever = escrever_ndjson if formato == FORMATO_NDJSON else escrever_json
+        if workers is None:
+            workers = get_export_workers()
+        if workers > 1 and self.db.pool is None:
+            # Uma conexão única não pode ser usada por várias threads
+            workers = 1
+        try:
+            if workers > 1:
+                linhas = self._linhas_em_paralelo(workers)
+            else:
+                linhas = self.db.iterar_linhas()
+            primeira = next(linhas, None)
+
+            if primeira is None:
+                linhas.close()
                 show_message('Nenhum FAQ encontrado no banco para exportar.', 'warning')
                 return
 
-            # Converter objetos FAQ para dicionários
-            faqs_dict = []
-            for faq in faqs:
-                faq_data = {
-                    'id': faq.id,
-                    'pergunta': faq.pergunta,
-                    'resposta': faq.resposta,
-                    'ativo': faq.ativo,
-                    'atualizado_em': str(faq.atualizado_em),
-                    'categoria': faq.categoria,
-                }
-                faqs_dict.append(faq_data)
+            rastreador = _Rastreador()
+            linhas = rastreador.acompanhar(itertools.chain([primeira], linhas))
+            total = escrever_atomico(
+                caminho, lambda f: escrever(f, map(linha_para_dict, linhas))
+            )
+        except Exception as e:
+            show_message(MSG_EXPORT_JSON_ERROR.format(erro=str(e)), 'error')
+            return
+
+        # Exibir mensagem de sucesso
+        show_message(MSG_EXPORT_BANCO_OK.format(path=caminho), 'success')
+        show_message(f'Total de {total} FAQs exportados.', 'info')
+
+        # Base para as próximas exportações incrementais deste arquivo
+        self._gravar_watermark(caminho, rastreador)
 
-            # Garantir que o diretório existe
-            os.makedirs(os.path.dirname(JSON_BANCO_PATH), exist_ok=True)
+    def exportar_incremental(self, modo=MODO_SNAPSHOT, formato=FORMATO_JSON):
+        """
+        Exporta apenas o que mudou desde a última exportação.
+
+        Usa o watermark gravado ao lado do arquivo (maior faq_updated_at e ids
+        conhecidos) para buscar só as linhas alteradas, relendo também as de
+        SOBREPOSICAO_WATERMARK antes dele: uma transação com commit posterior
+        à exportação anterior pode ter datas anteriores a ela. Remoções são
+        detectadas comparando um COUNT(*) com o esperado; só quando ele difere
+        a lista de ids é consultada. Sem watermark, faz uma exportação completa.
+
+        Args:
+            modo (str): MODO_SNAPSHOT mescla as alterações no arquivo completo
+                (JSON_BANCO_PATH/NDJSON_BANCO_PATH); MODO_DELTA grava apenas
+                as alterações e remoções em DELTA_BANCO_PATH.
+            formato (str): Formato do snapshot (FORMATO_JSON ou FORMATO_NDJSON).
+        """
+        if modo == MODO_DELTA:
+            caminho = DELTA_BANCO_PATH
+        else:
+            caminho = (
+                NDJSON_BANCO_PATH if formato == FORMATO_NDJSON else JSON_BANCO_PATH
+            )
+        try:
+            watermark = ler_watermark(caminho)
+            if watermark is None or (
+                modo == MODO_SNAPSHOT and not os.path.exists(caminho)
+            ):
+                if modo == MODO_SNAPSHOT:
+                    show_message('Sem exportação anterior; exportando tudo.', 'info')
+                    self.exportar_json(formato)
+                    return
+                watermark = {'atualizado_em': None, 'ids': set()}
 
-            # Salvar no arquivo JSON
-            with open(JSON_BANCO_PATH, 'w', encoding='utf-8') as f:
-                json.dump(faqs_dict, f, ensure_ascii=False, indent=4)
+            desde = watermark['atualizado_em']
+            conhecidos = watermark['ids']
+            rastreador = _Rastreador(desde, set(conhecidos))
+            inicio = None if desde is None else desde - SOBREPOSICAO_WATERMARK
+            linhas = self.db.iterar_linhas(desde=inicio)
+            alterados = [linha_para_dict(row) for row in rastreador.acompanhar(linhas)]
+            novos = sum(1 for item in alterados if item['id'] not in conhecidos)
 
-            # Exibir mensagem de sucesso
-            show_message(MSG_EXPORT_BANCO_OK.format(path=JSON_BANCO_PATH), 'success')
-            show_message(f'Total de {len(faqs_dict)} FAQs exportados.', 'info')
+            # Só lista os ids do banco se a contagem indicar remoções
+            removidos = set()
+            if self.db.contar() != len(conhecidos) + novos:
+                removidos = conhecidos - self.db.listar_ids()
+                rastreador.ids -= removidos
+
+            if modo == MODO_DELTA:
+                delta = {
+                    'desde': str(desde) if desde else None,
+                    'ate': str(rastreador.atualizado_em),
+                    'alterados': alterados,
+                    'removidos': sorted(removidos, reverse=True),
+                }
+                escrever_atomico(
+                    caminho, lambda f: json.dump(delta, f, ensure_ascii=False, indent=4)
+                )
+            elif alterados or removidos:
+                ignorar = removidos | {item['id'] for item in alterados}
+                anteriores = (
+                    item for item in ler_itens(caminho) if item['id'] not in ignorar
+                )
+                escrever = (
+                    escrever_ndjson if formato == FORMATO_NDJSON else escrever_json
+                )
+                # Ambos em ordem de id_faq DESC: a mescla mantém a ordem
+                itens = heapq.merge(anteriores, alterados, key=lambda item: -item['id'])
+                escrever_atomico(caminho, lambda f: escrever(f, itens))
 
         except Exception as e:
             show_message(MSG_EXPORT_JSON_ERROR.format(erro=str(e)), 'error')
+            return
+
+        show_message(MSG_EXPORT_BANCO_OK.format(path=caminho), 'success')
+        show_message(
+            f'{len(alterados)} FAQs alterados e {len(removidos)} removidos '
+            'desde a última exportação.',
+            'info',
+        )
+        self._gravar_watermark(caminho, rastreador)
+
+    def importar_json(
+        self,
+        caminho=JSON_BANCO_PATH,
+        user_adm_id_user_adm=1,
+        simular=False,
+        tamanho_lote=BATCH_SIZE,
+    ):
+        """
+        Importa um arquivo exportado (array JSON ou NDJSON) para o banco.
+
+        O arquivo é lido incrementalmente e enviado em lotes de
+        `tamanho_lote`: cada lote custa uma consulta e um MERGE com array
+        binding (um commit por lote). Os FAQs são identificados pela pergunta,
+        já que id_faq é gerado pelo banco; linhas idênticas às do banco,
+        inválidas ou com pergunta repetida no arquivo são ignoradas.
+
+        Args:
+            caminho (str): Arquivo a importar. Padrão: JSON_BANCO_PATH.
+            user_adm_id_user_adm (int): Usuário registrado nas linhas gravadas.
+            simular (bool): Apenas relata o que seria feito (dry-run).
+            tamanho_lote (int): FAQs por ida ao banco.
+
+        Returns:
+            dict: Contagens 'inseridos', 'atualizados' e 'ignorados' e a lista
+            'erros' de (posição no arquivo, mensagem); None em caso de falha.
+        """
+        total = {'inseridos': 0, 'atualizados': 0, 'ignorados': 0, 'erros': []}
+        vistas = set()
+
+        def enviar(lote):
+            resultado = self.db.mesclar_lote(
+                [faq for _, faq in lote], user_adm_id_user_adm, simular
+            )
+            for chave in ('inseridos', 'atualizados', 'ignorados'):
+                total[chave] += resultado[chave]
+            total['erros'].extend((lote[i][0], erro) for i, erro in resultado['erros'])
+
+        try:
+            lote = []
+            for posicao, item in enumerate(ler_itens(caminho)):
+                try:
+                    faq = (
+                        item['pergunta'],
+                        item['resposta'],
+                        item['ativo'],
+                        item['categoria'],
+                    )
+                except (KeyError, TypeError):
+                    faq = None
+                if faq is None or not all(isinstance(faq[c], str) for c in (0, 1, 3)):
+                    total['erros'].append((posicao, 'item sem os campos de um FAQ'))
+                    continue
+                pergunta = faq[0].strip()
+                if pergunta in vistas:
+                    total['ignorados'] += 1
+                    continue
+                vistas.add(pergunta)
+                lote.append((posicao, faq))
+                if len(lote) == tamanho_lote:
+                    enviar(lote)
+                    lote = []
+            if lote:
+                enviar(lote)
+        except Exception as e:
+            show_message(MSG_IMPORT_JSON_ERROR.format(erro=str(e)), 'error')
+            return None
+
+        show_message(
+            f'{"Simulação: " if simular else ""}{total["inseridos"]} inseridos, '
+            f'{total["atualizados"]} atualizados, {total["ignorados"]} ignorados, '
+            f'{len(total["erros"])} com erro.',
+            'success' if not total['erros'] else 'warning',
+        )
+        for posicao, erro in total['erros'][:10]:
+            show_message(f'Item {posicao}: {erro}', 'warning')
+        return total
+
+    def verificar_similares(self, caminho=JSON_BANCO_PATH, limiar=None):
+        """
+        Relata as perguntas de um arquivo a importar que são parecidas com
+        perguntas já cadastradas (mas não idênticas, que viram atualizações).
+        Todas as perguntas do arquivo são comparadas com as do banco de uma
+        vez, em multiplicações de matrizes (requer NumPy).
+
+        Args:
+            caminho (str): Arquivo a verificar (array JSON ou NDJSON).
+            limiar (float, optional): Similaridade mínima. Padrão:
+                SIMILARIDADE_LIMIAR.
+
+        Returns:
+            list: Tuplas (posição no arquivo, pergunta, [(FAQ, similaridade)]);
+            None se a verificação não pôde ser feita.
+        """
+        try:
+            from similaridade import DetectorDuplicatas
+        except ImportError:
+            show_message('NumPy não instalado. Instale com: pip install numpy', 'error')
+            return None
+
+        config = get_similaridade_config()
+        if limiar is None:
+            limiar = config['limiar']
+        try:
+            itens = [
+                (posicao, item['pergunta'].strip())
+                for posicao, item in enumerate(ler_itens(caminho))
+                if isinstance(item, dict) and isinstance(item.get('pergunta'), str)
+            ]
+            detector = DetectorDuplicatas()
+            detector.carregar(self.db.listar())
+            similares = detector.similares_lote(
+                [pergunta for _, pergunta in itens], config['top_k'] + 1, limiar
+            )
+        except Exception as e:
+            show_message(MSG_IMPORT_JSON_ERROR.format(erro=str(e)), 'error')
+            return None
+
+        relatorio = []
+        for (posicao, pergunta), encontrados in zip(itens, similares):
+            parecidos = [(faq, s) for faq, s in encontrados if faq.pergunta != pergunta]
+            if parecidos:
+                relatorio.append((posicao, pergunta, parecidos[: config['top_k']]))
+
+        show_message(
+            f'{len(relatorio)} de {len(itens)} perguntas parecidas com FAQs '
+            'existentes.',
+            'warning' if relatorio else 'success',
+        )
+        for posicao, pergunta, parecidos in relatorio[:10]:
+            faq, valor = parecidos[0]
+            show_message(
+                f'Item {posicao}: "{pergunta}" ~ FAQ {faq.id} "{faq.pergunta}" '
+                f'({valor:.2f})',
+                'warning',
+            )
+        return relatorio
@@ -55,22 +55,105 @@ class Menu:
                 return False
         return True
 
-    def _exportar_banco_json(self):
-        """Exporta dados do banco para JSON, conectando se necessário."""
+    def _exportar_banco_json(self, formato='json'):
+        """Exporta dados do banco para JSON/NDJSON, conectando se necessário."""
+        if self._conectar_banco_se_necessario():
+            try:
+                from banco import FaqDB
+                from config.settings import get_export_workers, get_pool_config
+                from exportacao import MenuExportacao
+
+                workers = get_export_workers()
+                if workers == 1:
+                    MenuExportacao(self.db).exportar_json(formato, workers=1)
+                    return
+                # Pool aberto só durante a exportação paralela, uma sessão
+                # por thread
+                pool_config = {**get_pool_config(), 'min': 1, 'max': workers}
+                with FaqDB(
+                    self.oracle_config, silent=True, pool_config=pool_config
+                ) as db_exportacao:
+                    MenuExportacao(db_exportacao).exportar_json(
+                        formato, workers=workers
+                    )
+            except Exception as e:
+                show_message(f'Erro na exportação: {e}', 'error')
+
+    def _exportar_incremental(self, modo):
+        """Exporta só as alterações desde a última exportação."""
         if self._conectar_banco_se_necessario():
             try:
                 from exportacao import MenuExportacao
 
-                menu_exportacao = MenuExportacao(self.db)
-                menu_exportacao.exportar_json()
+                MenuExportacao(self.db).exportar_incremental(modo)
             except Exception as e:
                 show_message(f'Erro na exportação: {e}', 'error')
 
+    def _importar_json(self):
+        """Importa (ou simula importar) um arquivo exportado para o banco."""
+        if self._conectar_banco_se_necessario():
+            try:
+                from config.settings import JSON_BANCO_PATH, confirmar_acao, input_id
+                from exportacao import MenuExportacao
+
+                caminho = input(
+                    f'{COLOR_PROMPT}Arquivo a importar (vazio para {JSON_BANCO_PATH}): '
+                    f'{COLOR_RESET}'
+                ).strip()
+                user_adm_id_user_adm = input_id('ID do admin responsável: ')
+                simular = confirmar_acao('Apenas simular a importação? (s/n): ')
+                exportacao = MenuExportacao(self.db)
+                exportacao.importar_json(
+                    caminho or JSON_BANCO_PATH, user_adm_id_user_adm, simular
+                )
+                if simular:
+                    # Na simulação, aponta também perguntas quase duplicadas
+                    exportacao.verificar_similares(caminho or JSON_BANCO_PATH)
+            except Exception as e:
+                show_message(f'Erro na importação: {e}', 'error')
+
+    def _exibir_estatisticas_sql(self):
+        """Mostra as estatísticas por consulta SQL e as execuções lentas."""
+        if self.db is None:
+            show_message('Nenhuma consulta executada ainda nesta sessão.', 'info')
+            return
+        estatisticas = self.db.estatisticas_sql()
+        if not estatisticas['consultas']:
+            show_message('Nenhuma consulta executada ainda nesta sessão.', 'info')
+            return
+        print(f'\n{COLOR_TITLE}--- Estatísticas de SQL ---{COLOR_RESET}')
+        print(
+            f'{"SQL":<36}{"exec":>7}{"total ms":>11}{"médio ms":>10}'
+            f'{"máx ms":>10}{"linhas":>9}{"bytes":>11}{"lentas":>7}'
+        )
+        for c in estatisticas['consultas']:
+            print(
+                f'{c["sql"]:<36}{c["execucoes"]:>7}{c["tempo_total_ms"]:>11.1f}'
+                f'{c["tempo_medio_ms"]:>10.2f}{c["tempo_max_ms"]:>10.2f}'
+                f'{c["linhas"]:>9}{c["bytes"]:>11}{c["lentas"]:>7}'
+            )
+        lentas = estatisticas['lentas'][-10:]
+        if lentas:
+            print(
+                f'\n{COLOR_WARNING}Execuções lentas recentes '
+                f'(>= {estatisticas["limiar_lento_ms"]:g} ms):{COLOR_RESET}'
+            )
+            for lenta in lentas:
+                print(
+                    f'{lenta["em"]}  {lenta["sql"]}  {lenta["ms"]:.1f} ms  '
+                    f'{lenta["linhas"]} linhas  binds ({lenta["binds"]})'
+                )
+
     def exibir_menu(self):
         while True:
             print(f'\n{COLOR_TITLE}--- MENU FAQ ---{COLOR_RESET}')
             print(f'{COLOR_OPTION}1. CRUD de FAQs (Banco Oracle)')
             print(f'{COLOR_OPTION}2. Exportar FAQs do banco para JSON')
+            print(f'{COLOR_OPTION}3. Exportar FAQs do banco para NDJSON')
+            print(f'{COLOR_OPTION}4. Atualizar exportação JSON (só alterações)')
+            print(f'{COLOR_OPTION}5. Exportar apenas alterações (arquivo delta)')
+            print(f'{COLOR_OPTION}6. Importar FAQs de arquivo JSON/NDJSON')
+            print(f'{COLOR_OPTION}7. Estatísticas das consultas SQL')
             print(f'{COLOR_WARNING}{MENU_EXIT_KEYS}{COLOR_RESET}')
             opcao = (
                 input(
@@ -92,6 +175,16 @@ class Menu:
             elif opcao == '2':
                 # Conecta ao banco sob demanda antes de exportar
                 self._exportar_banco_json()
+            elif opcao == '3':
+                self._exportar_banco_json('ndjson')
+            elif opcao == '4':
+                self._exportar_incremental('snapshot')
+            elif opcao == '5':
+                self._exportar_incremental('delta')
+            elif opcao == '6':
+                self._importar_json()
+            elif opcao == '7':
+                self._exibir_estatisticas_sql()
             elif opcao in ['0', 's']:
                 confirm = (
                     input(f'{COLOR_WARNING}{MENU_CONFIRM_EXIT}{COLOR_RESET}')
@@ -0,0 +1,221 @@
+"""
+Métricas das requisições da API no formato de exposição de texto do
+Prometheus. As threads registram em um conjunto fixo de fatias de contadores,
+escolhida pelo id da thread, cada uma com seu lock; a coleta (GET /metrics)
+soma as fatias.
+"""
+
+import bisect
+import threading
+
+# Limites (le) dos histogramas de duração, em segundos
+BUCKETS_DURACAO = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Limites dos histogramas de idas ao banco por requisição
+BUCKETS_IDAS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Fatias de contadores; threads na mesma fatia disputam o mesmo lock
+FATIAS = 16
+
+
+class _Contadores:
+    """Contadores de uma fatia de threads."""
+
+    def __init__(self):
+        self.iniciadas = 0
+        self.concluidas = 0
+        self.requisicoes = {}  # (metodo, rota, status) -> total
+        self.erros = {}  # (metodo, rota) -> total de respostas 5xx
+        self.duracoes = {}  # (metodo, rota) -> [contagem por bucket..., soma]
+        self.idas = {}  # (metodo, rota) -> [contagem por bucket..., soma]
+
+    def somar(self, outro):
+        self.iniciadas += outro.iniciadas
+        self.concluidas += outro.concluidas
+        for destino, origem in (
+            (self.requisicoes, outro.requisicoes),
+            (self.erros, outro.erros),
+        ):
+            for chave, valor in origem.copy().items():
+                destino[chave] = destino.get(chave, 0) + valor
+        for destino, origem in (
+            (self.duracoes, outro.duracoes),
+            (self.idas, outro.idas),
+        ):
+            for chave, valores in origem.copy().items():
+                atual = destino.get(chave)
+                if atual is None:
+                    destino[chave] = list(valores)
+                else:
+                    for i, valor in enumerate(list(valores)):
+                        atual[i] += valor
+
+
+def _observar(histogramas, chave, buckets, valor):
+    """Soma `valor` ao histograma `chave` (contagem do bucket e soma total)."""
+    contagens = histogramas.get(chave)
+    if contagens is None:
+        contagens = histogramas[chave] = [0] * (len(buckets) + 2)
+    contagens[bisect.bisect_left(buckets, valor)] += 1
+    contagens[-1] += valor
+
+
+def _rotulos(rotulos):
+    if not rotulos:
+        return ''
+    pares = ','.join(
+        '{}="{}"'.format(
+            nome,
+            str(valor).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'),
+        )
+        for nome, valor in rotulos.items()
+    )
+    return '{' + pares + '}'
+
+
+def formatar_metrica(nome, tipo, ajuda, amostras):
+    """
+    Linhas de uma métrica no formato de texto do Prometheus.
+    `amostras` é uma lista de (sufixo, rótulos, valor), ex.: ('_total', {}, 3).
+    """
+    linhas = [f'# HELP {nome} {ajuda}', f'# TYPE {nome} {tipo}']
+    for sufixo, rotulos, valor in amostras:
+        valor = valor if isinstance(valor, int) else repr(float(valor))
+        linhas.append(f'{nome}{sufixo}{_rotulos(rotulos)} {valor}')
+    return linhas
+
+
+def _amostras_histograma(histogramas, buckets):
+    amostras = []
+    for (metodo, rota), contagens in sorted(histogramas.items()):
+        rotulos = {'metodo': metodo, 'rota': rota}
+        acumulado = 0
+        for limite, contagem in zip((*buckets, '+Inf'), contagens):
+            acumulado += contagem
+            amostras.append(('_bucket', {**rotulos, 'le': limite}, acumulado))
+        amostras.append(('_sum', rotulos, contagens[-1]))
+        amostras.append(('_count', rotulos, acumulado))
+    return amostras
+
+
+class Metricas:
+    """
+    Registro das métricas por rota: requisições por status, erros (5xx),
+    histogramas de duração e de idas ao banco, e requisições em andamento.
+
+    Os contadores são divididos em `fatias` fixas, cada uma com seu lock; a
+    thread usa a fatia do seu id. Assim o servidor pode abrir uma thread por
+    requisição sem um lock global e sem guardar estado por thread.
+
+    Example:
+        >>> metricas = Metricas()
+        >>> metricas.iniciar()
+        >>> metricas.registrar('GET', '/faqs', 200, 0.004, 2)
+        >>> metricas.concluir()
+        >>> linha = 'faq_api_requisicoes_total{metodo="GET",rota="/faqs",status="200"}'
+        >>> linha + ' 1' in metricas.exportar()
+        True
+    """
+
+    def __init__(
+        self, buckets_duracao=BUCKETS_DURACAO, buckets_idas=BUCKETS_IDAS, fatias=FATIAS
+    ):
+        self.buckets_duracao = tuple(buckets_duracao)
+        self.buckets_idas = tuple(buckets_idas)
+        self._fatias = [(_Contadores(), threading.Lock()) for _ in range(fatias)]
+
+    def _fatia(self):
+        # Os ids de thread são endereços alinhados (get_ident() % fatias cai
+        # sempre na mesma fatia); o hash da tupla espalha os bits
+        return self._fatias[hash((threading.get_ident(),)) % len(self._fatias)]
+
+    def iniciar(self):
+        """Marca o início de uma requisição (requisições em andamento)."""
+        contadores, lock = self._fatia()
+        with lock:
+            contadores.iniciadas += 1
+
+    def concluir(self):
+        """Marca o fim de uma requisição iniciada por iniciar()."""
+        contadores, lock = self._fatia()
+        with lock:
+            contadores.concluidas += 1
+
+    def registrar(self, metodo, rota, status, duracao, idas):
+        """Registra uma requisição finalizada: status, duração (s) e idas ao banco."""
+        chave = (metodo, rota)
+        requisicao = (metodo, rota, str(status))
+        contadores, lock = self._fatia()
+        with lock:
+            contadores.requisicoes[requisicao] = (
+                contadores.requisicoes.get(requisicao, 0) + 1
+            )
+            if status >= 500:
+                contadores.erros[chave] = contadores.erros.get(chave, 0) + 1
+            _observar(contadores.duracoes, chave, self.buckets_duracao, duracao)
+            _observar(contadores.idas, chave, self.buckets_idas, idas)
+
+    def coletar(self):
+        """Soma os contadores de todas as fatias."""
+        total = _Contadores()
+        for contadores, lock in self._fatias:
+            with lock:
+                total.somar(contadores)
+        return total
+
+    def exportar(self):
+        """Texto do Prometheus com as métricas das requisições."""
+        total = self.coletar()
+        linhas = []
+        linhas += formatar_metrica(
+            'faq_api_requisicoes',
+            'counter',
+            'Requisições atendidas por método, rota e status.',
+            [
+                ('_total', {'metodo': m, 'rota': r, 'status': s}, valor)
+                for (m, r, s), valor in sorted(total.requisicoes.items())
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_api_erros',
+            'counter',
+            'Respostas 5xx por método e rota.',
+            [
+                ('_total', {'metodo': m, 'rota': r}, valor)
+                for (m, r), valor in sorted(total.erros.items())
+            ],
+        )
+        linhas += formatar_metrica(
+            'faq_api_duracao_segundos',
+            'histogram',
+            'Duração das requisições, em segundos.',
+            _amostras_histograma(total.duracoes, self.buckets_duracao),
+        )
+        linhas += formatar_metrica(
+            'faq_api_idas_ao_banco',
+            'histogram',
+            'Idas ao banco (execute, commit e lotes de fetch) por requisição.',
+            _amostras_histograma(total.idas, self.buckets_idas),
+        )
+        linhas += formatar_metrica(
+            'faq_api_requisicoes_em_andamento',
+            'gauge',
+            'Requisições sendo atendidas no momento.',
+            [('', {}, total.iniciadas - total.concluidas)],
+        )
+        return '\n'.join(linhas) + '\n'
@@ -1,10 +1,63 @@
+import json
+from datetime import datetime, timezone
+from json.encoder import encode_basestring_ascii
+
 from config.settings import COLOR_ERROR, COLOR_MAGENTA, COLOR_RESET, COLOR_SUCCESS
 
+# Mesmo formato compacto do jsonify do Flask (fora do modo debug)
+_CODIFICADOR_JSON = json.JSONEncoder(ensure_ascii=True, separators=(',', ':'))
+_DIAS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MESES = (
+    'Jan',
+    'Feb',
+    'Mar',
+    'Apr',
+    'May',
+    'Jun',
+    'Jul',
+    'Aug',
+    'Sep',
+    'Oct',
+    'Nov',
+    'Dec',
+)
+
+
+def data_http(valor):
+    """
+    Data no formato que o jsonify do Flask usa (RFC 822, em GMT; datas sem
+    fuso são tratadas como UTC). Valores que não são datetime voltam iguais.
+    """
+    if not isinstance(valor, datetime):
+        return valor
+    if valor.tzinfo is not None:
+        valor = valor.astimezone(timezone.utc)
+    # Mesmo texto de email.utils.format_datetime(..., usegmt=True), sem o custo
+    return (
+        f'{_DIAS[valor.weekday()]}, {valor.day:02d} {_MESES[valor.month - 1]} '
+        f'{valor.year:04d} {valor.hour:02d}:{valor.minute:02d}:{valor.second:02d} GMT'
+    )
+
+
+def _valor_json(valor):
+    """Um valor em JSON, como o jsonify o escreveria (ensure_ascii)."""
+    if isinstance(valor, str):
+        return encode_basestring_ascii(valor)
+    if type(valor) is int:
+        return str(valor)
+    if isinstance(valor, datetime):
+        return encode_basestring_ascii(data_http(valor))
+    return _CODIFICADOR_JSON.encode(valor)
+
 
 class FAQ:
     """
     Representa um item de FAQ (pergunta e resposta).
 
+    Usa __slots__ (sem __dict__ por instância) e é tratado como imutável
+    depois de criado: os mesmos objetos são compartilhados pelo cache e pelos
+    índices em memória, e to_json() guarda o JSON calculado na primeira vez.
+
     Args:
         id (int): Identificador único do FAQ.
         pergunta (str): Texto da pergunta.
@@ -23,8 +76,23 @@ class FAQ:
         Ativo: Sim
         Atualizado em: 2025-09-23 10:00:00
         Categoria: Programação
+        >>> faq.to_dict()['categoria']
+        'Programação'
+        >>> faq.to_json()[:30]
+        '{"ativo":1,"atualizado_em":"20'
     """
 
+    __slots__ = (
+        'id',
+        'pergunta',
+        'resposta',
+        'ativo',
+        'atualizado_em',
+        'categoria',
+        'user_account_id_user',
+        '_json',
+    )
+
     def __init__(
         self,
         id,
@@ -54,6 +122,40 @@ class FAQ:
         self.atualizado_em = atualizado_em
         self.categoria = categoria
         self.user_account_id_user = user_account_id_user
+        self._json = None
+
+    def to_dict(self):
+        """
+        Campos do FAQ em um dict novo (o chamador pode alterá-lo), com as
+        mesmas chaves expostas pela API. Datas continuam como datetime.
+        """
+        return {
+            'id': self.id,
+            'pergunta': self.pergunta,
+            'resposta': self.resposta,
+            'ativo': self.ativo,
+            'atualizado_em': self.atualizado_em,
+            'categoria': self.categoria,
+            'user_account_id_user': self.user_account_id_user,
+        }
+
+    def to_json(self):
+        """
+        JSON compacto do FAQ, idêntico ao de jsonify(faq.to_dict()) sem a
+        quebra de linha final. Calculado na primeira chamada e reaproveitado.
+        """
+        if self._json is None:
+            # Chaves em ordem alfabética, como no jsonify (sort_keys)
+            self._json = (
+                f'{{"ativo":{_valor_json(self.ativo)},'
+                f'"atualizado_em":{_valor_json(self.atualizado_em)},'
+                f'"categoria":{_valor_json(self.categoria)},'
+                f'"id":{_valor_json(self.id)},'
+                f'"pergunta":{_valor_json(self.pergunta)},'
+                f'"resposta":{_valor_json(self.resposta)},'
+                f'"user_account_id_user":{_valor_json(self.user_account_id_user)}}}'
+            )
+        return self._json
 
     def __str__(self):
         """
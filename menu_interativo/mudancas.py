@@ -0,0 +1,182 @@
+"""
+Registro em memória das mudanças nos FAQs, alimentado pelas escritas do
+FaqDB (ver FaqDB.ao_alterar), para o feed GET /faqs/mudancas da API. Cada
+escrita vira uma entrada numerada com as linhas gravadas (já em JSON) e os
+ids removidos; os clientes leem a partir de um cursor e recebem só o que
+mudou, sem consultar o banco.
+"""
+
+import itertools
+import json
+import threading
+import uuid
+from collections import deque
+
+from banco import EVENTO_REMOVIDOS
+
+
+class RegistroMudancas:
+    """
+    Fila circular das últimas `max_entradas` escritas. O cursor
+    ('<instância>-<sequência>') identifica a última entrada já recebida; um
+    cursor de outro processo, de antes de um reinício ou mais antigo que a
+    fila pede que o cliente recarregue a listagem ('recarregar': true).
+
+    Quem espera por mudanças (ler com `espera`) fica parado em uma única
+    Condition compartilhada, sem conexão de banco e sem consumir CPU; cada
+    escrita acorda todos de uma vez. `max_clientes` limita quantas esperas
+    simultâneas são aceitas (ver entrar e sair).
+
+    Args:
+        max_entradas (int): Escritas guardadas para retomada pelo cursor.
+        max_clientes (int): Clientes esperando ao mesmo tempo.
+
+    Example:
+        >>> from models import FAQ
+        >>> registro = RegistroMudancas(max_entradas=8)
+        >>> _, inicio = registro.ler()
+        >>> registro.registrar(gravados=[FAQ(1, 'P?', 'R.', 1, None, 'CONTA')])
+        >>> registro.registrar(removidos=[2])
+        >>> texto, cursor = registro.ler(inicio)
+        >>> dados = json.loads(texto)
+        >>> [faq['id'] for faq in dados['gravados']], dados['removidos']
+        ([1], [2])
+        >>> registro.ler(cursor)[0] is None
+        True
+    """
+
+    def __init__(self, max_entradas=1000, max_clientes=8):
+        self.instancia = uuid.uuid4().hex[:8]
+        self.max_clientes = max_clientes
+        # (sequência, {id: JSON} das linhas gravadas ou None se desconhecidas,
+        #  ids removidos)
+        self._entradas = deque(maxlen=max_entradas)
+        self._sequencia = 0
+        self._condicao = threading.Condition()
+        self.clientes = 0
+        # Último lote montado (de, até, texto): clientes no mesmo cursor
+        # reaproveitam o JSON em vez de montá-lo cada um
+        self._ultimo_lote = None
+
+    def acompanhar(self, db):
+        """Registra cada escrita do FaqDB `db` a partir de agora."""
+
+        def registrar(tipo, ids):
+            if ids is None:
+                self.registrar(recarregar=True)
+            elif tipo == EVENTO_REMOVIDOS:
+                self.registrar(removidos=ids)
+            else:
+                # Uma leitura por escrita, compartilhada por todos os clientes
+                gravados = db.listar_por_ids(ids)
+                encontrados = {faq.id for faq in gravados}
+                self.registrar(
+                    gravados=gravados,
+                    removidos=[id for id in ids if id not in encontrados],
+                )
+
+        db.ao_alterar(registrar)
+
+    def registrar(self, gravados=(), removidos=(), recarregar=False):
+        """
+        Acrescenta uma entrada: FAQs gravados, ids removidos ou, com
+        `recarregar`, uma escrita cujas linhas não são conhecidas. Acorda
+        quem está esperando.
+        """
+        linhas = None if recarregar else {faq.id: faq.to_json() for faq in gravados}
+        with self._condicao:
+            self._sequencia += 1
+            self._entradas.append((self._sequencia, linhas, tuple(removidos)))
+            self._condicao.notify_all()
+
+    def _cursor(self, sequencia):
+        return f'{self.instancia}-{sequencia}'
+
+    def _sequencia_do_cursor(self, cursor):
+        """Sequência do cursor, ou None se ele não serve para este registro."""
+        instancia, _, sequencia = (cursor or '').partition('-')
+        if instancia != self.instancia or not sequencia.isdigit():
+            return None
+        sequencia = int(sequencia)
+        return sequencia if sequencia <= self._sequencia else None
+
+    def ler(self, cursor=None, espera=0):
+        """
+        Mudanças depois de `cursor`, esperando até `espera` segundos se ainda
+        não houver nenhuma. Sem cursor, começa do momento atual. Retorna
+        (texto JSON do lote, ou None se nada mudou, novo cursor).
+        """
+        with self._condicao:
+            recarregar = False
+            inicio = self._sequencia if cursor is None else None
+            if cursor is not None:
+                inicio = self._sequencia_do_cursor(cursor)
+            if inicio is None:
+                inicio, recarregar = self._sequencia, True
+            elif espera > 0:
+                self._condicao.wait_for(lambda: self._sequencia > inicio, espera)
+            fim = self._sequencia
+            primeira = self._entradas[0][0] if self._entradas else fim + 1
+            if inicio + 1 < primeira and inicio < fim:
+                # Parte das mudanças já saiu da fila
+                recarregar = True
+            entradas = list(
+                itertools.islice(self._entradas, max(inicio + 1 - primeira, 0), None)
+            )
+            ultimo = self._ultimo_lote
+        if not recarregar and inicio == fim:
+            return None, self._cursor(fim)
+        if not recarregar and ultimo is not None and ultimo[:2] == (inicio, fim):
+            return ultimo[2], self._cursor(fim)
+        # Montado fora do lock; só a troca do último lote é feita com ele
+        texto = self._montar_lote(entradas, self._cursor(fim), recarregar)
+        if not recarregar:
+            with self._condicao:
+                self._ultimo_lote = (inicio, fim, texto)
+        return texto, self._cursor(fim)
+
+    @staticmethod
+    def _montar_lote(entradas, cursor, recarregar):
+        """JSON do lote: o estado final de cada id tocado pelas entradas."""
+        gravados = {}
+        removidos = {}
+        for _, linhas, ids_removidos in entradas:
+            if linhas is None:
+                recarregar = True
+                continue
+            for id, texto in linhas.items():
+                removidos.pop(id, None)
+                gravados[id] = texto
+            for id in ids_removidos:
+                gravados.pop(id, None)
+                removidos[id] = None
+        # Linhas já em JSON (FAQ.to_json), chaves em ordem como no jsonify
+        return (
+            f'{{"cursor":{json.dumps(cursor)},'
+            f'"gravados":[{",".join(gravados.values())}],'
+            f'"recarregar":{json.dumps(recarregar)},'
+            f'"removidos":{json.dumps(list(removidos))}}}'
+        )
+
+    def entrar(self):
+        """Reserva a vaga de um cliente; False se o limite foi atingido."""
+        with self._condicao:
+            if self.clientes >= self.max_clientes:
+                return False
+            self.clientes += 1
+            return True
+
+    def sair(self):
+        """Libera a vaga reservada por entrar()."""
+        with self._condicao:
+            self.clientes -= 1
+
+    def estatisticas(self):
+        """Cursor atual, entradas guardadas e clientes esperando."""
+        with self._condicao:
+            return {
+                'cursor': self._cursor(self._sequencia),
+                'entradas': len(self._entradas),
+                'clientes': self.clientes,
+                'max_clientes': self.max_clientes,
+            }
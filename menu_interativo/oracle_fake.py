@@ -0,0 +1,708 @@
+"""
+Driver Oracle falso para desenvolvimento e benchmarks locais.
+Imita a parte da API do oracledb usada pelo sistema FAQ (connect, create_pool,
+cursores, executemany com batcherrors) sobre um banco SQLite em arquivo
+temporário (apagado ao fim do processo), traduzindo as construções Oracle
+usadas em banco.py.
+Permite medir pool, concorrência e throughput sem um Oracle real.
+EXPLAIN PLAN grava no plan_table o plano escolhido pelo SQLite, e as visões
+user_indexes, user_tables e user_tab_columns descrevem o esquema (ver
+esquema.py).
+
+Uso: defina DB_DRIVER=fake no .env (ou no ambiente). O DSN identifica o banco
+em memória; FAKE_DB_LINHAS popula a tabela FAQ na primeira conexão e
+FAKE_DB_LATENCIA_MS simula o tempo de ida e volta de cada chamada ao banco.
+"""
+
+import atexit
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+# --- Constantes compatíveis com oracledb ---
+POOL_GETMODE_WAIT = 0
+POOL_GETMODE_NOWAIT = 1
+POOL_GETMODE_FORCEGET = 2
+POOL_GETMODE_TIMEDWAIT = 3
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS user_account (
+        id_user INTEGER PRIMARY KEY AUTOINCREMENT,
+        name_user TEXT NOT NULL,
+        cpf_user TEXT NOT NULL UNIQUE,
+        birth_date DATE NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS user_adm (
+        id_user_adm INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_account_id_user INTEGER NOT NULL REFERENCES user_account (id_user)
+    );
+    CREATE TABLE IF NOT EXISTS faq (
+        id_faq INTEGER PRIMARY KEY AUTOINCREMENT,
+        question_faq TEXT NOT NULL UNIQUE CHECK (length(question_faq) <= 150),
+        answer_faq TEXT NOT NULL CHECK (length(answer_faq) <= 600),
+        active_faq INTEGER NOT NULL CHECK (active_faq IN (0, 1)),
+        faq_updated_at DATE NOT NULL
+            DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
+        category_faq TEXT NOT NULL CHECK (length(category_faq) <= 50),
+        user_account_id_user INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS faq_versao (
+        id_versao INTEGER PRIMARY KEY CHECK (id_versao = 1),
+        versao INTEGER NOT NULL,
+        atualizado_em DATE NOT NULL
+    );
+    INSERT OR IGNORE INTO faq_versao
+        VALUES (1, 0, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'));
+    CREATE TABLE IF NOT EXISTS plan_table (
+        statement_id TEXT,
+        id INTEGER,
+        operation TEXT,
+        options TEXT,
+        object_name TEXT
+    );
+    CREATE VIEW IF NOT EXISTS user_indexes AS
+        SELECT UPPER(name) AS index_name, UPPER(tbl_name) AS table_name
+        FROM sqlite_master WHERE type = 'index';
+    CREATE VIEW IF NOT EXISTS user_tables AS
+        SELECT UPPER(name) AS table_name FROM sqlite_master WHERE type = 'table';
+    CREATE VIEW IF NOT EXISTS user_tab_columns AS
+        SELECT UPPER(m.name) AS table_name, UPPER(c.name) AS column_name,
+               UPPER(c.type) AS data_type
+        FROM sqlite_master m, pragma_table_info(m.name) c
+        WHERE m.type = 'table';
+"""
+
+CATEGORIAS_EXEMPLO = ('CONTA', 'PAGAMENTO', 'ENTREGA', 'SUPORTE', 'PRIVACIDADE')
+
+
+class Error(Exception):
+    """Erro base do driver falso (equivale a oracledb.Error)."""
+
+
+class DatabaseError(Error):
+    """Erro de banco (equivale a oracledb.DatabaseError)."""
+
+
+class IntegrityError(DatabaseError):
+    """Violação de constraint (equivale a oracledb.IntegrityError)."""
+
+
+class Var:
+    """
+    Variável de bind de saída (equivale a oracledb.Var), usada em RETURNING
+    INTO. Em executemany, cada linha de entrada `pos` tem seus valores.
+    """
+
+    def __init__(self, tipo=None):
+        self.tipo = tipo
+        self._valores = {}
+
+    def getvalue(self, pos=0):
+        return list(self._valores.get(pos, []))
+
+    def setvalue(self, pos, valor):
+        self._valores[pos] = [valor]
+
+
+class _ErroLote:
+    """Erro de uma linha em executemany(batcherrors=True)."""
+
+    def __init__(self, offset, message):
+        self.offset = offset
+        self.message = message
+        self.full_code = message.split(':', 1)[0]
+
+    def __str__(self):
+        return self.message
+
+
+# --- Conversões de tipos entre Python e SQLite ---
+def _to_char(valor, formato):
+    """Implementação mínima de TO_CHAR para datas."""
+    if valor is None:
+        return None
+    if isinstance(valor, str):
+        valor = datetime.strptime(valor[:19], DATETIME_FORMAT)
+    mapa = {'YYYY': '%Y', 'MM': '%m', 'DD': '%d', 'HH24': '%H', 'MI': '%M', 'SS': '%S'}
+    for oracle, python in mapa.items():
+        formato = formato.replace(oracle, python)
+    return valor.strftime(formato)
+
+
+def _sysdate():
+    return datetime.now().strftime(DATETIME_FORMAT)
+
+
+sqlite3.register_adapter(datetime, lambda valor: valor.strftime(DATETIME_FORMAT))
+sqlite3.register_converter(
+    'DATE', lambda valor: datetime.strptime(valor.decode()[:19], DATETIME_FORMAT)
+)
+
+
+# --- Tradução das construções Oracle para SQLite ---
+_RE_BIND_POSICIONAL = re.compile(r"(?<![\w:'])\:(\d+)\b")
+_RE_SYSDATE = re.compile(r'\bSYSDATE\b(?!\s*\()', re.IGNORECASE)
+_RE_ROWNUM = re.compile(r'\bWHERE\s+ROWNUM\s*<=\s*(\S+)', re.IGNORECASE)
+_RE_OFFSET_FETCH = re.compile(
+    r'\bOFFSET\s+(\S+)\s+ROWS?\s+FETCH\s+(?:NEXT|FIRST)\s+(\S+)\s+ROWS?\s+ONLY',
+    re.IGNORECASE,
+)
+_RE_FETCH = re.compile(
+    r'\bFETCH\s+(?:NEXT|FIRST)\s+(\S+)\s+ROWS?\s+ONLY', re.IGNORECASE
+)
+_RE_OFFSET = re.compile(r'\bOFFSET\s+(\S+)\s+ROWS?\b', re.IGNORECASE)
+_RE_FROM_DUAL = re.compile(r'\bFROM\s+DUAL\b', re.IGNORECASE)
+_RE_RETURNING_INTO = re.compile(
+    r'\bRETURNING\s+(.+?)\s+INTO\s+:\w+(?:\s*,\s*:\w+)*', re.IGNORECASE | re.DOTALL
+)
+_RE_MERGE = re.compile(
+    r'MERGE\s+INTO\s+(?P<tabela>\w+)\s+(?P<alvo>\w+)\s+'
+    r'USING\s+\((?P<origem>.*?)\)\s+(?P<fonte>\w+)\s+'
+    r'ON\s+\((?P=alvo)\.(?P<chave>\w+)\s*=\s*(?P=fonte)\.(?P=chave)\)\s+'
+    r'WHEN\s+MATCHED\s+THEN\s+UPDATE\s+SET\s+(?P<set>.*?)'
+    r'(?:\s+WHERE\s+(?P<condicao>.*?))?\s+'
+    r'WHEN\s+NOT\s+MATCHED\s+THEN\s+INSERT\s*\((?P<colunas>.*?)\)\s*'
+    r'VALUES\s*\((?P<valores>.*)\)\s*$',
+    re.IGNORECASE | re.DOTALL,
+)
+
+_traducoes = {}
+_traducoes_lock = threading.Lock()
+
+
+def _traduzir_merge(sql):
+    """
+    Reescreve um MERGE (uma linha de origem, chave única) como o upsert do
+    SQLite: INSERT ... SELECT ... ON CONFLICT (chave) DO UPDATE ... WHERE.
+    """
+    m = _RE_MERGE.search(sql)
+    if m is None:
+        return sql
+    alvo, fonte = m['alvo'], m['fonte']
+
+    def referencias(texto, prefixo_alvo):
+        texto = re.sub(rf'\b{alvo}\.', prefixo_alvo, texto)
+        return re.sub(rf'\b{fonte}\.', 'excluded.', texto)
+
+    valores = re.sub(rf'\b{fonte}\.', '', m['valores'])
+    sql_sqlite = (
+        f'INSERT INTO {m["tabela"]} ({m["colunas"]}) '
+        f'SELECT {valores} '
+        f'FROM ({m["origem"]}) WHERE true '
+        f'ON CONFLICT ({m["chave"]}) DO UPDATE SET {referencias(m["set"], "")}'
+    )
+    if m['condicao']:
+        sql_sqlite += f' WHERE {referencias(m["condicao"], m["tabela"] + ".")}'
+    return sql_sqlite
+
+
+def _traduzir(sql):
+    """Traduz um comando Oracle para SQLite (com cache por texto SQL)."""
+    traduzido = _traducoes.get(sql)
+    if traduzido is not None:
+        return traduzido
+    traduzido = _RE_RETURNING_INTO.sub(r'RETURNING \1', sql)
+    traduzido = _RE_BIND_POSICIONAL.sub('?', traduzido)
+    traduzido = _RE_SYSDATE.sub('SYSDATE()', traduzido)
+    traduzido = _RE_ROWNUM.sub(r'LIMIT \1', traduzido)
+    traduzido = _RE_OFFSET_FETCH.sub(r'LIMIT \2 OFFSET \1', traduzido)
+    traduzido = _RE_FETCH.sub(r'LIMIT \1', traduzido)
+    traduzido = _RE_OFFSET.sub(r'LIMIT -1 OFFSET \1', traduzido)
+    traduzido = _RE_FROM_DUAL.sub('', traduzido)
+    traduzido = _traduzir_merge(traduzido)
+    with _traducoes_lock:
+        _traducoes[sql] = traduzido
+    return traduzido
+
+
+_RE_DATA = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+
+
+def _converter_linha(linha):
+    """Converte datas que o SQLite devolve como texto (ex.: em MAX) para datetime."""
+    return tuple(
+        datetime.strptime(valor, DATETIME_FORMAT)
+        if isinstance(valor, str) and _RE_DATA.match(valor)
+        else valor
+        for valor in linha
+    )
+
+
+# --- EXPLAIN PLAN sobre o EXPLAIN QUERY PLAN do SQLite ---
+_RE_EXPLAIN_PLAN = re.compile(
+    r"^\s*EXPLAIN\s+PLAN\s+SET\s+STATEMENT_ID\s*=\s*'([^']*)'\s+FOR\s+(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_BIND_NOMEADO = re.compile(r'(?<![\w:]):[A-Za-z_]')
+_RE_DETALHE_PLANO = re.compile(
+    r'^(?P<acesso>SCAN|SEARCH) (?P<tabela>\w+)'
+    r'(?: USING (?:COVERING )?(?:INDEX (?P<indice>\w+)|(?P<pk>INTEGER PRIMARY KEY)))?'
+    r'(?: \((?P<condicao>.*)\))?$'
+)
+_RE_ORDENACAO_PLANO = re.compile(r'^USE TEMP B-TREE FOR (.+)$')
+
+
+class _BindsNulos(dict):
+    """Binds nomeados do EXPLAIN: o plano não depende dos valores."""
+
+    def __missing__(self, chave):
+        return None
+
+
+def _tabela_do_alias(sql, alias):
+    """Nome da tabela (em maiúsculas) por trás de um alias do FROM/JOIN."""
+    m = re.search(
+        rf'\b(?:FROM|JOIN)\s+(\w+)\s+(?:AS\s+)?{re.escape(alias)}\b',
+        sql,
+        re.IGNORECASE,
+    )
+    return (m[1] if m else alias).upper()
+
+
+def _operacao_plano(detalhe, sql):
+    """
+    Converte uma linha do EXPLAIN QUERY PLAN do SQLite em (operação, opções,
+    objeto) como no plan_table do Oracle, ou None se não houver equivalente.
+    """
+    m = _RE_DETALHE_PLANO.match(detalhe)
+    if m is None:
+        ordenacao = _RE_ORDENACAO_PLANO.match(detalhe)
+        return ('SORT', ordenacao[1], None) if ordenacao else None
+    tabela = _tabela_do_alias(sql, m['tabela'])
+    if m['acesso'] == 'SCAN':
+        if m['indice']:
+            return ('INDEX', 'FULL SCAN', m['indice'].upper())
+        return ('TABLE ACCESS', 'FULL', tabela)
+    if m['pk']:
+        unico = '<' not in m['condicao'] and '>' not in m['condicao']
+        return ('INDEX', 'UNIQUE SCAN' if unico else 'RANGE SCAN', f'PK_{tabela}')
+    return ('INDEX', 'RANGE SCAN', m['indice'].upper())
+
+
+def _explicar(conexao, statement_id, sql):
+    """Grava no plan_table, como o EXPLAIN PLAN do Oracle, o plano de `sql`."""
+    traduzido = _traduzir(sql)
+    if _RE_BIND_NOMEADO.search(traduzido):
+        binds = _BindsNulos()
+    else:
+        binds = (None,) * traduzido.count('?')
+    detalhes = conexao.execute('EXPLAIN QUERY PLAN ' + traduzido, binds).fetchall()
+    plano = [(sql.split(None, 1)[0].upper() + ' STATEMENT', None, None)]
+    plano += filter(None, (_operacao_plano(linha[3], sql) for linha in detalhes))
+    conexao.executemany(
+        'INSERT INTO plan_table VALUES (?, ?, ?, ?, ?)',
+        [(statement_id, id, *operacao) for id, operacao in enumerate(plano)],
+    )
+
+
+def _converter_erro(erro):
+    """Converte erros do SQLite nos códigos ORA equivalentes."""
+    msg = str(erro)
+    if 'UNIQUE constraint failed' in msg:
+        return IntegrityError(f'ORA-00001: restrição exclusiva violada ({msg})')
+    if 'CHECK constraint failed' in msg and 'length' in msg:
+        return DatabaseError(f'ORA-12899: valor muito grande para a coluna ({msg})')
+    if 'CHECK constraint failed' in msg:
+        return IntegrityError(f'ORA-02290: restrição de verificação violada ({msg})')
+    if 'NOT NULL constraint failed' in msg:
+        return IntegrityError(f'ORA-01400: não é possível inserir NULL ({msg})')
+    if 'no such table' in msg:
+        return DatabaseError(f'ORA-00942: a tabela ou view não existe ({msg})')
+    if 'already exists' in msg:
+        return DatabaseError(f'ORA-00955: nome já usado por objeto existente ({msg})')
+    return DatabaseError(f'ORA-00900: {msg}')
+
+
+class _Banco:
+    """Banco SQLite compartilhado por todas as conexões de um mesmo DSN."""
+
+    def __init__(self, dsn):
+        self.dsn = dsn
+        nome = re.sub(r'\W+', '_', dsn or 'padrao')
+        fd, self.caminho = tempfile.mkstemp(prefix=f'faq_fake_{nome}_', suffix='.db')
+        os.close(fd)
+        # Arquivo (e não :memory: compartilhado) para o WAL permitir leituras
+        # concorrentes com uma escrita, como no Oracle; apagado na saída
+        atexit.register(self.apagar)
+        self.latencia = float(os.environ.get('FAKE_DB_LATENCIA_MS', 0)) / 1000
+        self.custo_linha = float(os.environ.get('FAKE_DB_CUSTO_LINHA_US', 0)) / 1e6
+        conexao = self.abrir()
+        conexao.execute('PRAGMA journal_mode=WAL')
+        conexao.executescript(SCHEMA_SQL)
+        conexao.execute(
+            'INSERT INTO user_account (name_user, cpf_user, birth_date) '
+            "VALUES ('Admin', '00000000000', '2000-01-01 00:00:00')"
+        )
+        conexao.execute('INSERT INTO user_adm (user_account_id_user) VALUES (1)')
+        conexao.commit()
+        conexao.close()
+        linhas = int(os.environ.get('FAKE_DB_LINHAS', 0))
+        if linhas:
+            self.popular(linhas)
+
+    def abrir(self):
+        conexao = sqlite3.connect(
+            self.caminho,
+            timeout=30,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        conexao.create_function('SYSDATE', 0, _sysdate)
+        conexao.create_function('TO_CHAR', 2, _to_char)
+        return conexao
+
+    def apagar(self):
+        """Remove o arquivo do banco e os arquivos auxiliares do WAL."""
+        for sufixo in ('', '-wal', '-shm'):
+            try:
+                os.remove(self.caminho + sufixo)
+            except FileNotFoundError:
+                pass
+
+    def popular(self, linhas, categorias=CATEGORIAS_EXEMPLO):
+        """Insere `linhas` FAQs sintéticos na tabela."""
+        conexao = self.abrir()
+        (inicio,) = conexao.execute(
+            'SELECT COALESCE(MAX(id_faq), 0) FROM faq'
+        ).fetchone()
+        # Datas de atualização espalhadas no passado, uma por minuto
+        agora = datetime.now()
+        conexao.executemany(
+            'INSERT INTO faq (question_faq, answer_faq, active_faq, faq_updated_at, '
+            'category_faq, user_account_id_user) VALUES (?, ?, ?, ?, ?, 1)',
+            (
+                (
+                    f'Pergunta frequente número {i}?',
+                    f'Resposta detalhada para a pergunta número {i}. ' * 3,
+                    0 if i % 7 == 0 else 1,
+                    agora - timedelta(minutes=inicio + linhas - i),
+                    categorias[i % len(categorias)],
+                )
+                for i in range(inicio + 1, inicio + linhas + 1)
+            ),
+        )
+        conexao.commit()
+        conexao.close()
+
+    def round_trip(self, linhas=0):
+        """Simula o custo de rede de uma chamada ao banco."""
+        espera = self.latencia + linhas * self.custo_linha
+        if espera:
+            time.sleep(espera)
+
+
+_bancos = {}
+_bancos_lock = threading.Lock()
+
+
+def obter_banco(dsn=None):
+    """Retorna (criando se necessário) o banco falso associado ao DSN."""
+    with _bancos_lock:
+        banco = _bancos.get(dsn)
+        if banco is None:
+            banco = _bancos[dsn] = _Banco(dsn)
+        return banco
+
+
+def popular(linhas, dsn=None):
+    """Popula o banco falso do DSN com `linhas` FAQs sintéticos."""
+    obter_banco(dsn).popular(linhas)
+
+
+def configurar(dsn=None, latencia_ms=None, custo_linha_us=None):
+    """Ajusta a latência simulada do banco falso do DSN."""
+    banco = obter_banco(dsn)
+    if latencia_ms is not None:
+        banco.latencia = latencia_ms / 1000
+    if custo_linha_us is not None:
+        banco.custo_linha = custo_linha_us / 1e6
+
+
+class Cursor:
+    """Cursor compatível com o subconjunto de oracledb.Cursor usado no sistema."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowfactory = None
+        self.rowcount = 0
+        self.description = None
+        self._linhas = []
+        self._posicao = 0
+        self._erros_lote = []
+        self._contagens_lote = []
+        self._tipos_entrada = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __iter__(self):
+        while True:
+            linhas = self.fetchmany()
+            if not linhas:
+                return
+            yield from linhas
+
+    def close(self):
+        self._linhas = []
+        self.connection = None
+
+    def _executar(self, sql, parametros):
+        conexao = self.connection._sqlite
+        explain = _RE_EXPLAIN_PLAN.match(sql)
+        try:
+            if explain is not None:
+                _explicar(conexao, explain[1], explain[2])
+                self.description = None
+                return [], 0
+            cursor_sqlite = conexao.execute(_traduzir(sql), parametros or ())
+        except sqlite3.Error as e:
+            raise _converter_erro(e) from e
+        if cursor_sqlite.description:
+            self.description = [
+                (coluna[0].upper(),) + tuple(coluna[1:])
+                for coluna in cursor_sqlite.description
+            ]
+            linhas = [_converter_linha(linha) for linha in cursor_sqlite.fetchall()]
+        else:
+            self.description = None
+            linhas = []
+        return linhas, cursor_sqlite.rowcount
+
+    def var(self, tipo, *args, **kwargs):
+        return Var(tipo)
+
+    def setinputsizes(self, *args, **kwargs):
+        # Só as variáveis de saída importam: recebem o RETURNING do executemany
+        self._tipos_entrada = args
+
+    def _separar_saidas(self, parametros):
+        """Separa dos binds as variáveis de saída (RETURNING INTO)."""
+        if isinstance(parametros, dict):
+            saidas = [p for p in parametros.values() if isinstance(p, Var)]
+            entradas = {k: p for k, p in parametros.items() if not isinstance(p, Var)}
+            return entradas, saidas
+        if isinstance(parametros, (list, tuple)):
+            saidas = [p for p in parametros if isinstance(p, Var)]
+            return [p for p in parametros if not isinstance(p, Var)], saidas
+        return parametros, []
+
+    def execute(self, sql, parameters=None, **kwargs):
+        parametros = parameters if parameters is not None else (kwargs or None)
+        # Variáveis de saída (RETURNING INTO) recebem as linhas devolvidas
+        parametros, saidas = self._separar_saidas(parametros)
+        with self.connection._lock:
+            self.connection._banco.round_trip()
+            linhas, afetadas = self._executar(sql, parametros)
+        if saidas:
+            for coluna, variavel in enumerate(saidas):
+                variavel._valores = {0: [linha[coluna] for linha in linhas]}
+            self.description = None
+            afetadas, linhas = len(linhas), []
+        self._linhas = linhas
+        self._posicao = 0
+        # Como no oracledb, rowcount conta as linhas buscadas em SELECTs
+        self.rowcount = 0 if self.description else max(afetadas, 0)
+        return self if self.description else None
+
+    def executemany(self, sql, parameters, batcherrors=False, arraydmlrowcounts=False):
+        self._erros_lote = []
+        self._contagens_lote = []
+        saidas = [p for p in self._tipos_entrada if isinstance(p, Var)]
+        for variavel in saidas:
+            variavel._valores = {}
+        total = 0
+        with self.connection._lock:
+            self.connection._banco.round_trip(len(parameters))
+            for offset, parametros in enumerate(parameters):
+                try:
+                    linhas, afetadas = self._executar(sql, parametros)
+                except DatabaseError as e:
+                    if not batcherrors:
+                        raise
+                    self._erros_lote.append(_ErroLote(offset, str(e)))
+                    self._contagens_lote.append(0)
+                    continue
+                for coluna, variavel in enumerate(saidas):
+                    variavel._valores[offset] = [linha[coluna] for linha in linhas]
+                    afetadas = len(linhas)
+                total += max(afetadas, 0)
+                self._contagens_lote.append(max(afetadas, 0))
+        self._tipos_entrada = ()
+        self.description = None
+        self.rowcount = total
+
+    def getbatcherrors(self):
+        return list(self._erros_lote)
+
+    def getarraydmlrowcounts(self):
+        return list(self._contagens_lote)
+
+    def _entregar(self, linhas):
+        if linhas:
+            self.rowcount += len(linhas)
+            self.connection._banco.round_trip(len(linhas))
+        if self.rowfactory is not None:
+            return [self.rowfactory(*linha) for linha in linhas]
+        return linhas
+
+    def fetchone(self):
+        linhas = self.fetchmany(1)
+        return linhas[0] if linhas else None
+
+    def fetchmany(self, size=None):
+        tamanho = size or self.arraysize
+        linhas = self._linhas[self._posicao : self._posicao + tamanho]
+        self._posicao += len(linhas)
+        return self._entregar(linhas)
+
+    def fetchall(self):
+        linhas = self._linhas[self._posicao :]
+        self._posicao = len(self._linhas)
+        return self._entregar(linhas)
+
+
+class Connection:
+    """Conexão compatível com o subconjunto de oracledb.Connection usado no sistema."""
+
+    def __init__(self, user=None, password=None, dsn=None, **kwargs):
+        self._banco = obter_banco(dsn)
+        self._sqlite = self._banco.abrir()
+        self._lock = threading.Lock()
+        self.dsn = dsn
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def cursor(self):
+        if self._sqlite is None:
+            raise DatabaseError('DPY-1001: não conectado ao banco')
+        return Cursor(self)
+
+    def commit(self):
+        with self._lock:
+            self._banco.round_trip()
+            self._sqlite.commit()
+
+    def rollback(self):
+        with self._lock:
+            self._banco.round_trip()
+            self._sqlite.rollback()
+
+    def ping(self):
+        self._banco.round_trip()
+
+    def close(self):
+        # Conexões de pool voltam para o pool, como no oracledb
+        if self.pool is not None:
+            self.pool.release(self)
+            return
+        if self._sqlite is not None:
+            self._sqlite.rollback()
+            self._sqlite.close()
+            self._sqlite = None
+
+
+class ConnectionPool:
+    """Pool de sessões compatível com o subconjunto de oracledb.ConnectionPool."""
+
+    def __init__(
+        self,
+        user=None,
+        password=None,
+        dsn=None,
+        min=1,
+        max=2,
+        increment=1,
+        getmode=POOL_GETMODE_WAIT,
+        wait_timeout=0,
+        **kwargs,
+    ):
+        self.dsn = dsn
+        self.min = min
+        self.max = max
+        self.increment = increment
+        self.getmode = getmode
+        self.wait_timeout = wait_timeout
+        self._credenciais = {'user': user, 'password': password, 'dsn': dsn}
+        self._livres = []
+        self._ocupadas = set()
+        self._condicao = threading.Condition()
+        for _ in range(min):
+            self._livres.append(self._nova_conexao())
+
+    def _nova_conexao(self):
+        conexao = Connection(**self._credenciais)
+        conexao.pool = self
+        return conexao
+
+    @property
+    def opened(self):
+        return len(self._livres) + len(self._ocupadas)
+
+    @property
+    def busy(self):
+        return len(self._ocupadas)
+
+    def acquire(self):
+        limite = None
+        if self.getmode == POOL_GETMODE_TIMEDWAIT and self.wait_timeout:
+            limite = time.monotonic() + self.wait_timeout / 1000
+        with self._condicao:
+            while not self._livres and self.opened >= self.max:
+                if self.getmode == POOL_GETMODE_NOWAIT:
+                    raise DatabaseError('DPY-4005: pool sem conexões disponíveis')
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    raise DatabaseError(
+                        'DPY-4005: tempo esgotado aguardando conexão do pool'
+                    )
+                self._condicao.wait(restante)
+            if not self._livres:
+                novas = min(self.increment, self.max - self.opened)
+                for _ in range(max(novas, 1)):
+                    self._livres.append(self._nova_conexao())
+            conexao = self._livres.pop()
+            self._ocupadas.add(conexao)
+            return conexao
+
+    def release(self, connection):
+        with self._condicao:
+            self._ocupadas.discard(connection)
+            connection._sqlite.rollback()
+            self._livres.append(connection)
+            self._condicao.notify()
+
+    def close(self, force=False):
+        with self._condicao:
+            for conexao in self._livres + list(self._ocupadas):
+                conexao.pool = None
+                conexao.close()
+            self._livres = []
+            self._ocupadas = set()
+
+
+def connect(user=None, password=None, dsn=None, **kwargs):
+    """Abre uma conexão avulsa com o banco falso (equivale a oracledb.connect)."""
+    return Connection(user=user, password=password, dsn=dsn, **kwargs)
+
+
+def create_pool(user=None, password=None, dsn=None, **kwargs):
+    """Cria um pool de sessões no banco falso (equivale a oracledb.create_pool)."""
+    return ConnectionPool(user=user, password=password, dsn=dsn, **kwargs)
@@ -0,0 +1,147 @@
+"""
+Perfil (profiling) opcional das requisições da API. Requisições escolhidas
+por cabeçalho ou por amostragem são medidas com cProfile, com o resultado
+salvo em disco, e recebem um cabeçalho Server-Timing com o tempo no banco,
+na criação dos objetos FAQ e na serialização JSON. Desativado, a API não
+instala nenhum destes ganchos.
+"""
+
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+
+from flask.json.provider import DefaultJSONProvider
+
+CABECALHO = 'X-Perfil'  # Valor '1' pede o perfil da requisição (admin)
+MAX_ARQUIVOS = 100  # Arquivos .prof mantidos em disco; os mais antigos saem
+MAX_BYTES = 50 * 1024 * 1024  # Tamanho total dos .prof mantidos
+
+# Segundos gastos serializando JSON, acumulados por thread
+_serializacao = threading.local()
+
+
+def tempo_serializacao():
+    """Segundos gastos pela thread atual em serialização JSON (acumulado)."""
+    return getattr(_serializacao, 'total', 0.0)
+
+
+def somar_serializacao(segundos):
+    """Soma à thread atual serialização feita fora do app.json (ex.: FAQ.to_json)."""
+    _serializacao.total = tempo_serializacao() + segundos
+
+
+class ProvedorJSONMedido(DefaultJSONProvider):
+    """Provedor JSON do Flask que mede o tempo de cada dumps (tempo_serializacao)."""
+
+    def dumps(self, obj, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            somar_serializacao(time.perf_counter() - inicio)
+
+
+def server_timing(etapas):
+    """
+    Valor do cabeçalho Server-Timing para durações em segundos.
+
+    Example:
+        >>> server_timing({'db': 0.0123, 'total': 0.02})
+        'db;dur=12.300, total;dur=20.000'
+    """
+    return ', '.join(
+        f'{nome};dur={segundos * 1000:.3f}' for nome, segundos in etapas.items()
+    )
+
+
+class PerfilRequisicoes:
+    """
+    Escolhe as requisições a medir e grava o cProfile de cada uma em
+    `diretorio` (um arquivo .prof por requisição, legível com pstats ou
+    snakeviz). Só um cProfile roda por vez; requisições escolhidas enquanto
+    outra está sendo medida recebem apenas o Server-Timing. Depois de cada
+    gravação, os arquivos mais antigos do diretório são apagados até restarem
+    `max_arquivos`, somando no máximo `max_bytes`.
+
+    Args:
+        diretorio (str): Onde salvar os arquivos .prof.
+        amostragem (float): Fração das requisições medidas sem o cabeçalho.
+        cabecalho (str): Cabeçalho que, com valor '1', pede o perfil.
+        max_arquivos (int): Arquivos .prof mantidos.
+        max_bytes (int): Tamanho total dos arquivos .prof mantidos.
+    """
+
+    def __init__(
+        self,
+        diretorio,
+        amostragem=0.0,
+        cabecalho=CABECALHO,
+        max_arquivos=MAX_ARQUIVOS,
+        max_bytes=MAX_BYTES,
+    ):
+        self.diretorio = diretorio
+        self.amostragem = amostragem
+        self.cabecalho = cabecalho
+        self.max_arquivos = max_arquivos
+        self.max_bytes = max_bytes
+        self._ocupado = threading.Lock()
+        self._gravando = threading.Lock()
+
+    def selecionar(self, headers, autorizado=False):
+        """
+        Indica se a requisição com estes cabeçalhos deve ser medida. O
+        cabeçalho só vale se `autorizado` (token de admin conferido pela API).
+        """
+        if autorizado and headers.get(self.cabecalho) == '1':
+            return True
+        return self.amostragem > 0 and random.random() < self.amostragem
+
+    def iniciar(self):
+        """Liga o cProfile na thread atual; None se outro já estiver ativo."""
+        if not self._ocupado.acquire(blocking=False):
+            return None
+        perfil = cProfile.Profile()
+        perfil.enable()
+        return perfil
+
+    def parar(self, perfil):
+        """Desliga o cProfile iniciado por iniciar()."""
+        perfil.disable()
+        self._ocupado.release()
+
+    def salvar(self, perfil, metodo, rota, duracao):
+        """Grava o perfil, apaga os excedentes e retorna o nome do arquivo."""
+        os.makedirs(self.diretorio, exist_ok=True)
+        rota = re.sub(r'[^A-Za-z0-9]+', '_', rota).strip('_') or 'raiz'
+        nome = (
+            f'{datetime.now():%Y%m%d-%H%M%S-%f}_{metodo}_{rota}_'
+            f'{duracao * 1000:.0f}ms.prof'
+        )
+        with self._gravando:
+            perfil.dump_stats(os.path.join(self.diretorio, nome))
+            self._limitar()
+        return nome
+
+    def _limitar(self):
+        """Apaga os .prof mais antigos além de max_arquivos e max_bytes."""
+        # O nome começa pela data e hora: a ordem alfabética é a cronológica
+        arquivos = sorted(
+            (entrada.name, entrada.stat().st_size)
+            for entrada in os.scandir(self.diretorio)
+            if entrada.name.endswith('.prof') and entrada.is_file()
+        )
+        restantes = len(arquivos)
+        total = sum(tamanho for _, tamanho in arquivos)
+        for nome, tamanho in arquivos:
+            if restantes <= self.max_arquivos and total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.diretorio, nome))
+            except FileNotFoundError:
+                pass
+            restantes -= 1
+            total -= tamanho
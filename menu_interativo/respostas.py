@@ -0,0 +1,60 @@
+"""
+Cache das respostas já serializadas da API: corpo em bytes, cabeçalhos e ETag,
+por rota e parâmetros. Um acerto devolve os bytes guardados sem consultar o
+banco, montar objetos FAQ ou passar pelo encoder JSON.
+"""
+
+from cache import CacheLRU
+
+
+class RespostaGuardada:
+    """
+    Resposta 200 pronta para ser reenviada.
+
+    Args:
+        corpo (bytes): Corpo já codificado.
+        cabecalhos (list): Pares (nome, valor), sem Content-Length.
+        etag (str): ETag da resposta (sem aspas), ou None.
+    """
+
+    __slots__ = ('corpo', 'cabecalhos', 'etag')
+
+    def __init__(self, corpo, cabecalhos, etag=None):
+        self.corpo = corpo
+        self.cabecalhos = cabecalhos
+        self.etag = etag
+
+
+def chave_resposta(rota, parametros_rota, args):
+    """
+    Chave do cache: rota (endpoint), parâmetros do caminho e da query string.
+    A ordem dos parâmetros na URL não importa.
+
+    Example:
+        >>> chave_resposta('listar_faqs', {}, [('page', '1'), ('ativo', '1')]) == (
+        ...     chave_resposta('listar_faqs', {}, [('ativo', '1'), ('page', '1')])
+        ... )
+        True
+    """
+    return (rota, tuple(sorted(parametros_rota.items())), tuple(sorted(args)))
+
+
+class CacheRespostas(CacheLRU):
+    """
+    CacheLRU de RespostaGuardada. A API o esvazia a cada escrita do FaqDB
+    (ver FaqDB.ao_alterar); escritas de outros processos só aparecem após o
+    TTL, como no cache de leituras.
+
+    Example:
+        >>> cache = CacheRespostas(max_entradas=8, ttl=60)
+        >>> cabecalhos = [('Content-Type', 'application/json')]
+        >>> cache.guardar('a', RespostaGuardada(b'[]', cabecalhos))
+        >>> cache.estatisticas()['bytes']
+        2
+    """
+
+    def estatisticas(self):
+        """Contadores do CacheLRU e o total de bytes dos corpos guardados."""
+        estatisticas = super().estatisticas()
+        estatisticas['bytes'] = sum(len(r.corpo) for _, r in self.valores())
+        return estatisticas
@@ -0,0 +1,237 @@
+"""
+Detecção de perguntas quase duplicadas por similaridade de cosseno entre
+vetores TF-IDF de n-gramas de caracteres, calculada com NumPy em lote.
+A matriz das perguntas existentes é mantida em memória e atualizada
+incrementalmente pelas escritas do FaqDB (FaqDB.espelhar).
+"""
+
+import threading
+import zlib
+
+import numpy as np
+
+from busca import normalizar
+
+DIMENSOES = 1024  # Colunas da matriz (n-gramas agrupados por hash)
+TAMANHO_NGRAMA = 3
+# Limite de células da matriz de similaridades calculada de uma vez no modo
+# em lote (perguntas x FAQs; 2**24 floats = 64 MB)
+MAX_CELULAS_LOTE = 1 << 24
+
+
+def ngramas(texto, n=TAMANHO_NGRAMA):
+    """N-gramas de caracteres do texto normalizado, com espaços nas bordas."""
+    texto = f' {" ".join(normalizar(texto).split())} '
+    return [texto[i : i + n] for i in range(len(texto) - n + 1)]
+
+
+def verificar_pergunta(detector, pergunta, top_k, limiar, rejeitar_acima=None):
+    """
+    Confere uma pergunta antes de inseri-la: as até `top_k` perguntas
+    existentes com similaridade >= `limiar` e se a mais parecida atinge
+    `rejeitar_acima` (a inserção deve ser recusada; None nunca recusa).
+    Retorna ([(FAQ, similaridade)], recusar).
+    """
+    if rejeitar_acima is None:
+        return detector.similares(pergunta, top_k, limiar), False
+    similares = detector.similares(pergunta, top_k, min(limiar, rejeitar_acima))
+    recusar = bool(similares) and similares[0][1] >= rejeitar_acima
+    return [(faq, valor) for faq, valor in similares if valor >= limiar], recusar
+
+
+class DetectorDuplicatas:
+    """
+    Encontra, entre os FAQs conhecidos, as perguntas mais parecidas com uma
+    pergunta nova.
+
+    Cada pergunta vira um vetor de contagens de n-gramas (agrupados em
+    `dimensoes` colunas por hash), ponderado pelo IDF de cada coluna. A norma
+    de uma linha, sqrt(Σ m² · (a - l)²) com a = log(1 + total) + 1 e
+    l = log(1 + df), é mantida em três somas por linha (Σ m², Σ m² · l e
+    Σ m² · l²): inserir ou remover uma pergunta calcula as somas da sua linha
+    e corrige as das demais só nas colunas cujo df mudou.
+
+    As consultas usam um instantâneo (matriz, pesos e normas) tomado sob o
+    lock e calculam as similaridades fora dele. A matriz do instantâneo é
+    compartilhada; a primeira escrita depois dele a copia antes de alterá-la.
+
+    Args:
+        dimensoes (int): Colunas da matriz (memória: 4 bytes por coluna por FAQ).
+        n (int): Tamanho dos n-gramas de caracteres.
+
+    Example:
+        >>> from models import FAQ
+        >>> detector = DetectorDuplicatas()
+        >>> faq = FAQ(1, 'Como altero minha senha?', '...', 1, None, 'CONTA')
+        >>> detector.carregar([faq])
+        >>> similares = detector.similares('Como alterar a senha')
+        >>> [(faq.id, round(s, 2)) for faq, s in similares]
+        [(1, 0.58)]
+    """
+
+    def __init__(self, dimensoes=DIMENSOES, n=TAMANHO_NGRAMA):
+        self.dimensoes = dimensoes
+        self.n = n
+        self._lock = threading.Lock()
+        self._limpar()
+
+    def _limpar(self, capacidade=64):
+        self._matriz = np.zeros((capacidade, self.dimensoes), dtype=np.float32)
+        self._faqs = []  # FAQ de cada linha da matriz
+        self._linhas = {}  # id_faq -> linha da matriz
+        self._df = np.zeros(self.dimensoes)
+        self._log_df = np.zeros(self.dimensoes)  # log(1 + df) de cada coluna
+        self._somas = np.zeros((capacidade, 3))  # Σ m², Σ m² · l, Σ m² · l²
+        # (FAQs, matriz, idf², normas) das consultas; None = refazer
+        self._instantaneo = None
+
+    def vetorizar(self, textos):
+        """Matriz (len(textos) x dimensoes) com as contagens de n-gramas."""
+        posicoes = [
+            i * self.dimensoes + zlib.crc32(ngrama.encode()) % self.dimensoes
+            for i, texto in enumerate(textos)
+            for ngrama in ngramas(texto, self.n)
+        ]
+        contagens = np.bincount(posicoes, minlength=len(textos) * self.dimensoes)
+        return contagens.astype(np.float32).reshape(len(textos), self.dimensoes)
+
+    def _preparar_escrita(self):
+        """Copia a matriz se um instantâneo das consultas ainda a usa."""
+        if self._instantaneo is not None:
+            self._matriz = self._matriz.copy()
+            self._instantaneo = None
+
+    def _atualizar_df(self, vetor, sinal):
+        """Soma `sinal` ao df das colunas de `vetor` e corrige as somas."""
+        colunas = np.flatnonzero(vetor)
+        self._df[colunas] += sinal
+        novo = np.log1p(self._df[colunas])
+        antigo = self._log_df[colunas]
+        self._log_df[colunas] = novo
+        total = len(self._faqs)
+        quadrados = np.square(self._matriz[:total, colunas], dtype=np.float64)
+        self._somas[:total, 1] += quadrados @ (novo - antigo)
+        self._somas[:total, 2] += quadrados @ (novo * novo - antigo * antigo)
+
+    def _inserir(self, faq, vetor):
+        linha = len(self._faqs)
+        if linha == len(self._matriz):
+            # Cresce dobrando a capacidade: inserções custam O(1) amortizado
+            self._matriz = np.concatenate([self._matriz, np.zeros_like(self._matriz)])
+            self._somas = np.concatenate([self._somas, np.zeros_like(self._somas)])
+        self._matriz[linha] = vetor
+        self._faqs.append(faq)
+        self._linhas[faq.id] = linha
+        quadrados = np.square(vetor, dtype=np.float64)
+        log_df = self._log_df
+        self._somas[linha] = (
+            quadrados.sum(),
+            quadrados @ log_df,
+            quadrados @ (log_df * log_df),
+        )
+        self._atualizar_df(vetor, 1)
+
+    def _retirar(self, id):
+        linha = self._linhas.pop(id, None)
+        if linha is None:
+            return
+        self._atualizar_df(self._matriz[linha], -1)
+        # Move a última linha para o lugar da removida
+        ultima = len(self._faqs) - 1
+        if linha != ultima:
+            self._matriz[linha] = self._matriz[ultima]
+            self._somas[linha] = self._somas[ultima]
+            self._faqs[linha] = self._faqs[ultima]
+            self._linhas[self._faqs[linha].id] = linha
+        self._matriz[ultima] = 0
+        self._somas[ultima] = 0
+        self._faqs.pop()
+
+    def carregar(self, faqs):
+        """Reconstrói a matriz a partir de uma lista completa de FAQs."""
+        faqs = list(faqs)
+        vetores = self.vetorizar([faq.pergunta for faq in faqs])
+        with self._lock:
+            # Folga para as próximas inserções sem realocar a matriz
+            self._limpar(max(64, len(faqs) * 5 // 4))
+            for faq, vetor in zip(faqs, vetores):
+                self._inserir(faq, vetor)
+
+    def adicionar(self, faq):
+        """Inclui (ou substitui) a pergunta de um FAQ."""
+        vetor = self.vetorizar([faq.pergunta])[0]
+        with self._lock:
+            self._preparar_escrita()
+            self._retirar(faq.id)
+            self._inserir(faq, vetor)
+
+    def remover(self, id):
+        """Retira um FAQ da matriz, se presente."""
+        with self._lock:
+            if id in self._linhas:
+                self._preparar_escrita()
+                self._retirar(id)
+
+    def _instantaneo_atual(self):
+        """(FAQs, matriz, idf², normas) das linhas atuais. Chamado com o lock."""
+        if self._instantaneo is None:
+            total = len(self._faqs)
+            a = np.log1p(total) + 1
+            idf = a - self._log_df
+            s0, s1, s2 = self._somas[:total].T
+            normas = np.sqrt(np.maximum(a * a * s0 - 2 * a * s1 + s2, 0))
+            normas[normas == 0] = 1
+            self._instantaneo = (
+                tuple(self._faqs),
+                self._matriz[:total],
+                (idf * idf).astype(np.float32),
+                normas.astype(np.float32),
+            )
+        return self._instantaneo
+
+    def similares_lote(self, perguntas, k=5, limiar=0.0):
+        """
+        Para cada pergunta, as até `k` perguntas existentes mais parecidas com
+        similaridade >= `limiar`, como listas de (FAQ, similaridade).
+        Todas as perguntas são comparadas com multiplicações de matrizes, em
+        blocos limitados a MAX_CELULAS_LOTE similaridades.
+        """
+        consultas = self.vetorizar(perguntas)
+        with self._lock:
+            faqs, matriz, idf2, normas = self._instantaneo_atual()
+        total = len(faqs)
+        if not total:
+            return [[] for _ in perguntas]
+        resultados = []
+        k = min(k, total)
+        tamanho_bloco = max(1, MAX_CELULAS_LOTE // total)
+        for inicio in range(0, len(consultas), tamanho_bloco):
+            bloco = consultas[inicio : inicio + tamanho_bloco]
+            normas_bloco = np.sqrt(np.einsum('ij,ij,j->i', bloco, bloco, idf2))
+            normas_bloco[normas_bloco == 0] = 1
+            scores = (bloco * idf2) @ matriz.T
+            scores /= normas_bloco[:, None] * normas[None, :]
+            melhores = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for linha, colunas in zip(scores, melhores):
+                ordenadas = colunas[np.argsort(-linha[colunas])]
+                resultados.append(
+                    [
+                        (faqs[c], float(linha[c]))
+                        for c in ordenadas
+                        if linha[c] >= limiar
+                    ]
+                )
+        return resultados
+
+    def similares(self, pergunta, k=5, limiar=0.0):
+        """As até `k` perguntas mais parecidas com `pergunta`."""
+        return self.similares_lote([pergunta], k, limiar)[0]
+
+    def estatisticas(self):
+        """Retorna o tamanho da matriz."""
+        with self._lock:
+            return {
+                'perguntas': len(self._faqs),
+                'dimensoes': self.dimensoes,
+                'bytes': int(self._matriz.nbytes),
+            }
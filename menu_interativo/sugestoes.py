@@ -0,0 +1,274 @@
+"""
+Índice de prefixos em memória para o autocompletar de perguntas e categorias.
+As perguntas normalizadas ficam concatenadas em um único texto e as posições
+de início (da pergunta e de cada palavra) em arrays ordenados, consultados por
+busca binária. Mantido em dia pelas escritas do FaqDB (FaqDB.espelhar).
+"""
+
+import bisect
+import struct
+import sys
+import threading
+from array import array
+
+from busca import normalizar
+
+LIMITE_DELTA = 1024  # Alterações acumuladas antes de reconstruir a base
+TAMANHO_CHAVE = 40  # Caracteres comparados (prefixos maiores são truncados)
+# Memória de uma entrada do delta além do texto: a tupla (texto, id) e o seu
+# ponteiro na lista (o id é o mesmo int do FAQ, já contado fora do índice)
+BYTES_ENTRADA_DELTA = sys.getsizeof((None, None)) + struct.calcsize('P')
+
+
+def normalizar_prefixo(texto):
+    """Normaliza como as perguntas indexadas (sem acentos, minúsculo, um espaço)."""
+    return ' '.join(normalizar(texto).split())
+
+
+def _inicios_de_palavra(texto):
+    """Posições (exceto a 0) em que começa uma palavra de `texto`."""
+    return [i for i in range(1, len(texto)) if texto[i - 1] == ' ']
+
+
+class _Base:
+    """Parte imutável do índice: texto único e arrays de posições ordenadas."""
+
+    def __init__(self, faqs):
+        textos = [(faq.id, normalizar_prefixo(faq.pergunta)) for faq in faqs]
+        partes = []
+        inicios, palavras = [], []
+        posicao = 0
+        for id, texto in textos:
+            partes.append(texto)
+            inicios.append((posicao, id))
+            palavras.extend((posicao + i, id) for i in _inicios_de_palavra(texto))
+            posicao += len(texto) + 1
+        self.texto = '\n'.join(partes)
+
+        def ordenar(entradas):
+            entradas.sort(key=lambda e: self.texto[e[0] : e[0] + TAMANHO_CHAVE])
+            return array('I', [e[0] for e in entradas]), array(
+                'l', [e[1] for e in entradas]
+            )
+
+        self.inicios = ordenar(inicios)
+        self.palavras = ordenar(palavras)
+
+    def intervalo(self, posicoes, prefixo):
+        """Faixa [inicio, fim) de `posicoes` cujo texto começa com `prefixo`."""
+        texto, tamanho = self.texto, len(prefixo)
+        baixo, alto = 0, len(posicoes)
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            p = posicoes[meio]
+            if texto[p : p + tamanho] < prefixo:
+                baixo = meio + 1
+            else:
+                alto = meio
+        inicio, alto = baixo, len(posicoes)
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            p = posicoes[meio]
+            if texto[p : p + tamanho] <= prefixo:
+                baixo = meio + 1
+            else:
+                alto = meio
+        return inicio, baixo
+
+    def bytes(self):
+        return sys.getsizeof(self.texto) + sum(
+            a.itemsize * len(a) for a in (*self.inicios, *self.palavras)
+        )
+
+
+class IndiceSugestoes:
+    """
+    Sugestões por prefixo: FAQs ativos cuja pergunta (ou uma de suas palavras)
+    começa com o texto digitado, e categorias com esse prefixo.
+
+    Alterações vão para uma lista ordenada pequena (delta) e para um conjunto
+    de ids retirados da base; ao passar de `limite_delta` alterações, a base é
+    reconstruída com tudo.
+
+    Args:
+        limite_delta (int): Alterações acumuladas antes de reconstruir a base.
+
+    Example:
+        >>> from models import FAQ
+        >>> indice = IndiceSugestoes()
+        >>> indice.carregar([FAQ(1, 'Como altero a senha?', '...', 1, None, 'CONTA')])
+        >>> [faq.id for faq in indice.sugerir('sen')['faqs']]
+        [1]
+    """
+
+    def __init__(self, limite_delta=LIMITE_DELTA):
+        self.limite_delta = limite_delta
+        self._lock = threading.Lock()
+        self.carregar([])
+
+    def carregar(self, faqs):
+        """Reconstrói o índice a partir de uma lista completa de FAQs."""
+        faqs = {faq.id: faq for faq in faqs}
+        base = _Base(faqs.values())
+        categorias = {}
+        for faq in faqs.values():
+            chave = normalizar_prefixo(faq.categoria)
+            categorias.setdefault(chave, {})[faq.id] = faq.categoria
+        with self._lock:
+            self._faqs = faqs
+            self._base = base
+            self._retirados = set()  # ids da base substituídos ou removidos
+            self._delta_inicios = []  # (texto, id) ordenados
+            self._delta_palavras = []
+            self._categorias = categorias  # categoria normalizada -> {id: nome}
+            self._chaves_categorias = sorted(categorias)
+            self._alterados = None  # ids alterados durante uma reconstrução
+
+    def _retirar(self, id):
+        faq = self._faqs.pop(id, None)
+        if faq is None:
+            return
+        self._retirados.add(id)
+        if self._alterados is not None:
+            self._alterados.add(id)
+        self._delta_inicios = [e for e in self._delta_inicios if e[1] != id]
+        self._delta_palavras = [e for e in self._delta_palavras if e[1] != id]
+        chave = normalizar_prefixo(faq.categoria)
+        nomes = self._categorias.get(chave)
+        nomes.pop(id, None)
+        if not nomes:
+            del self._categorias[chave]
+            self._chaves_categorias.remove(chave)
+
+    def _incluir_delta(self, faq):
+        texto = normalizar_prefixo(faq.pergunta)
+        bisect.insort(self._delta_inicios, (texto, faq.id))
+        for i in _inicios_de_palavra(texto):
+            bisect.insort(self._delta_palavras, (texto[i:], faq.id))
+
+    def _reconstruir(self):
+        """
+        Refaz a base com os FAQs atuais, fora do lock. Alterações feitas
+        durante a reconstrução são registradas e reaplicadas como delta.
+        """
+        with self._lock:
+            if self._alterados is not None:
+                return  # Outra thread já está reconstruindo
+            if len(self._retirados) + len(self._delta_inicios) <= self.limite_delta:
+                return
+            faqs = list(self._faqs.values())
+            self._alterados = set()
+        base = _Base(faqs)
+        with self._lock:
+            alterados, self._alterados = self._alterados, None
+            if alterados is None:
+                return  # carregar() substituiu o índice durante a reconstrução
+            self._base = base
+            self._retirados = set(alterados)
+            self._delta_inicios, self._delta_palavras = [], []
+            for id in alterados:
+                if id in self._faqs:
+                    self._incluir_delta(self._faqs[id])
+
+    def adicionar(self, faq):
+        """Inclui (ou substitui) um FAQ."""
+        chave = normalizar_prefixo(faq.categoria)
+        with self._lock:
+            self._retirar(faq.id)
+            if self._alterados is not None:
+                self._alterados.add(faq.id)
+            self._faqs[faq.id] = faq
+            self._incluir_delta(faq)
+            if chave not in self._categorias:
+                bisect.insort(self._chaves_categorias, chave)
+            self._categorias.setdefault(chave, {})[faq.id] = faq.categoria
+        self._reconstruir()
+
+    def remover(self, id):
+        """Remove um FAQ, se presente."""
+        with self._lock:
+            self._retirar(id)
+        self._reconstruir()
+
+    def _coletar(self, prefixo, posicoes, delta, limite, vistos, encontrados):
+        """Acrescenta a `encontrados` FAQs ativos da base e do delta, em ordem."""
+        base = self._base
+        inicio, fim = base.intervalo(posicoes[0], prefixo)
+        candidatos, ids = [], set()
+        for i in range(inicio, fim):
+            id = posicoes[1][i]
+            if id in self._retirados or id in vistos or id in ids:
+                continue
+            if self._faqs[id].ativo == 1:
+                p = posicoes[0][i]
+                candidatos.append((base.texto[p : p + TAMANHO_CHAVE], id))
+                ids.add(id)
+                if len(ids) == limite:
+                    break
+        i = bisect.bisect_left(delta, (prefixo,))
+        while i < len(delta) and delta[i][0].startswith(prefixo):
+            texto, id = delta[i]
+            if id not in vistos and self._faqs[id].ativo == 1:
+                candidatos.append((texto[:TAMANHO_CHAVE], id))
+            i += 1
+        for _, id in sorted(candidatos):
+            if len(encontrados) == limite:
+                return
+            if id not in vistos:
+                vistos.add(id)
+                encontrados.append(self._faqs[id])
+
+    def sugerir(self, prefixo, limite=10):
+        """
+        Retorna {'faqs': [...], 'categorias': [...]} com até `limite` FAQs ativos
+        (primeiro os que começam pelo prefixo, depois os que têm uma palavra
+        começando por ele) e até `limite` categorias.
+        """
+        prefixo = normalizar_prefixo(prefixo)[:TAMANHO_CHAVE]
+        if not prefixo:
+            return {'faqs': [], 'categorias': []}
+        encontrados, vistos = [], set()
+        with self._lock:
+            self._coletar(
+                prefixo,
+                self._base.inicios,
+                self._delta_inicios,
+                limite,
+                vistos,
+                encontrados,
+            )
+            if len(encontrados) < limite:
+                self._coletar(
+                    prefixo,
+                    self._base.palavras,
+                    self._delta_palavras,
+                    limite,
+                    vistos,
+                    encontrados,
+                )
+            chaves = self._chaves_categorias
+            i = bisect.bisect_left(chaves, prefixo)
+            categorias = []
+            while i < len(chaves) and chaves[i].startswith(prefixo):
+                if len(categorias) == limite:
+                    break
+                categorias.append(next(iter(self._categorias[chaves[i]].values())))
+                i += 1
+        return {'faqs': encontrados, 'categorias': categorias}
+
+    def estatisticas(self):
+        """Tamanho do índice e memória aproximada das estruturas de prefixo."""
+        with self._lock:
+            delta = sum(
+                sys.getsizeof(texto) + BYTES_ENTRADA_DELTA
+                for texto, _ in self._delta_inicios + self._delta_palavras
+            )
+            return {
+                'faqs': len(self._faqs),
+                'entradas': len(self._base.inicios[0])
+                + len(self._base.palavras[0])
+                + len(self._delta_inicios)
+                + len(self._delta_palavras),
+                'alteracoes_pendentes': len(self._retirados) + len(self._delta_inicios),
+                'bytes': self._base.bytes() + delta,
+            }
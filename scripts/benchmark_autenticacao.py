@@ -0,0 +1,72 @@
+"""
+Benchmark da autenticação das escritas: custo por requisição de autenticar no
+banco a cada chamada (banco.autenticar_admin) e de conferir um token assinado
+(EmissorTokens.verificar), com e sem uma lista de revogados. Usa o driver
+falso (oracle_fake) com a latência de rede informada, sem Oracle real.
+
+Uso: python scripts/benchmark_autenticacao.py [latencia_ms]
+"""
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+os.environ['DB_DRIVER'] = 'fake'
+os.environ['DB_URL'] = 'benchmark_autenticacao'
+
+import oracle_fake  # noqa: E402
+from autenticacao import EmissorTokens  # noqa: E402
+from banco import FaqDB  # noqa: E402
+
+REPETICOES = 2000
+REVOGADOS = 1000
+
+
+def medir(funcao, repeticoes=REPETICOES):
+    """Mediana e p99 (em microssegundos) de `repeticoes` chamadas."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1e6)
+    tempos.sort()
+    return statistics.median(tempos), tempos[int(len(tempos) * 0.99) - 1]
+
+
+def main():
+    latencia = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    db = FaqDB({'dsn': os.environ['DB_URL']}, silent=True)
+    oracle_fake.configurar(os.environ['DB_URL'], latencia_ms=latencia)
+    assert db.autenticar_admin('00000000000', '2000-01-01') is not None
+
+    emissor = EmissorTokens('segredo')
+    token, _ = emissor.emitir({'sub': 1, 'adm': 1})
+    com_revogados = EmissorTokens('segredo')
+    for _ in range(REVOGADOS):
+        com_revogados.revogar(com_revogados.emitir({'sub': 1})[0])
+
+    print(f'Latência simulada do banco: {latencia} ms\n')
+    print(f'{"autenticação por escrita":<34}{"p50 (us)":>10}{"p99 (us)":>10}')
+    for nome, funcao, repeticoes in (
+        (
+            'banco (autenticar_admin)',
+            lambda: db.autenticar_admin('00000000000', '2000-01-01'),
+            max(50, REPETICOES // 10),
+        ),
+        ('token (verificar)', lambda: emissor.verificar(token), REPETICOES),
+        (
+            f'token, {REVOGADOS} revogados',
+            lambda: com_revogados.verificar(token),
+            REPETICOES,
+        ),
+    ):
+        p50, p99 = medir(funcao, repeticoes)
+        print(f'{nome:<34}{p50:>10.1f}{p99:>10.1f}')
+    db.close(silent=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark da compressão das respostas: bytes enviados e CPU por requisição
+para uma página típica (10 FAQs), a página máxima (100) e a listagem completa,
+sem compressão, com gzip em alguns níveis, com br (se o pacote brotli estiver
+instalado) e reaproveitando o corpo comprimido pelo ETag. Usa FAQs sintéticos
+com respostas de até 600 caracteres, sem banco.
+
+Uso: python scripts/benchmark_compressao.py [faqs]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+
+from compressao import CompressorRespostas, brotli, comprimir  # noqa: E402
+from models import FAQ  # noqa: E402
+
+PALAVRAS = (
+    'para acessar sua conta informe o cpf e a senha cadastrados no aplicativo '
+    'caso não lembre clique em esqueci minha senha e siga as instruções enviadas '
+    'por email o prazo de entrega varia conforme a região e a forma de envio '
+    'escolhida pedidos pagos com boleto são liberados após a compensação que '
+    'pode levar até três dias úteis o cancelamento pode ser solicitado antes do '
+    'envio pela área de pedidos ou pelo atendimento nota fiscal fica disponível '
+    'após a emissão cartão de crédito parcelamento sem juros cupom de desconto'
+).split()
+CATEGORIAS = ('CONTA', 'PAGAMENTO', 'ENTREGA', 'SUPORTE', 'PEDIDOS', 'CADASTRO')
+REPETICOES = 200
+
+
+def gerar_faqs(total):
+    aleatorio = random.Random(0)
+    faqs = []
+    for id in range(1, total + 1):
+        pergunta = ' '.join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(6, 14)))
+        resposta = ' '.join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(20, 90)))
+        faqs.append(
+            FAQ(
+                id,
+                pergunta.capitalize() + '?',
+                resposta.capitalize()[:600] + '.',
+                1,
+                None,
+                CATEGORIAS[id % len(CATEGORIAS)],
+                1,
+            )
+        )
+    return faqs
+
+
+def corpo_listagem(faqs):
+    """Corpo de GET /faqs com os FAQs informados, como a API monta."""
+    itens = ','.join(faq.to_json() for faq in faqs)
+    return (
+        '{"items":[' + itens + f'],"page":1,"per_page":{len(faqs)},'
+        f'"total":{len(faqs)},"total_pages":1}}\n'
+    ).encode()
+
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    faqs = gerar_faqs(total)
+    corpos = (
+        ('página (10)', corpo_listagem(faqs[:10])),
+        ('página (100)', corpo_listagem(faqs[:100])),
+        (f'completa ({total})', corpo_listagem(faqs)),
+    )
+    variantes = [('gzip', nivel) for nivel in (1, 6, 9)]
+    if brotli is not None:
+        variantes += [('br', nivel) for nivel in (4, 5, 11)]
+    else:
+        print('(pacote brotli não instalado: br não medido)\n')
+
+    print(f'{"resposta":<18}{"codificação":<12}{"bytes":>10}{"razão":>8}{"us/req":>10}')
+    for nome, corpo in corpos:
+        repeticoes = max(5, REPETICOES * 10_000 // len(corpo))
+        print(f'{nome:<18}{"identity":<12}{len(corpo):>10}{1:>8.2f}{0:>10.1f}')
+        for codificacao, nivel in variantes:
+            comprimido, tempo = medir(
+                lambda: comprimir(corpo, codificacao, nivel, nivel), repeticoes
+            )
+            rotulo = f'{codificacao}-{nivel}'
+            razao = len(corpo) / len(comprimido)
+            print(
+                f'{"":<18}{rotulo:<12}{len(comprimido):>10}{razao:>8.2f}{tempo:>10.1f}'
+            )
+
+        # Caminho da API: o primeiro pedido comprime, os seguintes (mesmo ETag)
+        # reaproveitam o corpo comprimido
+        compressor = CompressorRespostas()
+        compressor.comprimir(corpo, 'gzip', etag=nome)
+        comprimido, tempo = medir(
+            lambda: compressor.comprimir(corpo, 'gzip', etag=nome), repeticoes
+        )
+        print(f'{"":<18}{"gzip (ETag)":<12}{len(comprimido):>10}{"":>8}{tempo:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark da exportação paralela: 1, 2, 4 e 8 threads lendo faixas de
+id_faq, cada uma com sua sessão do pool. Confere que todos os arquivos
+gerados são idênticos ao da exportação sequencial.
+Usa o driver falso (oracle_fake) com latência simulada, sem Oracle real.
+
+Uso: python scripts/benchmark_exportacao.py [linhas]
+"""
+
+import contextlib
+import filecmp
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+os.environ['DB_DRIVER'] = 'fake'
+
+import oracle_fake  # noqa: E402
+from banco import FaqDB  # noqa: E402
+from exportacao import MenuExportacao  # noqa: E402
+
+LATENCIA_MS = 2
+CUSTO_LINHA_US = 50
+WORKERS = (1, 2, 4, 8)
+
+
+def main():
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    config = {'user': 'bench', 'password': 'bench', 'dsn': 'benchmark_exportacao'}
+    oracle_fake.popular(linhas, dsn=config['dsn'])
+    oracle_fake.configurar(
+        dsn=config['dsn'], latencia_ms=LATENCIA_MS, custo_linha_us=CUSTO_LINHA_US
+    )
+    pool_config = {'min': 1, 'max': max(WORKERS), 'increment': 1, 'wait_timeout': 60000}
+    diretorio = tempfile.mkdtemp(prefix='benchmark_exportacao_')
+
+    print(f'{linhas} linhas, latência {LATENCIA_MS} ms + {CUSTO_LINHA_US} us/linha\n')
+    print(f'{"workers":>8}{"tempo (s)":>11}{"linhas/s":>11}{"speedup":>9}{"igual":>7}')
+
+    with FaqDB(config, silent=True, pool_config=pool_config) as db:
+        exportacao = MenuExportacao(db)
+        base = None
+        for workers in WORKERS:
+            caminho = os.path.join(diretorio, f'faq_{workers}.json')
+            inicio = time.perf_counter()
+            # Descarta as mensagens de show_message da exportação
+            with contextlib.redirect_stdout(io.StringIO()):
+                exportacao.exportar_json(caminho=caminho, workers=workers)
+            tempo = time.perf_counter() - inicio
+            if base is None:
+                base = (tempo, caminho)
+            igual = filecmp.cmp(base[1], caminho, shallow=False)
+            print(
+                f'{workers:>8}{tempo:>11.2f}{linhas / tempo:>11.0f}'
+                f'{base[0] / tempo:>8.1f}x{"sim" if igual else "NÃO":>7}'
+            )
+
+
+if __name__ == '__main__':
+    main()
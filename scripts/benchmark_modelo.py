@@ -0,0 +1,155 @@
+"""
+Benchmark do modelo FAQ: memória por linha, tempo de criação e vazão da
+serialização JSON de uma listagem, comparando a classe anterior (atributos em
+__dict__, serializada via faq.__dict__) com a atual (__slots__, to_dict e
+to_json). Usa linhas sintéticas, sem banco.
+
+Uso: python scripts/benchmark_modelo.py [linhas]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+
+from models import FAQ, data_http  # noqa: E402
+
+PAGINA = 100  # FAQs por resposta nas medições de serialização
+REPETICOES = 200
+
+
+class FAQAnterior:
+    """Cópia do modelo antes do __slots__ (atributos em __dict__)."""
+
+    def __init__(
+        self,
+        id,
+        pergunta,
+        resposta,
+        ativo,
+        atualizado_em,
+        categoria,
+        user_account_id_user=None,
+    ):
+        self.id = id
+        self.pergunta = pergunta
+        self.resposta = resposta
+        self.ativo = ativo
+        self.atualizado_em = atualizado_em
+        self.categoria = categoria
+        self.user_account_id_user = user_account_id_user
+
+
+def gerar_linhas(total):
+    base = datetime(2025, 1, 1)
+    return [
+        (
+            id,
+            f'Como faço para alterar o item {id} do meu pedido?',
+            f'Acesse Minha conta > Pedidos e escolha o item {id}.',
+            1,
+            base + timedelta(minutes=id),
+            ('CONTA', 'PAGAMENTO', 'ENTREGA')[id % 3],
+            1,
+        )
+        for id in range(1, total + 1)
+    ]
+
+
+def medir_criacao(classe, linhas):
+    """Bytes por objeto (tracemalloc) e microssegundos por objeto criado."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    inicio = time.perf_counter()
+    objetos = [classe(*linha) for linha in linhas]
+    duracao = time.perf_counter() - inicio
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Desconta a lista que guarda os objetos
+    por_objeto = (depois - antes - sys.getsizeof(objetos)) / len(objetos)
+    return objetos, por_objeto, duracao / len(objetos) * 1e6
+
+
+def _padrao(valor):
+    # Mesmo tratamento de datas do jsonify
+    return data_http(valor)
+
+
+def serializar_anterior(pagina):
+    return json.dumps(
+        {'items': [faq.__dict__ for faq in pagina]},
+        default=_padrao,
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+
+
+def serializar_to_dict(pagina):
+    return json.dumps(
+        {'items': [faq.to_dict() for faq in pagina]},
+        default=_padrao,
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+
+
+def serializar_to_json(pagina):
+    return '{"items":[' + ','.join(faq.to_json() for faq in pagina) + ']}'
+
+
+def medir_serializacao(serializar, paginas):
+    inicio = time.perf_counter()
+    tamanho = 0
+    for pagina in paginas:
+        tamanho += len(serializar(pagina))
+    duracao = time.perf_counter() - inicio
+    linhas = sum(len(pagina) for pagina in paginas)
+    return linhas / duracao, tamanho / duracao / 2**20
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    linhas = gerar_linhas(total)
+
+    anteriores, memoria_anterior, criacao_anterior = medir_criacao(FAQAnterior, linhas)
+    atuais, memoria_atual, criacao_atual = medir_criacao(FAQ, linhas)
+    # Os textos são compartilhados pelas duas classes (criados em gerar_linhas)
+    print(f'{total} linhas (memória do objeto, sem os textos)\n')
+    print(f'{"modelo":<22}{"bytes/linha":>12}{"criação (us)":>14}')
+    print(f'{"__dict__":<22}{memoria_anterior:>12.0f}{criacao_anterior:>14.2f}')
+    print(f'{"__slots__":<22}{memoria_atual:>12.0f}{criacao_atual:>14.2f}')
+
+    # Páginas de PAGINA FAQs, como em GET /faqs; to_json é medido na primeira
+    # passada (gera e guarda) e nas seguintes (objetos vindos do cache)
+    inicios = range(0, min(total, PAGINA * REPETICOES), PAGINA)
+    paginas_anteriores = [anteriores[i : i + PAGINA] for i in inicios]
+    paginas_atuais = [atuais[i : i + PAGINA] for i in inicios]
+    assert serializar_anterior(paginas_anteriores[0]) == serializar_to_json(
+        paginas_atuais[0]
+    )
+    for atual in atuais:
+        atual._json = None
+
+    print(f'\n{"serialização":<22}{"linhas/s":>12}{"MB/s":>8}')
+    for nome, serializar, paginas in (
+        ('__dict__ + dumps', serializar_anterior, paginas_anteriores),
+        ('to_dict + dumps', serializar_to_dict, paginas_atuais),
+        ('to_json (1a vez)', serializar_to_json, paginas_atuais),
+        ('to_json (cache)', serializar_to_json, paginas_atuais),
+    ):
+        vazao, megas = medir_serializacao(serializar, paginas)
+        print(f'{nome:<22}{vazao:>12,.0f}{megas:>8.1f}')
+
+    guardados = [atual._json for atual in atuais if atual._json is not None]
+    print(
+        f'\nJSON guardado por to_json: '
+        f'{sum(map(sys.getsizeof, guardados)) / len(guardados):.0f} bytes/linha'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark dos endpoints de item único (GET/PUT/DELETE /faqs/<id>).
+Mostra que a latência não cresce com o tamanho da tabela, pois cada
+requisição faz uma única operação pela chave primária.
+Usa o driver falso (oracle_fake), sem Oracle real.
+
+Uso: python scripts/benchmark_pk.py [tamanho_maximo]
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).parent.parent / 'menu_interativo'
+sys.path.insert(0, str(RAIZ))
+os.environ['DB_DRIVER'] = 'fake'
+os.environ['DB_URL'] = 'benchmark_pk'
+
+import oracle_fake  # noqa: E402
+
+REPETICOES = 200
+TAMANHOS = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def carregar_api():
+    """Importa api/faq_api.py como módulo (ele cria o FaqDB na importação)."""
+    spec = importlib.util.spec_from_file_location(
+        'faq_api', RAIZ / 'api' / 'faq_api.py'
+    )
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def medir(funcao):
+    """Retorna a mediana e o p99 (em microssegundos) de REPETICOES chamadas."""
+    tempos = []
+    # Descarta as mensagens de show_message emitidas pelo banco.py
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(REPETICOES):
+            inicio = time.perf_counter()
+            funcao(i)
+            tempos.append((time.perf_counter() - inicio) * 1e6)
+    tempos.sort()
+    return statistics.median(tempos), tempos[int(len(tempos) * 0.99) - 1]
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHOS[-1]
+    api = carregar_api()
+    cliente = api.app.test_client()
+    dados = {'pergunta': 'Pergunta?', 'resposta': 'Resposta.', 'ativo': 1}
+
+    print(
+        f'{"linhas":>10}{"GET p50":>12}{"PUT p50":>12}{"DELETE p50":>12}{"GET p99":>12}'
+    )
+    atual = 0
+    for tamanho in (t for t in TAMANHOS if t <= maximo):
+        oracle_fake.popular(tamanho - atual, dsn='benchmark_pk')
+        atual = tamanho
+
+        get_p50, get_p99 = medir(lambda i: cliente.get(f'/faqs/{i * 37 % tamanho + 1}'))
+        put_p50, _ = medir(
+            lambda i: cliente.put(
+                f'/faqs/{tamanho - i}',
+                json={
+                    **dados,
+                    'pergunta': f'Pergunta {tamanho}-{i}?',
+                    'categoria': 'B',
+                },
+            )
+        )
+        # DELETE de IDs inexistentes: mede o caminho do 404 sem consumir linhas
+        delete_p50, _ = medir(lambda i: cliente.delete(f'/faqs/{tamanho * 10 + i}'))
+        print(
+            f'{tamanho:>10}{get_p50:>10.0f}us{put_p50:>10.0f}us'
+            f'{delete_p50:>10.0f}us{get_p99:>10.0f}us'
+        )
+
+
+if __name__ == '__main__':
+    main()
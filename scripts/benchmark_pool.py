@@ -0,0 +1,68 @@
+"""
+Benchmark de concorrência do FaqDB: conexão única x pool de sessões.
+Usa o driver falso (oracle_fake) com latência simulada, sem Oracle real.
+
+Uso: python scripts/benchmark_pool.py [threads] [operacoes_por_thread]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+os.environ['DB_DRIVER'] = 'fake'
+
+import oracle_fake  # noqa: E402
+from banco import FaqDB  # noqa: E402
+
+LATENCIA_MS = 5
+LINHAS = 200
+
+
+def executar(db, threads, operacoes):
+    """Executa `operacoes` buscas por ID em cada uma das `threads` e mede o tempo."""
+
+    def trabalho(indice):
+        db.abrir_sessao()
+        try:
+            for i in range(operacoes):
+                db.buscar_por_id((indice * operacoes + i) % LINHAS + 1)
+        finally:
+            db.encerrar_sessao()
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(trabalho, range(threads)))
+    return time.perf_counter() - inicio
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    operacoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    config = {'user': 'bench', 'password': 'bench', 'dsn': 'benchmark_pool'}
+    oracle_fake.popular(LINHAS, dsn=config['dsn'])
+    oracle_fake.configurar(dsn=config['dsn'], latencia_ms=LATENCIA_MS)
+    total = threads * operacoes
+
+    print(f'{threads} threads x {operacoes} operações, latência {LATENCIA_MS} ms\n')
+    print(f'{"modo":<22}{"tempo (s)":>10}{"ops/s":>10}{"espera média":>14}')
+
+    with FaqDB(config, silent=True) as db:
+        tempo = executar(db, threads, operacoes)
+        print(f'{"conexão única":<22}{tempo:>10.2f}{total / tempo:>10.0f}{"-":>14}')
+
+    for maximo in (2, 4, 8, 16):
+        pool_config = {'min': 1, 'max': maximo, 'increment': 1, 'wait_timeout': 60000}
+        with FaqDB(config, silent=True, pool_config=pool_config) as db:
+            tempo = executar(db, threads, operacoes)
+            espera = db.estatisticas_pool()['espera_media_ms']
+            print(
+                f'{"pool max=" + str(maximo):<22}{tempo:>10.2f}'
+                f'{total / tempo:>10.0f}{espera:>11.1f} ms'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark do autocompletar (IndiceSugestoes): tempo de carga, memória do
+índice e latência p50/p99 das sugestões por tamanho de prefixo, com e sem
+alterações pendentes. Usa perguntas sintéticas, sem banco.
+
+Uso: python scripts/benchmark_sugestoes.py [perguntas]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+
+from models import FAQ  # noqa: E402
+from sugestoes import IndiceSugestoes  # noqa: E402
+
+PALAVRAS = (
+    'como posso alterar cancelar pagar receber trocar devolver acompanhar '
+    'meu minha pedido senha cartão boleto entrega endereço cadastro conta '
+    'produto nota fiscal prazo frete cupom desconto assinatura plano suporte'
+).split()
+CATEGORIAS = ('CONTA', 'PAGAMENTO', 'ENTREGA', 'SUPORTE', 'PEDIDOS', 'CADASTRO')
+CONSULTAS = 2000
+ALTERACOES = 500
+
+
+def gerar_faqs(total, inicio=1):
+    aleatorio = random.Random(inicio)
+    return [
+        FAQ(
+            id,
+            ' '.join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(4, 9)))
+            + f' {id}?',
+            '...',
+            0 if id % 7 == 0 else 1,
+            None,
+            CATEGORIAS[id % len(CATEGORIAS)],
+        )
+        for id in range(inicio, inicio + total)
+    ]
+
+
+def medir(indice, prefixos):
+    tempos = []
+    for prefixo in prefixos:
+        inicio = time.perf_counter()
+        indice.sugerir(prefixo, 10)
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1e6, tempos[len(tempos) * 99 // 100] * 1e6
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    faqs = gerar_faqs(total)
+    indice = IndiceSugestoes()
+    inicio = time.perf_counter()
+    indice.carregar(faqs)
+    carga = time.perf_counter() - inicio
+    estatisticas = indice.estatisticas()
+    print(
+        f'{total} perguntas, {estatisticas["entradas"]} entradas, '
+        f'{estatisticas["bytes"] / 2**20:.1f} MB, carga em {carga:.2f} s\n'
+    )
+
+    aleatorio = random.Random(0)
+    print(f'{"prefixo":>12}{"p50 (us)":>10}{"p99 (us)":>10}')
+    for tamanho in (1, 3, 6, 12):
+        prefixos = [aleatorio.choice(faqs).pergunta[:tamanho] for _ in range(CONSULTAS)]
+        p50, p99 = medir(indice, prefixos)
+        print(f'{tamanho:>8} car{p50:>10.1f}{p99:>10.1f}')
+
+    novos = gerar_faqs(ALTERACOES, inicio=total + 1)
+    inicio = time.perf_counter()
+    for faq in novos:
+        indice.adicionar(faq)
+    for faq in aleatorio.sample(faqs, ALTERACOES):
+        indice.remover(faq.id)
+    escrita = (time.perf_counter() - inicio) / (2 * ALTERACOES) * 1e6
+    prefixos = [aleatorio.choice(novos).pergunta[:3] for _ in range(CONSULTAS)]
+    p50, p99 = medir(indice, prefixos)
+    print(
+        f'\ncom {2 * ALTERACOES} alterações pendentes ({escrita:.0f} us por escrita): '
+        f'p50 {p50:.1f} us, p99 {p99:.1f} us'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
 @echo off
-cd /d "%~dp0\..\menu_interativo"
-python api\faq_api.py
+cd /d "%~dp0\.."
+python scripts\servir_api.py
 pause
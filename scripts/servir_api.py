@@ -0,0 +1,48 @@
+"""
+Forma suportada de servir a API (scripts/run_api.bat): servidor WSGI do
+gevent, em que cada requisição é uma greenlet em vez de uma thread. Um
+cliente do feed GET /faqs/mudancas esperando por mudanças custa poucos KB, e
+não uma thread do servidor, por isso aqui o limite de clientes
+(MUDANCAS_MAX_CLIENTES) tem padrão MAX_CLIENTES_GEVENT.
+
+Uso: python scripts/servir_api.py [porta]
+"""
+
+import sys
+
+try:
+    from gevent import monkey
+except ImportError:
+    sys.exit('gevent não instalado: pip install -r requirements.txt')
+
+# Antes de qualquer outro import: locks, Conditions e sockets (inclusive os
+# do driver Thin do oracledb) passam a ceder a vez às outras greenlets
+monkey.patch_all()
+
+import os  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from dotenv import load_dotenv  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+
+MAX_CLIENTES_GEVENT = 1000
+PORTA_PADRAO = 5000
+
+RAIZ = Path(__file__).parent.parent
+sys.path.insert(0, str(RAIZ / 'menu_interativo'))
+
+
+def main():
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else PORTA_PADRAO
+    # O .env vale antes do padrão deste servidor
+    load_dotenv(dotenv_path=RAIZ / '.env')
+    os.environ.setdefault('MUDANCAS_MAX_CLIENTES', str(MAX_CLIENTES_GEVENT))
+
+    from api.faq_api import app
+
+    print(f'• Servidor (gevent): http://localhost:{porta}')
+    WSGIServer(('0.0.0.0', porta), app).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Verifica os índices e os planos de execução das consultas de banco.py
+(ver menu_interativo/esquema.py). Mostra os índices exigidos que faltam e,
+para cada constante SQL_*, o plano devolvido pelo EXPLAIN PLAN; termina com
+código 1 se alguma consulta quente fizer varredura completa. Com --aplicar,
+aplica antes as migrações pendentes e cria os índices que faltam.
+
+Usa o banco do .env (DB_USER, DB_PASS, DB_URL); com DB_DRIVER=fake, o driver
+falso.
+
+Uso: python scripts/verificar_esquema.py [--aplicar]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+
+import esquema  # noqa: E402
+from banco import FaqDB  # noqa: E402
+from config.settings import get_oracle_config  # noqa: E402
+
+
+def formatar_plano(plano):
+    """Operações do plano em uma linha (sem a linha '... STATEMENT')."""
+    return (
+        ' > '.join(
+            ' '.join(parte for parte in operacao if parte) for operacao in plano[1:]
+        )
+        or '-'
+    )
+
+
+def main():
+    with FaqDB(get_oracle_config(), silent=True) as db:
+        if '--aplicar' in sys.argv[1:]:
+            aplicados = db.aplicar_esquema()
+            if aplicados is None:
+                return 1
+            print(f'Migrações e índices aplicados: {", ".join(aplicados) or "nenhum"}')
+
+        with db.conexao() as conn:
+            existentes = esquema.indices_existentes(conn)
+        faltando = [
+            nome for nome, _, _ in esquema.INDICES if nome.upper() not in existentes
+        ]
+        print(f'Índices faltando: {", ".join(faltando) or "nenhum"}\n')
+
+        resultados = db.verificar_planos(exigir=False)
+        print(f'{"consulta":<36}{"situação":<12}plano')
+        for resultado in resultados:
+            if resultado['erro']:
+                situacao, plano = 'ERRO', resultado['erro']
+            else:
+                plano = formatar_plano(resultado['plano'])
+                if not resultado['ok']:
+                    situacao = 'VARREDURA'
+                elif resultado['varreduras']:
+                    situacao = 'permitida'
+                else:
+                    situacao = 'ok'
+            print(f'{resultado["consulta"]:<36}{situacao:<12}{plano}')
+
+    falhas = [r['consulta'] for r in resultados if not r['ok']]
+    if falhas:
+        print(f'\n{len(falhas)} consulta(s) quente(s) sem acesso por índice.')
+        return 1
+    print('\nNenhuma consulta quente com varredura completa.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
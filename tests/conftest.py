@@ -0,0 +1,75 @@
+"""
+Fixtures dos testes, sobre o driver Oracle falso (oracle_fake,
+DB_DRIVER=fake): cada DSN é um banco SQLite próprio, apagado ao fim do
+processo. `faqdb` abre um FaqDB em um banco novo por teste; `api` importa a
+API (que conecta ao banco de DB_URL na importação) uma vez por execução.
+"""
+
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Antes de importar banco.py e a API, que leem o ambiente na importação
+os.environ.update(
+    DB_DRIVER='fake',
+    DB_USER='teste',
+    DB_PASS='teste',
+    DB_URL=f'pytest-{os.getpid()}',
+    FAKE_DB_LINHAS='30',
+    AUTH_OBRIGATORIA='1',
+    AUTH_SEGREDO='segredo-dos-testes',
+    MUDANCAS_ESPERA='2',
+    MUDANCAS_HEARTBEAT='0.2',
+)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'menu_interativo'))
+
+from banco import FaqDB  # noqa: E402
+
+# Admin criado pelo driver falso
+CPF_ADMIN = '00000000000'
+NASCIMENTO_ADMIN = '2000-01-01'
+
+
+@pytest.fixture
+def faqdb():
+    """FaqDB com cache de leituras sobre um banco falso novo (30 FAQs)."""
+    config = {'user': 'teste', 'password': 'teste', 'dsn': f'pytest-{uuid.uuid4()}'}
+    with FaqDB(config, silent=True, cache_config={'max_entradas': 64, 'ttl': 60}) as db:
+        yield db
+
+
+@pytest.fixture(scope='session')
+def api():
+    from api import faq_api
+
+    return faq_api
+
+
+@pytest.fixture
+def cliente(api):
+    return api.app.test_client()
+
+
+@pytest.fixture
+def autorizacao(cliente):
+    """Cabeçalho Authorization com um token novo do admin."""
+    resposta = cliente.post(
+        '/auth/login', json={'cpf': CPF_ADMIN, 'nascimento': NASCIMENTO_ADMIN}
+    )
+    assert resposta.status_code == 200
+    return {'Authorization': f'Bearer {resposta.json["token"]}'}
+
+
+def campos_faq(**campos):
+    """Corpo de POST /faqs com pergunta e categoria únicas."""
+    sufixo = uuid.uuid4().hex[:8]
+    return {
+        'pergunta': f'Pergunta de teste {sufixo}?',
+        'resposta': f'Resposta de teste {sufixo}.',
+        'ativo': 1,
+        'categoria': f'TESTE_{sufixo.upper()}',
+        **campos,
+    }
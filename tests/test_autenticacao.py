@@ -0,0 +1,89 @@
+"""Sessões de admin: EmissorTokens e as rotas /auth da API."""
+
+import pytest
+from autenticacao import EmissorTokens, TokenInvalidoError
+from conftest import CPF_ADMIN, NASCIMENTO_ADMIN, campos_faq
+
+
+def _recusa(emissor, token):
+    with pytest.raises(TokenInvalidoError) as erro:
+        emissor.verificar(token)
+    return str(erro.value)
+
+
+def test_token_de_outro_segredo_ou_malformado_e_recusado():
+    emissor = EmissorTokens('segredo', ttl=60)
+    token, _ = EmissorTokens('outro', ttl=60).emitir({'sub': 1})
+
+    assert _recusa(emissor, token) == 'Assinatura inválida'
+    assert _recusa(emissor, 'sem-ponto') == 'Token malformado'
+    assert _recusa(emissor, 'não-ascii.x') == 'Token malformado'
+    assert emissor.estatisticas()['recusados'] == 3
+
+
+def test_processos_com_o_mesmo_segredo_aceitam_o_token():
+    token, claims = EmissorTokens('segredo', ttl=60).emitir({'sub': 7})
+
+    assert EmissorTokens('segredo').verificar(token) == claims
+
+
+def test_token_expira_e_revogado_sai_da_lista_ao_expirar(monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr('autenticacao.time.time', lambda: agora[0])
+    emissor = EmissorTokens('segredo', ttl=60)
+    antigo, _ = emissor.emitir({'sub': 1})
+    assert emissor.revogar(antigo)
+    assert not emissor.revogar(antigo)
+
+    agora[0] += 60
+    assert _recusa(emissor, antigo) == 'Token expirado'
+    novo, _ = emissor.emitir({'sub': 1})
+    assert emissor.revogar(novo)
+    assert emissor.estatisticas()['revogados'] == 1
+
+
+def test_escrita_sem_token_e_recusada(cliente):
+    resposta = cliente.post('/faqs', json=campos_faq())
+
+    assert resposta.status_code == 401
+    assert resposta.headers['WWW-Authenticate'] == 'Bearer'
+
+
+def test_login_com_credenciais_invalidas(cliente):
+    resposta = cliente.post(
+        '/auth/login', json={'cpf': '99999999999', 'nascimento': NASCIMENTO_ADMIN}
+    )
+
+    assert resposta.status_code == 401
+    assert cliente.post('/auth/login', json={}).status_code == 400
+
+
+def test_login_nao_volta_ao_banco_nas_escritas(api, cliente, monkeypatch):
+    resposta = cliente.post(
+        '/auth/login', json={'cpf': CPF_ADMIN, 'nascimento': NASCIMENTO_ADMIN}
+    )
+    autorizacao = {'Authorization': f'Bearer {resposta.json["token"]}'}
+    monkeypatch.setattr(api.db, 'autenticar_admin', pytest.fail)
+
+    resposta = cliente.post('/faqs', json=campos_faq(), headers=autorizacao)
+
+    assert resposta.status_code == 201
+
+
+def test_token_adulterado_e_recusado(cliente, autorizacao):
+    adulterado = {'Authorization': autorizacao['Authorization'][:-2] + 'xx'}
+
+    resposta = cliente.post('/faqs', json=campos_faq(), headers=adulterado)
+
+    assert resposta.status_code == 401
+
+
+def test_logout_revoga_o_token(cliente, autorizacao):
+    resposta = cliente.post('/faqs', json=campos_faq(), headers=autorizacao)
+    assert resposta.status_code == 201
+
+    assert cliente.post('/auth/logout', headers=autorizacao).status_code == 200
+
+    resposta = cliente.post('/faqs', json=campos_faq(), headers=autorizacao)
+    assert resposta.status_code == 401
+    assert resposta.json['erro'] == 'Token revogado'
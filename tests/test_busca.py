@@ -0,0 +1,94 @@
+"""Busca textual: IndiceBusca (BM25) e sua atualização incremental."""
+
+import pytest
+from busca import IndiceBusca, tokenizar
+from conftest import campos_faq
+from models import FAQ
+
+FAQS = [
+    FAQ(
+        1, 'Como pago com cartão?', 'Aceitamos cartão de crédito.', 1, None, 'PAGAMENTO'
+    ),
+    FAQ(
+        2,
+        'Posso pagar com boleto?',
+        'Sim, o boleto vence em 3 dias.',
+        1,
+        None,
+        'PAGAMENTO',
+    ),
+    FAQ(3, 'Como troco a senha?', 'Use a opção de senha do cartão.', 0, None, 'CONTA'),
+    FAQ(4, 'Qual o prazo de entrega?', 'A entrega leva 5 dias.', 1, None, 'ENTREGA'),
+]
+
+
+@pytest.fixture
+def indice():
+    indice = IndiceBusca()
+    indice.carregar(FAQS)
+    return indice
+
+
+def _ids(indice, consulta, **filtros):
+    resultados, _ = indice.buscar(consulta, **filtros)
+    return [faq.id for faq, _ in resultados]
+
+
+def test_tokenizar_ignora_acentos_caixa_e_stopwords():
+    assert tokenizar('Pagamento NÃO aprovado no Cartão') == [
+        'pagamento',
+        'aprovado',
+        'cartao',
+    ]
+
+
+def test_termo_na_pergunta_pesa_mais_que_na_resposta(indice):
+    resultados, total = indice.buscar('cartão')
+
+    assert [faq.id for faq, _ in resultados] == [1, 3]
+    assert total == 2
+    assert resultados[0][1] > resultados[1][1]
+
+
+def test_filtros_de_categoria_e_ativo(indice):
+    assert _ids(indice, 'cartao', categoria='conta') == [3]
+    assert _ids(indice, 'cartao', ativo=1) == [1]
+    assert _ids(indice, 'cartao', categoria='ENTREGA') == []
+
+
+def test_limite_nao_muda_o_total(indice):
+    resultados, total = indice.buscar('cartao dias', limite=1)
+
+    assert len(resultados) == 1
+    assert total == 4
+
+
+def test_atualizacao_incremental_igual_a_recarga(indice):
+    alterado = FAQ(
+        2, 'Posso pagar com pix?', 'Sim, o pix cai na hora.', 1, None, 'PAGAMENTO'
+    )
+    novo = FAQ(
+        5, 'Aceitam cartão de débito?', 'Sim, cartão de débito.', 1, None, 'PAGAMENTO'
+    )
+    indice.adicionar(alterado)
+    indice.adicionar(novo)
+    indice.remover(4)
+
+    recarregado = IndiceBusca()
+    recarregado.carregar([FAQS[0], alterado, FAQS[2], novo])
+    for consulta in ('cartao', 'pix', 'boleto', 'entrega', 'sim dias'):
+        assert indice.buscar(consulta) == recarregado.buscar(consulta), consulta
+    assert indice.estatisticas() == recarregado.estatisticas()
+
+
+def test_endpoint_de_busca_acompanha_as_escritas(cliente, autorizacao):
+    campos = campos_faq(pergunta='Como funciona o xilofone?')
+    assert cliente.get('/faqs/busca?q=xilofone').json['total'] == 0
+
+    id = cliente.post('/faqs', json=campos, headers=autorizacao).json['id']
+    dados = cliente.get('/faqs/busca?q=xilofone').json
+    assert [item['id'] for item in dados['items']] == [id]
+
+    cliente.delete(f'/faqs/{id}', headers=autorizacao)
+    assert cliente.get('/faqs/busca?q=xilofone').json['total'] == 0
+    assert cliente.get('/faqs/busca').status_code == 400
@@ -0,0 +1,75 @@
+"""Cache de leituras: CacheLRU e a leitura read-through do FaqDB."""
+
+import cache as modulo_cache
+from cache import CacheLRU
+
+
+def test_entrada_expira_pelo_ttl(monkeypatch):
+    agora = [100.0]
+    monkeypatch.setattr(modulo_cache.time, 'monotonic', lambda: agora[0])
+    cache = CacheLRU(max_entradas=4, ttl=10)
+    cache.guardar('a', 1)
+
+    agora[0] = 109.9
+    assert cache.obter('a') == 1
+    agora[0] = 110.0
+    assert cache.obter('a') is None
+    assert cache.estatisticas()['expiradas'] == 1
+
+
+def test_descarta_a_menos_usada_recentemente():
+    cache = CacheLRU(max_entradas=2, ttl=60)
+    cache.guardar('a', 1)
+    cache.guardar('b', 2)
+    cache.obter('a')  # 'b' passa a ser a menos usada
+
+    cache.guardar('c', 3)
+
+    assert [chave for chave, _ in cache.valores()] == ['a', 'c']
+    assert cache.estatisticas()['evictions'] == 1
+
+
+def test_leitura_anterior_a_uma_invalidacao_nao_e_guardada():
+    cache = CacheLRU()
+    geracao = cache.geracao  # leitura do banco começa aqui...
+    cache.invalidar('outra')  # ...uma escrita invalida no meio...
+
+    cache.guardar('a', 'obsoleto', geracao)  # ...e o resultado chega depois
+
+    assert cache.obter('a') is None
+    cache.guardar('a', 'novo', cache.geracao)
+    assert cache.obter('a') == 'novo'
+
+
+def test_invalidar_se_remove_so_as_entradas_afetadas():
+    cache = CacheLRU()
+    cache.guardar(('categoria', 'CONTA'), 1)
+    cache.guardar(('categoria', 'ENTREGA'), 2)
+
+    cache.invalidar_se(lambda chave, valor: chave[1] == 'CONTA')
+
+    assert cache.obter(('categoria', 'CONTA')) is None
+    assert cache.obter(('categoria', 'ENTREGA')) == 2
+
+
+def test_faqdb_le_do_cache_e_invalida_na_escrita(faqdb):
+    primeira = faqdb.listar(categoria='CONTA')
+    hits = faqdb.estatisticas_cache()['hits']
+    assert faqdb.listar(categoria='CONTA') == primeira
+    assert faqdb.estatisticas_cache()['hits'] == hits + 1
+
+    id = faqdb.adicionar('Nova pergunta da conta?', 'Resposta.', 1, 'CONTA', 1)
+
+    assert [faq.id for faq in faqdb.listar(categoria='CONTA')] == [id] + [
+        faq.id for faq in primeira
+    ]
+
+
+def test_escrita_em_outra_categoria_preserva_o_cache(faqdb):
+    faqdb.listar(categoria='CONTA')
+    faqdb.adicionar('Pergunta de entrega?', 'Resposta.', 1, 'ENTREGA', 1)
+    hits = faqdb.estatisticas_cache()['hits']
+
+    faqdb.listar(categoria='CONTA')
+
+    assert faqdb.estatisticas_cache()['hits'] == hits + 1
@@ -0,0 +1,71 @@
+"""Compressão das respostas: CompressorRespostas e o gancho da API."""
+
+import gzip
+
+from compressao import CompressorRespostas, comprimir
+from werkzeug.http import parse_accept_header
+
+
+def test_gzip_deterministico():
+    corpo = b'{"faqs": []}' * 100
+
+    assert comprimir(corpo, 'gzip') == comprimir(corpo, 'gzip')
+    assert gzip.decompress(comprimir(corpo, 'gzip')) == corpo
+
+
+def test_so_texto_a_partir_do_tamanho_minimo():
+    compressor = CompressorRespostas(min_bytes=100)
+
+    assert compressor.comprimivel('application/json', 100)
+    assert compressor.comprimivel('text/plain', 500)
+    assert not compressor.comprimivel('application/json', 99)
+    assert not compressor.comprimivel('image/png', 500)
+    assert not compressor.comprimivel(None, 500)
+
+
+def test_escolha_respeita_q_zero():
+    compressor = CompressorRespostas()
+    compressor.codificacoes = ('br', 'gzip')
+
+    assert compressor.escolher(parse_accept_header('gzip, br')) == 'br'
+    assert compressor.escolher(parse_accept_header('br;q=0, gzip')) == 'gzip'
+    assert compressor.escolher(parse_accept_header('identity')) is None
+
+
+def test_corpo_com_etag_comprimido_uma_vez():
+    compressor = CompressorRespostas(min_bytes=1)
+    corpo = b'x' * 2000
+
+    primeiro = compressor.comprimir(corpo, 'gzip', etag='v1')
+    assert compressor.comprimir(corpo, 'gzip', etag='v1') is primeiro
+    compressor.comprimir(corpo, 'gzip', etag='v2')
+    compressor.comprimir(corpo, 'gzip')
+
+    estatisticas = compressor.estatisticas()
+    assert (estatisticas['comprimidas'], estatisticas['reaproveitadas']) == (3, 1)
+    assert estatisticas['bytes_enviados'] < estatisticas['bytes_originais']
+
+
+def test_api_comprime_listagem_grande(cliente):
+    simples = cliente.get('/faqs?per_page=30')
+    assert len(simples.data) >= 1024
+
+    resposta = cliente.get('/faqs?per_page=30', headers={'Accept-Encoding': 'gzip'})
+
+    assert resposta.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in resposta.headers['Vary']
+    assert gzip.decompress(resposta.data) == simples.data
+
+
+def test_api_nao_comprime_corpo_pequeno_nem_304(cliente):
+    pequena = cliente.get('/faqs/1', headers={'Accept-Encoding': 'gzip'})
+    assert len(pequena.data) < 1024
+    assert 'Content-Encoding' not in pequena.headers
+
+    etag = cliente.get('/faqs?per_page=30').headers['ETag']
+    resposta = cliente.get(
+        '/faqs?per_page=30',
+        headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag},
+    )
+    assert resposta.status_code == 304
+    assert 'Content-Encoding' not in resposta.headers
@@ -0,0 +1,36 @@
+"""Instrumentação do SQL: EstatisticasSQL e GET /status/sql."""
+
+from estatisticas_sql import EstatisticasSQL
+
+
+def test_acumula_por_sql_e_guarda_as_lentas_sem_valores():
+    estatisticas = EstatisticasSQL(limiar_ms=100)
+    estatisticas.registrar('SQL_SELECT_ALL', 0.02, 30, 900, '')
+    estatisticas.registrar('SQL_SELECT_ALL', 0.2, 30, 900, '')
+    estatisticas.registrar('SQL_SELECT_BY_ID', 0.001, 1, 40, 'id=int')
+
+    (maior, menor) = estatisticas.resumo()
+
+    assert maior['sql'] == 'SQL_SELECT_ALL'
+    assert (maior['execucoes'], maior['linhas'], maior['lentas']) == (2, 60, 1)
+    assert maior['tempo_max_ms'] == 200.0
+    assert menor['sql'] == 'SQL_SELECT_BY_ID'
+    (lenta,) = estatisticas.lentas()
+    assert (lenta['sql'], lenta['binds']) == ('SQL_SELECT_ALL', '')
+
+
+def test_leituras_do_faqdb_aparecem_por_constante(faqdb):
+    faqdb.buscar_por_id(1)
+
+    nomes = {item['sql'] for item in faqdb.estatisticas_sql()['consultas']}
+
+    assert 'SQL_SELECT_BY_ID' in nomes
+
+
+def test_endpoint_exige_token_de_admin(cliente, autorizacao):
+    assert cliente.get('/status/sql').status_code == 401
+
+    resposta = cliente.get('/status/sql', headers=autorizacao)
+
+    assert resposta.status_code == 200
+    assert {'consultas', 'lentas'} <= set(resposta.json)
@@ -0,0 +1,103 @@
+"""ETag e GET condicional (304) em /faqs, /faqs/<id> e /categorias."""
+
+import os
+
+import pytest
+from banco import FaqDB
+from conftest import campos_faq
+
+
+@pytest.fixture
+def sem_cache_de_respostas(api, monkeypatch):
+    """Desliga o cache de respostas, para as requisições chegarem às views."""
+    monkeypatch.setattr(api, 'cache_respostas', None)
+
+
+def _etag(cliente, caminho):
+    resposta = cliente.get(caminho)
+    assert resposta.status_code == 200
+    return resposta.headers['ETag']
+
+
+@pytest.mark.parametrize(
+    'caminho', ['/faqs?per_page=5', '/faqs?limit=5', '/faqs/1', '/categorias']
+)
+def test_mesmo_etag_responde_304_sem_corpo(cliente, sem_cache_de_respostas, caminho):
+    etag = _etag(cliente, caminho)
+
+    resposta = cliente.get(caminho, headers={'If-None-Match': etag})
+
+    assert resposta.status_code == 304
+    assert resposta.data == b''
+    assert resposta.headers['ETag'] == etag
+
+
+def test_etag_depende_do_caminho(cliente, sem_cache_de_respostas):
+    assert _etag(cliente, '/faqs/1') != _etag(cliente, '/faqs/2')
+
+
+def test_304_de_um_faq_nao_le_nem_serializa_a_linha(
+    api, cliente, sem_cache_de_respostas, monkeypatch
+):
+    etag = _etag(cliente, '/faqs/1')
+    monkeypatch.setattr(api.db, 'buscar_por_id', pytest.fail)
+
+    resposta = cliente.get('/faqs/1', headers={'If-None-Match': etag})
+
+    assert resposta.status_code == 304
+
+
+def test_escrita_muda_o_etag(cliente, autorizacao, sem_cache_de_respostas):
+    etags = {c: _etag(cliente, c) for c in ('/faqs?per_page=5', '/faqs/1')}
+
+    resposta = cliente.post('/faqs', json=campos_faq(), headers=autorizacao)
+    assert resposta.status_code == 201
+
+    for caminho, etag in etags.items():
+        depois = cliente.get(caminho, headers={'If-None-Match': etag})
+        assert depois.status_code == 200, caminho
+        assert depois.headers['ETag'] != etag
+
+
+def test_escrita_de_outro_processo_muda_o_etag(cliente, sem_cache_de_respostas):
+    etag = _etag(cliente, '/categorias')
+    config = {'user': 'teste', 'password': 'teste', 'dsn': os.environ['DB_URL']}
+    with FaqDB(config, silent=True) as outro:
+        campos = campos_faq()
+        outro.adicionar(
+            campos['pergunta'], campos['resposta'], 1, campos['categoria'], 1
+        )
+
+    resposta = cliente.get('/categorias', headers={'If-None-Match': etag})
+
+    assert resposta.status_code == 200
+    assert campos['categoria'] in resposta.json
+
+
+def test_sem_a_tabela_de_versao_as_escritas_seguem(faqdb):
+    with faqdb.conexao() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute('DROP TABLE faq_versao')
+        conn.commit()
+    antes = faqdb.versao()
+    assert antes[1] == faqdb.contar()
+
+    id = faqdb.adicionar('Pergunta sem versão?', 'Resposta.', 1, 'CONTA', 1)
+    assert id is not None
+    depois = faqdb.versao()
+    assert depois != antes
+
+    assert faqdb.deletar(id) == 1
+    assert faqdb.versao() != depois
+
+
+def test_versao_de_escrita_propria_preserva_o_cache(faqdb):
+    faqdb.versao()
+    faqdb.listar(categoria='CONTA')
+    faqdb.adicionar('Pergunta de entrega?', 'Resposta.', 1, 'ENTREGA', 1)
+    faqdb.versao()
+    hits = faqdb.estatisticas_cache()['hits']
+
+    faqdb.listar(categoria='CONTA')
+
+    assert faqdb.estatisticas_cache()['hits'] == hits + 1
@@ -0,0 +1,150 @@
+"""Exportação dos FAQs em JSON/NDJSON, gravada e lida em streaming."""
+
+import io
+import json
+import uuid
+
+import exportacao
+import pytest
+from banco import FaqDB
+from exportacao import (
+    FORMATO_JSON,
+    FORMATO_NDJSON,
+    MODO_DELTA,
+    MODO_SNAPSHOT,
+    MenuExportacao,
+    escrever_json,
+    dividir_faixas,
+    escrever_ndjson,
+    ler_itens,
+    ler_watermark,
+)
+
+ITENS = [{'id': 2, 'pergunta': 'Ação?'}, {'id': 1, 'pergunta': 'Outra?'}]
+
+
+@pytest.mark.parametrize('itens', [ITENS, []])
+def test_escrever_json_igual_ao_json_dump(itens):
+    f = io.StringIO()
+
+    assert escrever_json(f, iter(itens)) == len(itens)
+    assert f.getvalue() == json.dumps(itens, indent=4, ensure_ascii=False)
+
+
+@pytest.mark.parametrize('escrever', [escrever_json, escrever_ndjson])
+def test_ler_itens_em_blocos_pequenos(tmp_path, escrever):
+    caminho = tmp_path / 'faqs'
+    with open(caminho, 'w', encoding='utf-8') as f:
+        escrever(f, ITENS)
+
+    # Blocos menores que um objeto: cada item é montado de vários blocos
+    assert list(ler_itens(caminho, tamanho_bloco=7)) == ITENS
+
+
+@pytest.mark.parametrize('formato', [FORMATO_JSON, FORMATO_NDJSON])
+def test_exportar_json_grava_todos_os_faqs(faqdb, tmp_path, formato):
+    caminho = str(tmp_path / f'faqs.{formato}')
+
+    MenuExportacao(faqdb).exportar_json(formato, caminho, workers=1)
+
+    itens = list(ler_itens(caminho))
+    assert [item['id'] for item in itens] == sorted(faqdb.listar_ids(), reverse=True)
+    assert set(itens[0]) == {
+        'id',
+        'pergunta',
+        'resposta',
+        'ativo',
+        'atualizado_em',
+        'categoria',
+    }
+
+
+@pytest.fixture
+def caminhos(tmp_path, monkeypatch):
+    """Arquivos de exportação (snapshot e delta) em um diretório temporário."""
+    caminhos = {
+        'json': str(tmp_path / 'faq_export.json'),
+        'delta': str(tmp_path / 'faq_delta.json'),
+    }
+    monkeypatch.setattr(exportacao, 'JSON_BANCO_PATH', caminhos['json'])
+    monkeypatch.setattr(exportacao, 'DELTA_BANCO_PATH', caminhos['delta'])
+    return caminhos
+
+
+def _alterar(faqdb):
+    """Atualiza, remove e insere um FAQ; retorna os ids (alterado, removido, novo)."""
+    alterado, removido = sorted(faqdb.listar_ids())[:2]
+    faq = faqdb.buscar_por_id(alterado)
+    faqdb.atualizar(alterado, faq.pergunta, 'Resposta nova.', 1, faq.categoria, 1)
+    faqdb.deletar(removido)
+    novo = faqdb.adicionar('Pergunta nova?', 'Resposta.', 1, 'CONTA', 1)
+    return alterado, removido, novo
+
+
+def test_watermark_guarda_a_maior_data_e_os_ids(faqdb, caminhos):
+    MenuExportacao(faqdb).exportar_json(FORMATO_JSON, workers=1)
+
+    watermark = ler_watermark(caminhos['json'])
+
+    assert watermark['ids'] == faqdb.listar_ids()
+    datas = [item['atualizado_em'] for item in ler_itens(caminhos['json'])]
+    assert str(watermark['atualizado_em']) == max(datas)
+
+
+def test_snapshot_incremental_igual_a_exportacao_completa(faqdb, caminhos, tmp_path):
+    menu = MenuExportacao(faqdb)
+    menu.exportar_incremental(MODO_SNAPSHOT)  # Sem watermark: exporta tudo
+    _alterar(faqdb)
+
+    menu.exportar_incremental(MODO_SNAPSHOT)
+
+    completa = str(tmp_path / 'completa.json')
+    menu.exportar_json(FORMATO_JSON, completa, workers=1)
+    assert list(ler_itens(caminhos['json'])) == list(ler_itens(completa))
+
+
+def test_delta_traz_alterados_e_removidos(faqdb, caminhos):
+    menu = MenuExportacao(faqdb)
+    menu.exportar_incremental(MODO_DELTA)  # Sem watermark: tudo é alteração
+    with open(caminhos['delta'], encoding='utf-8') as f:
+        assert len(json.load(f)['alterados']) == faqdb.contar()
+    alterado, removido, novo = _alterar(faqdb)
+
+    menu.exportar_incremental(MODO_DELTA)
+
+    with open(caminhos['delta'], encoding='utf-8') as f:
+        delta = json.load(f)
+    ids = {item['id'] for item in delta['alterados']}
+    # A sobreposição relê as linhas recentes, não só as alteradas
+    assert {alterado, novo} <= ids
+    assert delta['removidos'] == [removido]
+
+
+def test_dividir_faixas_cobre_o_intervalo_sem_sobrepor():
+    faixas = dividir_faixas(3, 20, 4)
+
+    assert faixas == [(16, 20), (11, 15), (6, 10), (3, 5)]
+    assert dividir_faixas(5, 6, 4) == [(6, 6), (5, 5)]
+
+
+@pytest.mark.parametrize('formato', [FORMATO_JSON, FORMATO_NDJSON])
+def test_exportacao_paralela_igual_a_sequencial(tmp_path, formato):
+    config = {'user': 'teste', 'password': 'teste', 'dsn': f'pytest-{uuid.uuid4()}'}
+    pool = {'min': 1, 'max': 4, 'increment': 1}
+    with FaqDB(config, silent=True, pool_config=pool) as db:
+        # Buracos nos ids: faixas com tamanhos diferentes, algumas vazias
+        for id in sorted(db.listar_ids())[3:12]:
+            db.deletar(id)
+        menu = MenuExportacao(db)
+        sequencial = str(tmp_path / f'sequencial.{formato}')
+        paralela = str(tmp_path / f'paralela.{formato}')
+
+        menu.exportar_json(formato, sequencial, workers=1)
+        checkouts = db.pool.checkouts
+        menu.exportar_json(formato, paralela, workers=3)
+
+        # Uma sessão por faixa, além dos limites de id_faq
+        assert db.pool.checkouts - checkouts > 3
+
+    with open(sequencial, encoding='utf-8') as a, open(paralela, encoding='utf-8') as b:
+        assert a.read() == b.read()
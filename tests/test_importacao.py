@@ -0,0 +1,68 @@
+"""Importação por MERGE: FaqDB.mesclar_lote e MenuExportacao.importar_json."""
+
+import json
+
+from conftest import campos_faq
+from exportacao import MenuExportacao
+
+
+def _linha(campos, usuario=None):
+    linha = (
+        campos['pergunta'],
+        campos['resposta'],
+        campos['ativo'],
+        campos['categoria'],
+    )
+    return linha if usuario is None else (*linha, usuario)
+
+
+def test_mesclar_lote_insere_atualiza_e_ignora(faqdb):
+    existente, igual, novo = campos_faq(), campos_faq(), campos_faq()
+    faqdb.adicionar_lote([_linha(existente, 1), _linha(igual, 1)])
+    (id_existente,) = [faq.id for faq in faqdb.listar(categoria=existente['categoria'])]
+
+    alterado = {**existente, 'resposta': 'Resposta nova.'}
+    resultado = faqdb.mesclar_lote([_linha(alterado), _linha(igual), _linha(novo)], 1)
+
+    assert {k: resultado[k] for k in ('inseridos', 'atualizados', 'ignorados')} == {
+        'inseridos': 1,
+        'atualizados': 1,
+        'ignorados': 1,
+    }
+    assert resultado['erros'] == []
+    (id_novo,) = [faq.id for faq in faqdb.listar(categoria=novo['categoria'])]
+    assert sorted(resultado['ids']) == sorted([id_existente, id_novo])
+    assert faqdb.buscar_por_id(id_existente).resposta == 'Resposta nova.'
+
+
+def test_mesclar_lote_simulado_nao_grava_nem_notifica(faqdb):
+    campos = campos_faq()
+    eventos = []
+    faqdb.ao_alterar(lambda tipo, ids: eventos.append((tipo, ids)))
+
+    resultado = faqdb.mesclar_lote([_linha(campos)], 1, simular=True)
+
+    assert resultado['inseridos'] == 1
+    assert faqdb.listar(categoria=campos['categoria']) == []
+    assert eventos == []
+
+
+def test_importar_json_usa_o_merge(faqdb, tmp_path):
+    existente = campos_faq()
+    faqdb.adicionar_lote([_linha(existente, 1)])
+    itens = [
+        {**existente, 'resposta': 'Atualizada pela importação.'},
+        campos_faq(),
+        campos_faq(),
+        {'pergunta': 'Sem os outros campos?'},
+    ]
+    itens.append(itens[1])  # Repetido no arquivo: ignorado
+    caminho = tmp_path / 'faqs.json'
+    caminho.write_text(json.dumps(itens), encoding='utf-8')
+
+    total = MenuExportacao(faqdb).importar_json(str(caminho))
+
+    assert (total['inseridos'], total['atualizados'], total['ignorados']) == (2, 1, 1)
+    assert [posicao for posicao, _ in total['erros']] == [3]
+    (faq,) = faqdb.listar(categoria=existente['categoria'])
+    assert faq.resposta == 'Atualizada pela importação.'
@@ -0,0 +1,62 @@
+"""Inserção em lote: POST /faqs/lote e FaqDB.adicionar_lote (batcherrors)."""
+
+from conftest import campos_faq
+
+
+def _linha(campos, usuario=1):
+    return (
+        campos['pergunta'],
+        campos['resposta'],
+        campos['ativo'],
+        campos['categoria'],
+        usuario,
+    )
+
+
+def test_adicionar_lote_devolve_os_ids_e_os_erros(faqdb):
+    repetido, outro = campos_faq(), campos_faq()
+
+    resultados = faqdb.adicionar_lote(
+        [_linha(repetido), _linha(repetido), _linha(outro)]
+    )
+
+    assert [r['ok'] for r in resultados] == [True, False, True]
+    assert 'UNIQUE' in resultados[1]['erro']
+    ids = [resultados[0]['id'], resultados[2]['id']]
+    assert [faq.pergunta for faq in faqdb.listar_por_ids(ids)] == [
+        repetido['pergunta'],
+        outro['pergunta'],
+    ]
+
+
+def test_adicionar_lote_valida_antes_do_banco(faqdb):
+    total = faqdb.contar()
+
+    resultados = faqdb.adicionar_lote([_linha(campos_faq(ativo=2))])
+
+    assert resultados == [{'indice': 0, 'ok': False, 'erro': 'ativo deve ser 0 ou 1'}]
+    assert faqdb.contar() == total
+
+
+def test_lote_com_falhas_parciais(api, cliente, autorizacao):
+    repetido = campos_faq()
+    lote = [repetido, repetido, {'pergunta': 'Sem resposta?'}, campos_faq()]
+
+    resposta = cliente.post('/faqs/lote', json=lote, headers=autorizacao)
+
+    assert resposta.status_code == 201
+    dados = resposta.json
+    assert (dados['total'], dados['inseridos'], dados['falhas']) == (4, 2, 2)
+    assert [r['ok'] for r in dados['resultados']] == [True, False, False, True]
+    assert 'UNIQUE' in dados['resultados'][1]['erros'][0]
+    (faq,) = api.db.listar(categoria=repetido['categoria'])
+    assert faq.pergunta == repetido['pergunta']
+
+
+def test_lote_sem_linhas_validas(cliente, autorizacao):
+    resposta = cliente.post(
+        '/faqs/lote', json=[{'pergunta': 'X?'}], headers=autorizacao
+    )
+
+    assert resposta.status_code == 400
+    assert resposta.json['inseridos'] == 0
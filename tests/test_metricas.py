@@ -0,0 +1,62 @@
+"""Métricas no formato do Prometheus: Metricas (fatias) e GET /metrics."""
+
+import threading
+
+import pytest
+from metricas import Metricas, formatar_metrica
+
+
+def test_registros_de_varias_threads_somados_na_coleta():
+    metricas = Metricas(fatias=4)
+
+    def registrar():
+        for _ in range(500):
+            metricas.iniciar()
+            metricas.registrar('GET', '/faqs', 200, 0.002, 1)
+            metricas.concluir()
+
+    threads = [threading.Thread(target=registrar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = metricas.coletar()
+    assert total.requisicoes == {('GET', '/faqs', '200'): 4000}
+    assert total.iniciadas == total.concluidas == 4000
+    assert total.duracoes[('GET', '/faqs')][-1] == pytest.approx(8.0)
+
+
+def test_histograma_acumulado_e_erros():
+    metricas = Metricas(buckets_duracao=(0.01, 0.1), buckets_idas=(1,))
+    metricas.registrar('GET', '/faqs', 200, 0.005, 1)
+    metricas.registrar('GET', '/faqs', 500, 0.05, 3)
+
+    texto = metricas.exportar()
+
+    rotulos = 'metodo="GET",rota="/faqs"'
+    for linha in (
+        f'faq_api_duracao_segundos_bucket{{{rotulos},le="0.01"}} 1',
+        f'faq_api_duracao_segundos_bucket{{{rotulos},le="0.1"}} 2',
+        f'faq_api_duracao_segundos_bucket{{{rotulos},le="+Inf"}} 2',
+        f'faq_api_duracao_segundos_count{{{rotulos}}} 2',
+        f'faq_api_erros_total{{{rotulos}}} 1',
+    ):
+        assert linha in texto.splitlines()
+
+
+def test_rotulos_escapados():
+    (_, _, linha) = formatar_metrica(
+        'x', 'gauge', 'Ajuda.', [('', {'rota': 'a"b\\c\nd'}, 1.5)]
+    )
+    assert linha == 'x{rota="a\\"b\\\\c\\nd"} 1.5'
+
+
+def test_endpoint_exige_token_de_admin(cliente, autorizacao):
+    assert cliente.get('/metrics').status_code == 401
+
+    resposta = cliente.get('/metrics', headers=autorizacao)
+
+    assert resposta.status_code == 200
+    assert resposta.content_type.startswith('text/plain; version=0.0.4')
+    assert '# TYPE faq_api_requisicoes counter' in resposta.get_data(as_text=True)
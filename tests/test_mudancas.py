@@ -0,0 +1,117 @@
+"""Feed de mudanças (GET /faqs/mudancas): long-poll, SSE e limite de clientes."""
+
+import json
+import threading
+
+from conftest import campos_faq
+
+
+def _cursor_atual(cliente):
+    resposta = cliente.get('/faqs/mudancas')
+    assert resposta.status_code == 200
+    assert resposta.json['gravados'] == []
+    return resposta.json['cursor']
+
+
+def test_long_poll_sem_mudancas_responde_204(cliente):
+    cursor = _cursor_atual(cliente)
+    resposta = cliente.get(f'/faqs/mudancas?cursor={cursor}&espera=0.05')
+    assert resposta.status_code == 204
+
+
+def test_long_poll_entrega_gravados_e_removidos(cliente, autorizacao):
+    cursor = _cursor_atual(cliente)
+    id = cliente.post('/faqs', json=campos_faq(), headers=autorizacao).json['id']
+    removido = cliente.post('/faqs', json=campos_faq(), headers=autorizacao).json['id']
+    cliente.delete(f'/faqs/{removido}', headers=autorizacao)
+
+    lote = cliente.get(f'/faqs/mudancas?cursor={cursor}&espera=0').json
+
+    assert [faq['id'] for faq in lote['gravados']] == [id]
+    assert lote['removidos'] == [removido]
+    assert lote['recarregar'] is False
+    resposta = cliente.get(f'/faqs/mudancas?cursor={lote["cursor"]}&espera=0')
+    assert resposta.status_code == 204
+
+
+def test_long_poll_acorda_com_uma_escrita(api, cliente, autorizacao):
+    cursor = _cursor_atual(cliente)
+    campos = campos_faq()
+    escrita = threading.Timer(
+        0.1,
+        lambda: api.app.test_client().post('/faqs', json=campos, headers=autorizacao),
+    )
+    escrita.start()
+    try:
+        resposta = cliente.get(f'/faqs/mudancas?cursor={cursor}&espera=2')
+    finally:
+        escrita.join()
+
+    assert resposta.status_code == 200
+    assert [faq['pergunta'] for faq in resposta.json['gravados']] == [
+        campos['pergunta']
+    ]
+
+
+def test_lote_e_renomear_entram_linha_a_linha(cliente, autorizacao):
+    categoria = campos_faq()['categoria']
+    cursor = _cursor_atual(cliente)
+    resposta = cliente.post(
+        '/faqs/lote',
+        json=[campos_faq(categoria=categoria) for _ in range(2)],
+        headers=autorizacao,
+    )
+    assert resposta.json['inseridos'] == 2
+    cliente.put(
+        f'/categorias/{categoria}',
+        json={'categoria': categoria + '_R'},
+        headers=autorizacao,
+    )
+
+    lote = cliente.get(f'/faqs/mudancas?cursor={cursor}&espera=0').json
+
+    assert lote['recarregar'] is False
+    assert [faq['categoria'] for faq in lote['gravados']] == [categoria + '_R'] * 2
+
+
+def test_cursor_desconhecido_pede_recarregar(cliente):
+    resposta = cliente.get('/faqs/mudancas?cursor=outro-1&espera=0')
+    assert resposta.status_code == 200
+    assert resposta.json['recarregar'] is True
+
+
+def test_sse_envia_o_cursor_e_os_eventos(api, cliente, autorizacao):
+    resposta = cliente.get(
+        '/faqs/mudancas', headers={'Accept': 'text/event-stream'}, buffered=False
+    )
+    assert resposta.status_code == 200
+    assert resposta.mimetype == 'text/event-stream'
+    fluxo = resposta.response
+    try:
+        inicio = next(fluxo).decode()
+        assert inicio.startswith('retry: 3000\nid: ')
+
+        campos = campos_faq()
+        cliente.post('/faqs', json=campos, headers=autorizacao)
+        evento = next(fluxo).decode()
+        while evento.startswith(': keepalive'):
+            evento = next(fluxo).decode()
+    finally:
+        resposta.close()
+
+    linhas = dict(linha.split(': ', 1) for linha in evento.strip().split('\n'))
+    assert linhas['event'] == 'mudancas'
+    dados = json.loads(linhas['data'])
+    assert linhas['id'] == dados['cursor']
+    assert [faq['pergunta'] for faq in dados['gravados']] == [campos['pergunta']]
+    assert api.registro_mudancas.estatisticas()['clientes'] == 0
+
+
+def test_limite_de_clientes_responde_503(api, cliente, monkeypatch):
+    cursor = _cursor_atual(cliente)
+    monkeypatch.setattr(api.registro_mudancas, 'max_clientes', 0)
+
+    resposta = cliente.get(f'/faqs/mudancas?cursor={cursor}&espera=0')
+
+    assert resposta.status_code == 503
+    assert resposta.headers['Retry-After'] == '2'
@@ -0,0 +1,53 @@
+"""Status e remoção em lote por ids e renomeação de categoria."""
+
+from conftest import campos_faq
+
+
+def _criar(cliente, autorizacao, quantidade, **campos):
+    return [
+        cliente.post('/faqs', json=campos_faq(**campos), headers=autorizacao).json['id']
+        for _ in range(quantidade)
+    ]
+
+
+def test_status_e_remocao_em_lote(api, cliente, autorizacao):
+    ids = _criar(cliente, autorizacao, 3)
+    inexistente = max(ids) + 1000
+
+    resposta = cliente.patch(
+        '/faqs/lote/status',
+        json={'ids': ids + [inexistente], 'ativo': 0},
+        headers=autorizacao,
+    )
+    assert resposta.json == {'afetados': 3, 'nao_encontrados': [inexistente]}
+    assert {faq.ativo for faq in api.db.listar_por_ids(ids)} == {0}
+
+    resposta = cliente.delete('/faqs/lote', json={'ids': ids}, headers=autorizacao)
+    assert resposta.json == {'afetados': 3, 'nao_encontrados': []}
+    assert api.db.listar_por_ids(ids) == []
+
+
+def test_lote_de_ids_invalido(cliente, autorizacao):
+    for corpo in ({'ids': []}, {'ids': ['1']}, {'ids': [True]}, {}):
+        resposta = cliente.delete('/faqs/lote', json=corpo, headers=autorizacao)
+        assert resposta.status_code == 400, corpo
+
+
+def test_renomear_categoria(api, cliente, autorizacao):
+    categoria = campos_faq()['categoria']
+    _criar(cliente, autorizacao, 2, categoria=categoria)
+    nova = categoria + '_NOVA'
+
+    resposta = cliente.put(
+        f'/categorias/{categoria.lower()}',
+        json={'categoria': nova},
+        headers=autorizacao,
+    )
+
+    assert resposta.json == {'afetados': 2}
+    assert len(api.db.listar(categoria=nova)) == 2
+    assert api.db.listar(categoria=categoria) == []
+    resposta = cliente.put(
+        f'/categorias/{categoria}', json={'categoria': nova}, headers=autorizacao
+    )
+    assert resposta.status_code == 404
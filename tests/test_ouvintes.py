@@ -0,0 +1,73 @@
+"""Ids entregues aos ouvintes do FaqDB (ao_alterar) pelas escritas em massa."""
+
+import pytest
+from banco import EVENTO_GRAVADOS, EVENTO_REMOVIDOS
+from conftest import campos_faq
+from mudancas import RegistroMudancas
+
+
+@pytest.fixture
+def eventos(faqdb):
+    eventos = []
+    faqdb.ao_alterar(lambda tipo, ids: eventos.append((tipo, sorted(ids))))
+    return eventos
+
+
+def _linha(campos, usuario=1):
+    return (
+        campos['pergunta'],
+        campos['resposta'],
+        campos['ativo'],
+        campos['categoria'],
+        usuario,
+    )
+
+
+def _inserir(faqdb, quantidade, **campos):
+    resultados = faqdb.adicionar_lote(
+        [_linha(campos_faq(**campos)) for _ in range(quantidade)]
+    )
+    return sorted(r['id'] for r in resultados)
+
+
+def test_lote_e_merge_entregam_os_ids_gravados(faqdb, eventos):
+    ids = _inserir(faqdb, 3)
+    assert eventos[-1] == (EVENTO_GRAVADOS, ids)
+
+    existente = faqdb.buscar_por_id(ids[0])
+    novo = campos_faq()
+    resultado = faqdb.mesclar_lote(
+        [
+            (existente.pergunta, 'Resposta nova.', 1, existente.categoria),
+            _linha(novo)[:4],
+        ],
+        1,
+    )
+    assert eventos[-1] == (EVENTO_GRAVADOS, sorted(resultado['ids']))
+    assert ids[0] in resultado['ids'] and len(resultado['ids']) == 2
+
+
+def test_status_renomear_e_remover_entregam_os_ids(faqdb, eventos):
+    categoria = campos_faq()['categoria']
+    ids = _inserir(faqdb, 3, categoria=categoria)
+
+    faqdb.atualizar_status_lote(ids[:2], 0, 1)
+    assert eventos[-1] == (EVENTO_GRAVADOS, ids[:2])
+
+    assert faqdb.renomear_categoria(categoria, categoria + '_R', 1) == 3
+    assert eventos[-1] == (EVENTO_GRAVADOS, ids)
+
+    faqdb.deletar_lote(ids)
+    assert eventos[-1] == (EVENTO_REMOVIDOS, ids)
+
+
+def test_feed_reaproveita_o_lote_do_mesmo_cursor(faqdb):
+    registro = RegistroMudancas()
+    registro.acompanhar(faqdb)
+    _, cursor = registro.ler()
+    _inserir(faqdb, 2)
+
+    texto, proximo = registro.ler(cursor)
+
+    assert registro.ler(cursor) == (texto, proximo)
+    assert registro.ler(cursor)[0] is texto
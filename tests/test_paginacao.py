@@ -0,0 +1,43 @@
+"""Paginação por cursor (keyset) de GET /faqs."""
+
+from conftest import campos_faq
+
+
+def test_cursor_percorre_todos_os_faqs_sem_repetir(api, cliente):
+    ids = []
+    caminho = '/faqs?limit=7'
+    while caminho:
+        resposta = cliente.get(caminho)
+        assert resposta.status_code == 200
+        ids += [faq['id'] for faq in resposta.json['items']]
+        cursor = resposta.json['next_cursor']
+        caminho = f'/faqs?limit=7&after={cursor}' if cursor else None
+
+    assert ids == sorted(ids, reverse=True)
+    assert len(ids) == len(set(ids)) == api.db.contar()
+
+
+def test_cursor_com_filtro_de_categoria(cliente, autorizacao):
+    categoria = campos_faq()['categoria']
+    criados = [
+        cliente.post(
+            '/faqs', json=campos_faq(categoria=categoria), headers=autorizacao
+        ).json['id']
+        for _ in range(3)
+    ]
+
+    primeira = cliente.get(f'/faqs?limit=2&categoria={categoria}').json
+    segunda = cliente.get(
+        f'/faqs?limit=2&categoria={categoria}&after={primeira["next_cursor"]}'
+    ).json
+
+    ids = [faq['id'] for faq in primeira['items'] + segunda['items']]
+    assert ids == sorted(criados, reverse=True)
+    assert segunda['next_cursor'] is None
+
+
+def test_cursor_aceita_id_numerico_e_recusa_invalido(api, cliente):
+    (maior,) = api.db.listar(limit=1)
+    resposta = cliente.get(f'/faqs?limit=1&after={maior.id}')
+    assert resposta.json['items'][0]['id'] < maior.id
+    assert cliente.get('/faqs?limit=5&after=!!').status_code == 400
@@ -0,0 +1,58 @@
+"""Perfil das requisições: escolha pelo cabeçalho e limite dos arquivos .prof."""
+
+import os
+
+import pytest
+from perfil import PerfilRequisicoes
+
+
+def _salvar(perfis, quantidade):
+    nomes = []
+    for i in range(quantidade):
+        perfil = perfis.iniciar()
+        sum(range(1000))
+        perfis.parar(perfil)
+        nomes.append(perfis.salvar(perfil, 'GET', '/faqs/<int:faq_id>', i / 1000))
+    return nomes
+
+
+def test_cabecalho_so_vale_com_admin_autorizado():
+    perfis = PerfilRequisicoes('nao-usado')
+    cabecalhos = {'X-Perfil': '1'}
+
+    assert not perfis.selecionar(cabecalhos)
+    assert perfis.selecionar(cabecalhos, autorizado=True)
+    assert not perfis.selecionar({}, autorizado=True)
+    assert PerfilRequisicoes('nao-usado', amostragem=1.0).selecionar({})
+
+
+def test_um_cprofile_por_vez():
+    perfis = PerfilRequisicoes('nao-usado')
+    perfil = perfis.iniciar()
+
+    assert perfis.iniciar() is None
+    perfis.parar(perfil)
+    perfis.parar(perfis.iniciar())
+
+
+def test_mantem_so_os_arquivos_mais_recentes(tmp_path):
+    (tmp_path / 'notas.txt').write_text('não é um perfil')
+    perfis = PerfilRequisicoes(str(tmp_path), max_arquivos=3)
+
+    nomes = _salvar(perfis, 5)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(nomes[-3:] + ['notas.txt'])
+    assert all('GET_faqs_int_faq_id' in nome for nome in nomes)
+
+
+@pytest.mark.parametrize('arquivos_mantidos', [1, 2])
+def test_limita_o_tamanho_total(tmp_path, arquivos_mantidos):
+    perfis = PerfilRequisicoes(str(tmp_path))
+    (nome,) = _salvar(perfis, 1)
+    tamanho = os.path.getsize(tmp_path / nome)
+    # Folga de meio arquivo: perfis do mesmo código variam pouco de tamanho
+    perfis.max_bytes = int(tamanho * (arquivos_mantidos + 0.5))
+
+    nomes = _salvar(perfis, 4)
+
+    assert sorted(os.listdir(tmp_path)) == nomes[-arquivos_mantidos:]
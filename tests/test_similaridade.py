@@ -0,0 +1,106 @@
+"""Perguntas parecidas: DetectorDuplicatas e a verificação antes de inserir."""
+
+import builtins
+
+import pytest
+from conftest import campos_faq
+from models import FAQ
+from similaridade import DetectorDuplicatas, verificar_pergunta
+
+PERGUNTAS = [
+    'Como altero minha senha?',
+    'Como cancelo meu pedido?',
+    'Qual o prazo de entrega?',
+    'Como troco o email do cadastro?',
+]
+
+
+def _faq(id, pergunta):
+    return FAQ(id, pergunta, 'Resposta.', 1, None, 'CONTA')
+
+
+@pytest.fixture
+def detector():
+    detector = DetectorDuplicatas()
+    detector.carregar(_faq(i, p) for i, p in enumerate(PERGUNTAS, 1))
+    return detector
+
+
+def test_mais_parecida_primeiro(detector):
+    similares = detector.similares('Como alterar a minha senha', k=2)
+
+    assert [faq.id for faq, _ in similares] == [1, 2]
+    assert similares[0][1] > similares[1][1]
+    assert detector.similares('Como altero minha senha?')[0][1] == pytest.approx(1)
+
+
+def test_escritas_incrementais_iguais_a_recarga(detector):
+    detector.adicionar(_faq(2, 'Como devolvo um produto?'))
+    detector.adicionar(_faq(5, 'Esqueci a senha, e agora?'))
+    detector.remover(3)
+
+    recarregado = DetectorDuplicatas()
+    recarregado.carregar(
+        [
+            _faq(1, PERGUNTAS[0]),
+            _faq(2, 'Como devolvo um produto?'),
+            _faq(4, PERGUNTAS[3]),
+            _faq(5, 'Esqueci a senha, e agora?'),
+        ]
+    )
+    for pergunta in ('senha', 'devolver produto', 'email', 'prazo de entrega'):
+        esperado = {f.id: s for f, s in recarregado.similares(pergunta, k=4)}
+        obtido = {f.id: s for f, s in detector.similares(pergunta, k=4)}
+        assert obtido == pytest.approx(esperado), pergunta
+
+
+def test_escrita_nao_altera_o_instantaneo_em_uso(detector):
+    with detector._lock:
+        faqs, matriz, _, _ = detector._instantaneo_atual()
+    antes = matriz.copy()
+
+    detector.adicionar(_faq(1, 'Pergunta completamente diferente?'))
+
+    assert (matriz == antes).all()
+    assert faqs[0].pergunta == PERGUNTAS[0]
+
+
+def test_verificar_pergunta_com_limite_de_recusa(detector):
+    similares, recusar = verificar_pergunta(detector, 'Como altero minha senha', 3, 0.5)
+    assert [faq.id for faq, _ in similares] == [1]
+    assert not recusar
+
+    _, recusar = verificar_pergunta(detector, 'Como altero minha senha', 3, 0.5, 0.9)
+    assert recusar
+    # Recusa mesmo abaixo do limiar de relato
+    similares, recusar = verificar_pergunta(
+        detector, 'Como altero a senha', 3, 0.99, 0.3
+    )
+    assert similares == [] and recusar
+
+
+def test_post_recusa_acima_do_limite(api, cliente, autorizacao):
+    campos = campos_faq(pergunta='Como faço para mudar o meu apelido no aplicativo?')
+    assert cliente.post('/faqs', json=campos, headers=autorizacao).status_code == 201
+
+    parecida = campos_faq(pergunta='Como faço para mudar meu apelido no aplicativo?')
+    resposta = cliente.post(
+        '/faqs?rejeitar_acima=0.8', json=parecida, headers=autorizacao
+    )
+
+    assert resposta.status_code == 409
+    assert resposta.json['similares'][0]['pergunta'] == campos['pergunta']
+    assert api.db.listar(categoria=parecida['categoria']) == []
+
+
+def test_menu_recusa_acima_do_limite(faqdb, monkeypatch):
+    monkeypatch.setenv('SIMILARIDADE_REJEITAR_ACIMA', '0.8')
+    faqdb.adicionar('Posso parcelar a mensalidade no boleto?', 'Sim.', 1, 'CONTA', 1)
+    pergunta = 'Posso parcelar minha mensalidade no boleto?'
+    entradas = iter(['1', pergunta, 'Resposta.', '1', 'CONTA', '1', '0'])
+    monkeypatch.setattr(builtins, 'input', lambda *_: next(entradas))
+    total = faqdb.contar()
+
+    faqdb.menu_crud()
+
+    assert faqdb.contar() == total
@@ -0,0 +1,63 @@
+"""Autocompletar por prefixo: IndiceSugestoes (base ordenada e delta)."""
+
+import pytest
+from models import FAQ
+from sugestoes import BYTES_ENTRADA_DELTA, IndiceSugestoes
+
+FAQS = [
+    FAQ(1, 'Como altero a senha?', '...', 1, None, 'CONTA'),
+    FAQ(2, 'Senha bloqueada, o que faço?', '...', 1, None, 'CONTA'),
+    FAQ(3, 'Esqueci a senha do cartão', '...', 0, None, 'PAGAMENTO'),
+    FAQ(4, 'Qual o prazo de entrega?', '...', 1, None, 'ENTREGA'),
+]
+
+
+def _ids(indice, prefixo, limite=10):
+    return [faq.id for faq in indice.sugerir(prefixo, limite)['faqs']]
+
+
+@pytest.fixture
+def indice():
+    indice = IndiceSugestoes()
+    indice.carregar(FAQS)
+    return indice
+
+
+def test_inicio_da_pergunta_antes_de_palavra_e_sem_inativos(indice):
+    # FAQ 2 começa com "senha"; o 1 só tem a palavra; o 3 está inativo
+    assert _ids(indice, 'SEN') == [2, 1]
+    assert _ids(indice, 'sen', limite=1) == [2]
+    assert _ids(indice, '  ') == []
+
+
+def test_categorias_por_prefixo(indice):
+    assert indice.sugerir('con')['categorias'] == ['CONTA']
+    assert indice.sugerir('p')['categorias'] == ['PAGAMENTO']
+
+
+@pytest.mark.parametrize('limite_delta', [1024, 1])
+def test_alteracoes_pelo_delta_e_pela_reconstrucao(limite_delta):
+    indice = IndiceSugestoes(limite_delta)
+    indice.carregar(FAQS)
+
+    indice.adicionar(FAQ(1, 'Como troco o email?', '...', 1, None, 'CONTA'))
+    indice.adicionar(
+        FAQ(5, 'Senhas fortes são obrigatórias?', '...', 1, None, 'SEGURANCA')
+    )
+    indice.remover(2)
+
+    assert _ids(indice, 'senha') == [5]
+    assert _ids(indice, 'email') == [1]
+    assert indice.sugerir('seg')['categorias'] == ['SEGURANCA']
+    pendentes = indice.estatisticas()['alteracoes_pendentes']
+    assert (pendentes == 0) == (limite_delta == 1)
+
+
+def test_estatisticas_contam_as_entradas_do_delta(indice):
+    antes = indice.estatisticas()
+
+    indice.adicionar(FAQ(6, 'Ajuda', '...', 1, None, 'CONTA'))
+
+    depois = indice.estatisticas()
+    assert depois['entradas'] == antes['entradas'] + 1
+    assert depois['bytes'] - antes['bytes'] > BYTES_ENTRADA_DELTA